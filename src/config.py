@@ -84,6 +84,15 @@ def build_czech_location_query():
 DEFAULT_LOCATION = "location:prague"  # Single city (most focused)
 # DEFAULT_LOCATION = "location:czechia OR location:czech OR location:praha OR location:brno OR location:ostrava"  # Major cities
 
+# ========== SEARCH PARTITIONING ==========
+# GitHub search returns at most 1,000 results per query. With partitioning
+# enabled, the query is split by account creation date (and follower ranges
+# when a single day is still too big) until every partition fits the cap.
+# MAX_PAGES is ignored in that mode - every partition is fetched completely.
+SEARCH_PARTITION = False
+SEARCH_RESULT_LIMIT = 1000  # GitHub Search API hard cap per query
+SEARCH_CREATED_START = "2007-10-01"  # Earliest GitHub account creation date
+
 # ========== PHASE 1: BULK FETCH CONFIGURATION ==========
 # Number of pages to fetch (each page has USERS_PER_PAGE users)
 # Recommended: 2 for testing, 20 for medium, 100+ for production
@@ -142,15 +151,71 @@ MIN_CONTRIBUTIONS_REQUIRED = 1  # Set to 0 to include everyone
 # This is a red flag for talent sourcing - inactive developers are less likely to be hireable
 MIN_TREND_SCORE_REQUIRED = 0.1  # Set to 0 to include everyone (even inactive users)
 
+# Ranking engine (both give identical scores and order)
+# "python" = per-user reference implementation (src/processing/rank_users.py)
+# "numpy"  = columnar engine for large populations (src/processing/rank_vectorized.py)
+RANKING_ENGINE = "python"
+
+# Parallel ranking with the "python" engine (src/processing/rank_parallel.py)
+# 1 = serial; more = worker processes scoring shards of RANKING_SHARD_SIZE users
+RANKING_WORKERS = 1
+RANKING_SHARD_SIZE = 5000
+
+# Persistent leaderboard merged after every Phase 2 (src/processing/ranked_index.py)
+# None = disabled; e.g. "data/ranked_index.json" to keep a national ranking across runs
+RANKED_INDEX_FILE = None
+
 # ========== API RATE LIMITING ==========
-# Delay between page requests (seconds)
-# Recommended: 5-10 for contributionsCollection queries
-# Higher delay = more stable but slower
-API_DELAY = 10
+# Requests are paced by a central scheduler (src/data_collection/rate_limiter.py)
+# that tracks the remaining budget and reset time from every response
+# (GraphQL rateLimit block and X-RateLimit-* headers) instead of fixed sleeps.
+# GraphQL: 5,000 points/hour, REST: 5,000 requests/hour (authenticated)
+
+# Requests go out at full speed until fewer than this many points/requests
+# remain; below it, the rest of the budget is spread evenly until the reset
+RATE_LIMIT_PACE_BELOW = 1000
+
+# Below this many remaining points/requests, wait for the reset entirely
+# (keeps a small reserve for manual use of the same token)
+RATE_LIMIT_MIN_REMAINING = 100
+
+# ========== CONCURRENT FETCH ==========
+# Whether Phase 1 batch fetching keeps several GraphQL requests in flight
+# FALSE = one batch at a time (default, most conservative)
+# TRUE = asyncio-based fetch with FETCH_CONCURRENCY batches in parallel
+ASYNC_FETCH = False
+
+# Maximum number of batch requests in flight when ASYNC_FETCH is enabled
+# Recommended: 2-6 (GitHub discourages heavy concurrent usage per token)
+FETCH_CONCURRENCY = 4
+
+# Concurrent README requests in Phase 3 (1 = one at a time)
+# Recommended: 2-8, at most HTTP_POOL_SIZE (REST pacing is shared via the scheduler)
+README_WORKERS = 4
+
+# How Phase 3 fetches READMEs
+# "graphql" = batched GraphQL blob lookups (README_FILENAMES variants), REST
+#             /readme only for repos none of the variants resolves
+# "rest"    = one REST request per repository
+README_FETCH_MODE = "graphql"
+README_GRAPHQL_BATCH_SIZE = 20  # Repositories per GraphQL README query
+MAX_README_BYTES = 100_000  # READMEs are cut after this many bytes (UTF-8)
+README_FILENAMES = [
+    "README.md",
+    "readme.md",
+    "Readme.md",
+    "README",
+    "README.rst",
+    "README.markdown",
+    "README.txt",
+]
 
-# Delay between README requests (seconds)
-# Recommended: 0.5-1.0
-README_DELAY = 1.0
+# Phase 3 budget: users are processed in ranking order and the run stops
+# cleanly (keeping every user finished so far) once a budget is used up
+README_TIME_BUDGET = None  # Seconds (None = no limit)
+README_REQUEST_BUDGET = None  # API requests (None = no limit)
+# TRUE = skip READMEs of repos with no stars and no description
+README_SKIP_LOW_VALUE = False
 
 # ========== RETRY LOGIC ==========
 # Maximum number of retry attempts for failed requests
@@ -165,7 +230,16 @@ RETRY_BASE_DELAY = 5
 # Example: attempt 1 = 5s, attempt 2 = 7s, attempt 3 = 9s
 RETRY_BACKOFF_INCREMENT = 2
 
+# How failed Phase 1 batches are retried
+# "bisect" = split failing batches in half until the bad logins are isolated
+#            (bad logins are quarantined with their error messages)
+# "flat"   = refetch all failed logins with a fixed reduced batch size
+RETRY_STRATEGY = "bisect"
+
 # ========== OUTPUT CONFIGURATION ==========
+# Base data directory (raw runs, caches and persisted state live here)
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
 # Create timestamped folders for each run
 # True: data/raw/YYYYMMDD_HHMMSS/
 # False: data/raw/
@@ -176,11 +250,59 @@ OUTPUT_PHASE1_FILE = "phase1_all_users.json"
 OUTPUT_PHASE2_PREFIX = "phase2_ranked_top_"
 OUTPUT_PHASE3_PREFIX = "phase2_top_"
 OUTPUT_PHASE3_SUFFIX = "_with_readmes.json"
+OUTPUT_QUARANTINE_FILE = "phase1_quarantine.json"  # Logins that could not be fetched
 
 # JSON formatting
 JSON_INDENT = 2
 JSON_ENSURE_ASCII = False
 
+# Content-addressed README store (src/data_collection/readme_store.py)
+# TRUE = READMEs are saved once as blobs under README_STORE_DIR and phase3
+#        files only keep a "readme_ref" per repository - the web app and any
+#        copied run folder then need README_STORE_DIR as well (make a
+#        self-contained copy with: python -m src.data_collection.readme_store --inline <file>)
+# FALSE = full README text inline in every phase3 file (self-contained, default)
+README_STORE_ENABLED = False
+README_STORE_DIR = os.path.join(DATA_DIR, "readmes")
+
+# README normalization (src/processing/readme_normalize.py)
+# Phase 3 stores a cleaned prose version of every README as "readme_clean"
+# (no badges, HTML, images, code blocks or table markup); embeddings and LLM
+# prompts use it instead of the raw text
+NORMALIZE_READMES = True
+# TRUE = also store the raw README next to the cleaned one (both inline
+#        unless README_STORE_ENABLED, so phase3 files roughly double)
+# FALSE = store only the cleaned text (smaller files, default)
+KEEP_RAW_README = False
+
+# ========== RESPONSE CACHE ==========
+# On-disk cache of GitHub API responses (src/data_collection/response_cache.py)
+# "off"    = always call the API (default)
+# "on"     = reuse cached responses younger than their TTL, store new ones
+# "replay" = strict offline mode: only cached responses, fail on a miss
+# User batches are cached per login, so a replay works with any batch size
+# (adaptive sizing is off during replay) and on any later day
+RESPONSE_CACHE_MODE = "off"
+
+# Where cached responses are stored
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
+# Time-to-live per endpoint (seconds)
+RESPONSE_CACHE_TTL = {
+    "search": 6 * 3600,  # Search pages/counts - new users show up over the day
+    "users": 24 * 3600,  # Users from batches (profiles, repos, calendars), per login
+    "readme": 7 * 24 * 3600,  # READMEs rarely change
+    "default": 24 * 3600,  # Any other GraphQL query
+}
+
+# Conditional REST README requests: keep ETag/Last-Modified per repo (plus a
+# reference to the README in README_STORE_DIR) and send If-None-Match on the
+# next fetch; 304 responses reuse the stored README and don't count against
+# the rate limit. Only the REST path is conditional - with
+# README_FETCH_MODE = "graphql" this covers just the REST fallback requests
+README_CONDITIONAL_REQUESTS = True
+README_ETAG_FILE = os.path.join(DATA_DIR, "readme_etags.json")
+
 # ========== GITHUB API CONFIGURATION ==========
 # GitHub API endpoints
 GRAPHQL_URL = "https://api.github.com/graphql"
@@ -189,6 +311,12 @@ REST_API_BASE = "https://api.github.com"
 # Request timeout (seconds)
 REQUEST_TIMEOUT = 10
 
+# Shared keep-alive HTTP session (see src/data_collection/github_client.py)
+# HTTP_POOL_SIZE = connections kept open per host; should be at least
+# FETCH_CONCURRENCY so concurrent fetches never wait for a connection
+HTTP_POOL_CONNECTIONS = 4  # Number of hosts to keep pools for
+HTTP_POOL_SIZE = 10  # Keep-alive connections per host
+
 # ========== DISPLAY CONFIGURATION ==========
 # Number of top users to display in ranking output
 DISPLAY_TOP_N = 50 if TOP_N_USERS > 50 else TOP_N_USERS
@@ -218,7 +346,9 @@ EXCLUDE_FORKS = True  # Only count repositories the user actually created
 # Pass 2: Fetch expensive fields (contributions) for top users only
 
 # Whether to fetch expensive fields during initial search
-# FALSE = Two-pass approach (recommended, avoids complexity limits)
+# FALSE = Two-pass approach (recommended, avoids complexity limits):
+#         profiles + yearly contribution totals in REPOSITORIES_BATCH_SIZE
+#         batches, then calendars only for users passing the pre-filter below
 # TRUE = Single-pass (may hit RESOURCE_LIMITS_EXCEEDED on large queries)
 FETCH_CONTRIBUTIONS_IN_SEARCH = False  # Expensive! ~200 points per user
 FETCH_REPOSITORIES_IN_SEARCH = (
@@ -244,6 +374,27 @@ REPOSITORIES_BATCH_SIZE = (
     25  # Users per batch when fetching repositories (less complex)
 )
 
+# Pre-filter applied between the two passes (profile fields only)
+# Users below these thresholds or below MIN_CONTRIBUTIONS_REQUIRED
+# (yearly total) never get their contribution calendar fetched
+PREFILTER_MIN_FOLLOWERS = 0  # Set >0 to skip calendars of users with few followers
+PREFILTER_MIN_REPOS = 0  # Set >0 to skip calendars of users with few public repos
+
+# Adaptive batch sizing (additive-increase / multiplicative-decrease)
+# Instead of a fixed OPTIMAL_BATCH_SIZE, grow the batch by ADAPTIVE_BATCH_INCREASE
+# after every successful batch and multiply it by ADAPTIVE_BATCH_DECREASE right
+# after a "Resource limits" / complexity error. OPTIMAL_BATCH_SIZE is only the
+# starting point until a run has saved its converged size.
+ADAPTIVE_BATCH_SIZE = True
+ADAPTIVE_BATCH_MIN = 5  # Never go below this many users per batch
+ADAPTIVE_BATCH_MAX = 30  # 30+ users/batch had <50% success in testing
+ADAPTIVE_BATCH_INCREASE = 1  # Users added after each successful batch
+ADAPTIVE_BATCH_DECREASE = 0.5  # Factor applied after a resource-limit failure
+ADAPTIVE_PROFILE_BATCH_MAX = 100  # Upper bound for calendar-free profile batches
+
+# Where the converged batch size is stored between runs
+BATCH_SIZE_STATE_FILE = os.path.join(DATA_DIR, "batch_size_state.json")
+
 # Contribution time window (for Pass 2)
 # GitHub limits to 1 year maximum
 CONTRIBUTIONS_FROM_DAYS_AGO = 365  # Fetch last 365 days of contributions
@@ -276,8 +427,75 @@ def validate_config():
     if MAX_RETRIES < 1 or MAX_RETRIES > 10:
         errors.append(f"MAX_RETRIES must be between 1-10, got {MAX_RETRIES}")
 
-    if API_DELAY < 0:
-        errors.append(f"API_DELAY must be positive, got {API_DELAY}")
+    if RATE_LIMIT_MIN_REMAINING < 0 or RATE_LIMIT_PACE_BELOW < RATE_LIMIT_MIN_REMAINING:
+        errors.append(
+            f"Need 0 <= RATE_LIMIT_MIN_REMAINING <= RATE_LIMIT_PACE_BELOW, got {RATE_LIMIT_MIN_REMAINING} / {RATE_LIMIT_PACE_BELOW}"
+        )
+
+    if ADAPTIVE_BATCH_MIN < 1 or ADAPTIVE_BATCH_MIN > ADAPTIVE_BATCH_MAX:
+        errors.append(
+            f"ADAPTIVE_BATCH_MIN must be between 1 and ADAPTIVE_BATCH_MAX, got {ADAPTIVE_BATCH_MIN}"
+        )
+
+    if ADAPTIVE_PROFILE_BATCH_MAX < ADAPTIVE_BATCH_MIN:
+        errors.append(
+            f"ADAPTIVE_PROFILE_BATCH_MAX must be at least ADAPTIVE_BATCH_MIN, got {ADAPTIVE_PROFILE_BATCH_MAX}"
+        )
+
+    if not 0 < ADAPTIVE_BATCH_DECREASE < 1:
+        errors.append(
+            f"ADAPTIVE_BATCH_DECREASE must be between 0-1, got {ADAPTIVE_BATCH_DECREASE}"
+        )
+
+    if RANKING_ENGINE not in ("python", "numpy"):
+        errors.append(
+            f"RANKING_ENGINE must be 'python' or 'numpy', got {RANKING_ENGINE}"
+        )
+
+    if RANKING_WORKERS < 1:
+        errors.append(f"RANKING_WORKERS must be at least 1, got {RANKING_WORKERS}")
+
+    if RANKING_SHARD_SIZE < 1:
+        errors.append(
+            f"RANKING_SHARD_SIZE must be at least 1, got {RANKING_SHARD_SIZE}"
+        )
+
+    if README_FETCH_MODE not in ("graphql", "rest"):
+        errors.append(
+            f"README_FETCH_MODE must be 'graphql' or 'rest', got {README_FETCH_MODE}"
+        )
+
+    if MAX_README_BYTES < 1:
+        errors.append(f"MAX_README_BYTES must be at least 1, got {MAX_README_BYTES}")
+
+    if README_WORKERS < 1:
+        errors.append(f"README_WORKERS must be at least 1, got {README_WORKERS}")
+
+    if README_TIME_BUDGET is not None and README_TIME_BUDGET <= 0:
+        errors.append(
+            f"README_TIME_BUDGET must be positive or None, got {README_TIME_BUDGET}"
+        )
+
+    if README_REQUEST_BUDGET is not None and README_REQUEST_BUDGET < 1:
+        errors.append(
+            f"README_REQUEST_BUDGET must be at least 1 or None, got {README_REQUEST_BUDGET}"
+        )
+
+    if HTTP_POOL_SIZE < 1:
+        errors.append(f"HTTP_POOL_SIZE must be at least 1, got {HTTP_POOL_SIZE}")
+
+    if RESPONSE_CACHE_MODE not in ("off", "on", "replay"):
+        errors.append(
+            f"RESPONSE_CACHE_MODE must be 'off', 'on' or 'replay', got {RESPONSE_CACHE_MODE}"
+        )
+
+    if RETRY_STRATEGY not in ("bisect", "flat"):
+        errors.append(
+            f"RETRY_STRATEGY must be 'bisect' or 'flat', got {RETRY_STRATEGY}"
+        )
+
+    if FETCH_CONCURRENCY < 1:
+        errors.append(f"FETCH_CONCURRENCY must be at least 1, got {FETCH_CONCURRENCY}")
 
     if errors:
         raise ValueError(
@@ -320,6 +538,7 @@ def print_config_summary():
     print("\n🔍 Search Configuration:")
     print(f"  • Default location: {DEFAULT_LOCATION}")
     print(f"  • Czech keywords: {len(CZECH_KEYWORDS)} locations")
+    print(f"  • Partitioned search: {SEARCH_PARTITION} (cap {SEARCH_RESULT_LIMIT})")
 
     # Phase 1: Fetch
     print("\n�📥 Phase 1 (Fetch):")
@@ -332,6 +551,11 @@ def print_config_summary():
     # Phase 2: Ranking
     print("\n🎯 Phase 2 (Ranking):")
     print(f"  • Top N users for enrichment: {TOP_N_USERS}")
+    print(f"  • Ranking engine: {RANKING_ENGINE}")
+    print(
+        f"  • Ranking workers: {RANKING_WORKERS} ({RANKING_SHARD_SIZE} users per shard)"
+    )
+    print(f"  • Ranked index: {RANKED_INDEX_FILE or 'disabled'}")
     print(f"  • Scoring weights:")
     for metric, weight in SCORING_WEIGHTS.items():
         print(f"    - {metric}: {weight:.2%}")
@@ -344,11 +568,17 @@ def print_config_summary():
     print(f"  • GraphQL URL: {GRAPHQL_URL}")
     print(f"  • REST API Base: {REST_API_BASE}")
     print(f"  • Request timeout: {REQUEST_TIMEOUT}s")
+    print(f"  • HTTP pool size: {HTTP_POOL_SIZE} connections")
 
     # Rate Limiting
     print("\n⏱️  Rate Limiting:")
-    print(f"  • API delay (pages): {API_DELAY}s")
-    print(f"  • README delay: {README_DELAY}s")
+    print(f"  • Pace requests below: {RATE_LIMIT_PACE_BELOW} remaining")
+    print(f"  • Async fetch: {ASYNC_FETCH} (concurrency: {FETCH_CONCURRENCY})")
+    print(f"  • README workers: {README_WORKERS} (mode: {README_FETCH_MODE})")
+    print(
+        f"  • README budget: {README_TIME_BUDGET or 'no'} s, {README_REQUEST_BUDGET or 'no'} requests (skip low-value: {README_SKIP_LOW_VALUE})"
+    )
+    print(f"  • Wait for reset below: {RATE_LIMIT_MIN_REMAINING} remaining")
     print(f"  • Max retries: {MAX_RETRIES}")
     print(f"  • Retry base delay: {RETRY_BASE_DELAY}s")
     print(f"  • Retry backoff increment: {RETRY_BACKOFF_INCREMENT}s")
@@ -356,6 +586,7 @@ def print_config_summary():
         RETRY_BASE_DELAY + (i * RETRY_BACKOFF_INCREMENT) for i in range(MAX_RETRIES)
     ]
     print(f"  • Retry pattern: {' → '.join(f'{d}s' for d in retry_delays)}")
+    print(f"  • Failed batch retry strategy: {RETRY_STRATEGY}")
 
     # Output Configuration
     print("\n📁 Output Configuration:")
@@ -365,6 +596,9 @@ def print_config_summary():
     print(f"  • Phase 3 prefix: {OUTPUT_PHASE3_PREFIX}")
     print(f"  • JSON indent: {JSON_INDENT}")
     print(f"  • JSON ASCII only: {JSON_ENSURE_ASCII}")
+    print(f"  • README store: {README_STORE_ENABLED} ({README_STORE_DIR})")
+    print(f"  • Normalize READMEs: {NORMALIZE_READMES} (keep raw: {KEEP_RAW_README})")
+    print(f"  • Response cache: {RESPONSE_CACHE_MODE} ({CACHE_DIR})")
 
     # Display Configuration
     print("\n🖥️  Display Configuration:")
@@ -378,6 +612,12 @@ def print_config_summary():
     print(f"  • Fetch repositories in search: {FETCH_REPOSITORIES_IN_SEARCH}")
     print(f"  • Contributions batch size: {CONTRIBUTIONS_BATCH_SIZE}")
     print(f"  • Repositories batch size: {REPOSITORIES_BATCH_SIZE}")
+    print(
+        f"  • Adaptive batch size: {ADAPTIVE_BATCH_SIZE} ({ADAPTIVE_BATCH_MIN}-{ADAPTIVE_BATCH_MAX}, +{ADAPTIVE_BATCH_INCREASE} / ×{ADAPTIVE_BATCH_DECREASE})"
+    )
+    print(
+        f"  • Pre-filter before calendars: followers >= {PREFILTER_MIN_FOLLOWERS}, repos >= {PREFILTER_MIN_REPOS}"
+    )
     print(f"  • Contributions time window: {CONTRIBUTIONS_FROM_DAYS_AGO} days")
     print(f"  • Fetch pushedAt: {FETCH_PUSHED_AT}")
     print(f"  • Fetch updatedAt: {FETCH_UPDATED_AT}")
@@ -395,6 +635,7 @@ if __name__ == "__main__":
     print_config_summary()
     print("✅ Configuration valid!")
     print(f"\nEstimated users to fetch: {MAX_PAGES * USERS_PER_PAGE}")
+    estimated_batches = -(-MAX_PAGES * USERS_PER_PAGE // OPTIMAL_BATCH_SIZE)
     print(
-        f"Estimated time: ~{(MAX_PAGES * API_DELAY) / 60:.1f} minutes (without retries)"
+        f"Estimated requests: {MAX_PAGES} search pages + ~{estimated_batches} user batches (without retries)"
     )
@@ -0,0 +1,170 @@
+"""
+Adaptive batch sizing for GitHub GraphQL user batches.
+
+GitHub rejects large alias batches non-deterministically with "Resource
+limits" / complexity errors (see OPTIMAL_BATCH_SIZE notes in config.py).
+Instead of a hand-tuned constant, the batch size is controlled with
+additive-increase / multiplicative-decrease (AIMD):
+
+- every successful batch grows the size by ADAPTIVE_BATCH_INCREASE
+- every resource-limit failure multiplies it by ADAPTIVE_BATCH_DECREASE
+
+AIMD settles into a sawtooth just below the size GitHub starts rejecting.
+The mean of the recent successful sizes is taken as the converged size; it
+is saved to BATCH_SIZE_STATE_FILE (one entry per query kind, since a cheap
+profile batch converges much higher than a calendar batch) and used as the
+starting point of the next run.
+"""
+
+import json
+import os
+import sys
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from src import config
+
+
+def is_resource_limit_error(error_msg: str) -> bool:
+    """Return True if an error message signals a query complexity failure."""
+    return "Resource limits" in error_msg or "complexity" in error_msg.lower()
+
+
+class AdaptiveBatchSizer:
+    """AIMD controller that picks the next batch size from batch outcomes."""
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int = None,
+        max_size: int = None,
+        increase: int = None,
+        decrease: float = None,
+        state_file: Optional[str] = None,
+        kind: str = "full",
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            initial_size: Starting batch size
+            min_size: Smallest allowed size (default: config.ADAPTIVE_BATCH_MIN)
+            max_size: Largest allowed size (default: config.ADAPTIVE_BATCH_MAX)
+            increase: Additive step after a success (default: config.ADAPTIVE_BATCH_INCREASE)
+            decrease: Multiplicative factor after a failure (default: config.ADAPTIVE_BATCH_DECREASE)
+            state_file: JSON file to persist the converged size (None = don't persist)
+            kind: Batch query kind the size is tracked for ("full", "profile", "calendar")
+        """
+        self.min_size = min_size if min_size is not None else config.ADAPTIVE_BATCH_MIN
+        self.max_size = max_size if max_size is not None else config.ADAPTIVE_BATCH_MAX
+        self.increase = (
+            increase if increase is not None else config.ADAPTIVE_BATCH_INCREASE
+        )
+        self.decrease = (
+            decrease if decrease is not None else config.ADAPTIVE_BATCH_DECREASE
+        )
+        self.state_file = state_file
+        self.kind = kind
+
+        # Fractional size so repeated small decreases still add up
+        self._size = float(self._clamp(initial_size))
+        self.successes = 0
+        self.failures = 0
+        self.largest_success = 0
+        self.recent_successes = deque(maxlen=20)
+
+    def _clamp(self, size: float) -> float:
+        return max(self.min_size, min(self.max_size, size))
+
+    @property
+    def size(self) -> int:
+        """Batch size to use for the next request."""
+        return int(self._size)
+
+    def record_success(self, batch_size: int):
+        """Grow the batch size after a successful batch."""
+        self.successes += 1
+        self.largest_success = max(self.largest_success, batch_size)
+        self.recent_successes.append(batch_size)
+        self._size = self._clamp(self._size + self.increase)
+
+    def record_failure(self, error_msg: str) -> bool:
+        """
+        Shrink the batch size after a resource-limit failure.
+
+        Other failures (network, 502, ...) leave the size unchanged.
+
+        Returns:
+            True if the size was reduced
+        """
+        self.failures += 1
+        if not is_resource_limit_error(error_msg):
+            return False
+        self._size = self._clamp(self._size * self.decrease)
+        return True
+
+    @property
+    def converged_size(self) -> int:
+        """Mean of the recent successful batch sizes (current size if none)."""
+        if not self.recent_successes:
+            return self.size
+        mean = sum(self.recent_successes) / len(self.recent_successes)
+        return int(self._clamp(round(mean)))
+
+    @staticmethod
+    def _load_state(state_file: str) -> dict:
+        if not state_file or not os.path.isfile(state_file):
+            return {}
+        try:
+            with open(state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    @classmethod
+    def from_state(
+        cls, default_size: int, state_file: str = None, kind: str = "full", **kwargs
+    ):
+        """
+        Create a controller starting from the size saved by the previous run.
+
+        Args:
+            default_size: Size to start with if no saved state exists
+            state_file: State file path (default: config.BATCH_SIZE_STATE_FILE)
+            kind: Batch query kind to load the size for
+
+        Returns:
+            AdaptiveBatchSizer instance
+        """
+        if state_file is None:
+            state_file = config.BATCH_SIZE_STATE_FILE
+
+        initial_size = default_size
+        try:
+            initial_size = int(cls._load_state(state_file)[kind]["converged_size"])
+        except (KeyError, ValueError, TypeError):
+            initial_size = default_size
+
+        return cls(initial_size, state_file=state_file, kind=kind, **kwargs)
+
+    def save(self) -> Optional[str]:
+        """Persist the converged size so the next run starts from it."""
+        if not self.state_file:
+            return None
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+        state = self._load_state(self.state_file)
+        state[self.kind] = {
+            "converged_size": self.converged_size,
+            "largest_success": self.largest_success,
+            "successes": self.successes,
+            "failures": self.failures,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=config.JSON_INDENT)
+        return self.state_file
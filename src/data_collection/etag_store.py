@@ -0,0 +1,133 @@
+"""
+Validator store for conditional README requests.
+
+For every README fetched over REST, the `ETag` / `Last-Modified` response
+headers are kept in README_ETAG_FILE together with a reference to the README
+text in the content-addressed README store (see readme_store.py - the text
+itself is stored once, shared with the phase3 files). The next fetch of the
+same URL sends `If-None-Match` / `If-Modified-Since`; a `304 Not Modified`
+answer reuses the stored text. GitHub does not count 304 responses against
+the REST rate limit.
+
+Only the REST path is conditional: with README_FETCH_MODE = "graphql" (the
+default) READMEs come from batched GraphQL queries, and ETags apply just to
+the REST fallback requests.
+
+Usage:
+    from src.data_collection.etag_store import readme_etags
+
+    headers.update(readme_etags.conditional_headers(url))
+    ...
+    if response.status_code == 304:
+        content = readme_etags.content(url)
+    readme_etags.save()
+"""
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from src import config
+from src.data_collection.readme_store import readme_store
+
+
+class ETagStore:
+    """Thread-safe URL -> {etag, last_modified, ref} store, saved as JSON."""
+
+    def __init__(self, path: str = None):
+        """
+        Initialize the store (the file is read lazily on first use).
+
+        Args:
+            path: JSON file with stored validators (default: config.README_ETAG_FILE)
+        """
+        self.path = path or config.README_ETAG_FILE
+        self._lock = threading.Lock()
+        self._entries = None
+        self._dirty = False
+        self.not_modified = 0
+
+    def _load(self) -> Dict[str, Dict]:
+        # Caller holds self._lock
+        if self._entries is None:
+            self._entries = {}
+            if os.path.isfile(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError):
+                    self._entries = {}
+            # Older files kept the README text inline - move it to the store
+            for entry in self._entries.values():
+                if "content" in entry:
+                    entry["ref"] = self._put(entry.pop("content"))
+                    self._dirty = True
+        return self._entries
+
+    @staticmethod
+    def _put(content: Optional[str]) -> Optional[str]:
+        return readme_store.put(content) if content is not None else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for a stored URL."""
+        with self._lock:
+            entry = self._load().get(url)
+        if not entry:
+            return {}
+        if entry.get("ref") and not readme_store.contains(entry["ref"]):
+            return {}  # README blob deleted - fetch the full response again
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def content(self, url: str) -> Optional[str]:
+        """Return the stored content for a URL after a 304 response."""
+        with self._lock:
+            entry = self._load().get(url) or {}
+            self.not_modified += 1
+        return readme_store.get(entry.get("ref"))
+
+    def store(self, url: str, headers, content: Optional[str]):
+        """Remember the validators of a 200 response (ignored without any)."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._load()[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "ref": self._put(content),
+                "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._dirty = True
+
+    def discard(self, url: str):
+        """Forget a URL (e.g. the README was deleted)."""
+        with self._lock:
+            if self._load().pop(url, None) is not None:
+                self._dirty = True
+
+    def save(self) -> Optional[str]:
+        """Write the store to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return None
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            self._dirty = False
+        return self.path
+
+
+readme_etags = ETagStore()
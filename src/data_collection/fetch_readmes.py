@@ -3,39 +3,125 @@ Phase 3: Fetch READMEs for top-ranked users.
 
 This module handles README enrichment for selected users after ranking.
 Called from workflow.py as Phase 3 of the workflow.
+
+READMEs are fetched in two steps (README_FETCH_MODE = "graphql"):
+1. Batched GraphQL: many repositories per query, each looking up the
+   README_FILENAMES variants with `object(expression: "HEAD:<name>")`
+2. REST `/repos/{owner}/{repo}/readme` only for repos where no variant
+   resolved to a text blob (other file names, docs/ folders, binary files)
+   or the blob is larger than MAX_README_BYTES (streamed and capped there)
 """
 
-import base64
+import codecs
 import json
 import os
 import sys
 import time
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import src.config as config
+from src.data_collection import github_client
+from src.data_collection.etag_store import readme_etags
+from src.data_collection.fetch_users import run_query
+from src.data_collection.readme_store import attach_readme, get_readme, readme_store
+from src.processing.rank_users import parse_datetime
+from src.data_collection.response_cache import response_cache
+from src.processing.contribution_calendar import json_default
+from src.processing.readme_normalize import normalize_readme
+from src.processing.user_features import strip_all_features
+from src.processing.user_io import NdjsonWriter, load_users
+
+# Marker on repository nodes whose README was confirmed missing (404)
+README_STATUS_NONE = "none"
+
+
+def read_capped_text(response, max_bytes=None):
+    """
+    Stream a response body as text, stopping after `max_bytes` bytes.
+
+    Bytes that are not valid UTF-8 are replaced instead of raising, and a
+    multi-byte character cut off by the cap is dropped.
+
+    Args:
+        response: requests.Response opened with stream=True
+        max_bytes: Byte limit (default: config.MAX_README_BYTES)
+
+    Returns:
+        Decoded text
+    """
+    if max_bytes is None:
+        max_bytes = config.MAX_README_BYTES
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts = []
+    remaining = max_bytes
+    for chunk in response.iter_content(chunk_size=16384):
+        if len(chunk) >= remaining:
+            parts.append(decoder.decode(chunk[:remaining]))
+            return "".join(parts)  # Cap reached - drop any partial character
+        parts.append(decoder.decode(chunk))
+        remaining -= len(chunk)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
 
 
 def get_readme_content(owner, repo_name, verbose=False):
-    """Fetch README content using GitHub REST API."""
+    """
+    Fetch README content using GitHub REST API.
+
+    The README is requested in the raw media type and streamed, reading at
+    most config.MAX_README_BYTES (no base64 payload to decode in memory).
+
+    Found and missing (404) READMEs are kept in response_cache; in replay
+    mode a cache miss raises CacheMissError.
+
+    With README_CONDITIONAL_REQUESTS, the request carries the ETag /
+    Last-Modified of the previous fetch and a 304 reuses the stored content
+    (see etag_store; call readme_etags.save() when done).
+
+    Returns:
+        README text ("" if the repository has no README), or None if the
+        request failed and the README is unknown
+    """
     url = f"{config.REST_API_BASE}/repos/{owner}/{repo_name}/readme"
-    headers = {
-        "Authorization": f"Bearer {config.GITHUB_TOKEN}",
-        "Accept": "application/vnd.github.v3+json",  # Get JSON response
-    }
+    # Raw file content instead of base64-encoded JSON
+    headers = {"Accept": config.get_rest_headers()["Accept"]}
+
+    cached = response_cache.get("readme", url)
+    if cached is not None:
+        return cached["content"] or ""
+
+    if config.README_CONDITIONAL_REQUESTS:
+        headers.update(readme_etags.conditional_headers(url))
+
+    try:
+        response = github_client.rest_get(url, headers=headers, stream=True)
+    except Exception as e:
+        if verbose:
+            print(f"    ⚠️  {owner}/{repo_name}: {str(e)[:50]}")
+        return None
 
     try:
-        response = requests.get(url, headers=headers, timeout=config.REQUEST_TIMEOUT)
-        if response.status_code == 200:
-            data = response.json()
-            # Content is base64 encoded
-            if "content" in data and data.get("encoding") == "base64":
-                content_base64 = data["content"].replace("\n", "")
-                content_decoded = base64.b64decode(content_base64).decode("utf-8")
-                return content_decoded
-            return None
-        elif verbose and response.status_code == 404:
-            print(f"    ⚠️  No README found for {owner}/{repo_name}")
+        if response.status_code == 304:
+            # Unchanged since the last fetch (not counted against the rate limit)
+            content_decoded = readme_etags.content(url)
+            if content_decoded is None:
+                return None  # Stored README went missing - fetch again next time
+            response_cache.put("readme", url, None, {"content": content_decoded})
+            return content_decoded
+        elif response.status_code == 200:
+            content_decoded = read_capped_text(response)
+            response_cache.put("readme", url, None, {"content": content_decoded})
+            if config.README_CONDITIONAL_REQUESTS:
+                readme_etags.store(url, response.headers, content_decoded)
+            return content_decoded
+        elif response.status_code == 404:
+            response_cache.put("readme", url, None, {"content": None})
+            readme_etags.discard(url)
+            if verbose:
+                print(f"    ⚠️  No README found for {owner}/{repo_name}")
+            return ""
         elif verbose:
             print(f"    ⚠️  {owner}/{repo_name}: HTTP {response.status_code}")
         return None
@@ -43,99 +129,471 @@ def get_readme_content(owner, repo_name, verbose=False):
         if verbose:
             print(f"    ⚠️  {owner}/{repo_name}: {str(e)[:50]}")
         return None
+    finally:
+        response.close()
+
+
+@lru_cache(maxsize=None)
+def build_readme_query(batch_size, filenames):
+    """
+    Build a GraphQL query that looks up README blobs for `batch_size` repos.
+
+    Repos are passed as $owner0/$name0.. variables; every repo alias tries
+    each file name in `filenames` (a tuple) as `fN: object(expression: ...)`.
+    """
+    variable_defs = []
+    aliases = []
+    lookups = " ".join(
+        f'f{j}: object(expression: "HEAD:{filename}") {{ ...ReadmeBlob }}'
+        for j, filename in enumerate(filenames)
+    )
+    for i in range(batch_size):
+        variable_defs += [f"$owner{i}: String!", f"$name{i}: String!"]
+        aliases.append(
+            f"repo{i}: repository(owner: $owner{i}, name: $name{i}) {{ {lookups} }}"
+        )
+
+    return (
+        f"query BatchReadmes({', '.join(variable_defs)}) {{\n    "
+        + "\n    ".join(aliases)
+        + "\n    rateLimit { cost remaining resetAt }\n}\n"
+        + "fragment ReadmeBlob on Blob { text byteSize isBinary isTruncated }\n"
+    )
+
+
+def fetch_readmes_graphql(repos, batch_size=None, verbose=False):
+    """
+    Fetch READMEs for many repositories with batched GraphQL queries.
+
+    Args:
+        repos: List of (owner, repo_name) tuples
+        batch_size: Repositories per query (default: config.README_GRAPHQL_BATCH_SIZE)
+        verbose: Print per-batch details
+
+    Returns:
+        Dict of (owner, repo_name) -> README text, or "" if the repository
+        does not exist. Repos whose README could not be resolved (no variant
+        matched, binary blob, failed batch) are left out so the caller can
+        fall back to REST - so are READMEs over config.MAX_README_BYTES or
+        truncated by GitHub, which REST streams up to the byte cap.
+    """
+    if batch_size is None:
+        batch_size = config.README_GRAPHQL_BATCH_SIZE
+    filenames = tuple(config.README_FILENAMES)
+    max_bytes = config.MAX_README_BYTES
+
+    unique_repos = list(dict.fromkeys(repos))
+    resolved = {}
+    for start in range(0, len(unique_repos), batch_size):
+        batch = unique_repos[start : start + batch_size]
+        query = build_readme_query(len(batch), filenames)
+        variables = {}
+        for i, (owner, repo_name) in enumerate(batch):
+            variables[f"owner{i}"] = owner
+            variables[f"name{i}"] = repo_name
+
+        try:
+            result = run_query(
+                query, variables, cache_endpoint="readme", allow_partial=True
+            )
+        except Exception as e:
+            # Leave the whole batch to the REST fallback
+            if verbose:
+                print(f"    ⚠️  README batch failed ({len(batch)} repos): {e}")
+            continue
+
+        data = result.get("data") or {}
+        for i, key in enumerate(batch):
+            repository = data.get(f"repo{i}")
+            if repository is None:
+                resolved[key] = ""  # Repository not found (REST would 404)
+                continue
+            for j in range(len(filenames)):
+                blob = repository.get(f"f{j}")
+                if not blob or blob.get("isBinary") or blob.get("text") is None:
+                    continue
+                # Oversized or truncated: leave to the capped REST stream
+                if (
+                    not blob.get("isTruncated")
+                    and (blob.get("byteSize") or 0) <= max_bytes
+                ):
+                    resolved[key] = blob["text"]
+                break
+
+    if verbose:
+        print(
+            f"    📦 GraphQL resolved {len(resolved)}/{len(unique_repos)} READMEs "
+            f"in {-(-len(unique_repos) // batch_size)} requests"
+        )
+    return resolved
 
 
 def load_users_from_file(filepath):
-    """Load users from a JSON file."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load users from a JSON or NDJSON file."""
+    return load_users(filepath)
 
 
-def fetch_readmes_for_users(users, output_folder):
+def _readme_targets(user):
+    """
+    List the (repo, owner, repo_name) READMEs to fetch for a user.
+
+    The owner is taken from the repo URL so forks resolve to the right repo.
+    """
+    login = user.get("login", "Unknown")
+    targets = []
+    for repo in user.get("repositories", {}).get("nodes", []):
+        if not repo:
+            continue
+
+        repo_name = repo.get("name")
+        repo_url = repo.get("url", "")
+        if not repo_name:
+            continue
+
+        # Extract actual owner from URL (handles forks correctly)
+        # URL format: https://github.com/owner/repo
+        owner = login  # Default to user's login
+
+        if repo_url and "github.com/" in repo_url:
+            parts = repo_url.split("github.com/")[-1].split("/")
+            if len(parts) >= 2:
+                owner = parts[0]  # Actual repo owner
+
+        targets.append((repo, owner, repo_name))
+    return targets
+
+
+def _recorded_readme(repo):
+    """
+    README a previous run recorded for a repository node.
+
+    Returns:
+        README text, "" if the run confirmed there is none (README_STATUS_NONE),
+        or None if nothing usable was recorded (failed fetch, repo skipped as
+        low-value, README blob missing from the store)
+    """
+    recorded = False
+    for field in ("readme", "readme_clean"):
+        if repo.get(field) is not None:
+            recorded = True
+        elif repo.get(f"{field}_ref"):
+            if not readme_store.contains(repo[f"{field}_ref"]):
+                return None
+            recorded = True
+    if recorded:
+        return get_readme(repo, raw=True)
+    if repo.get("readme_status") == README_STATUS_NONE:
+        return ""
+    return None
+
+
+def store_readme(repo, readme_content):
+    """
+    Attach a fetched README to its repository node.
+
+    With NORMALIZE_READMES, the cleaned prose version is stored as
+    `readme_clean`; the raw text is kept only with KEEP_RAW_README.
+    """
+    if config.NORMALIZE_READMES:
+        attach_readme(repo, normalize_readme(readme_content), field="readme_clean")
+        if not config.KEEP_RAW_README:
+            return
+    attach_readme(repo, readme_content)
+
+
+def carry_forward_readmes(user_targets, previous_users):
+    """
+    Find READMEs that can be copied from a previous Phase 3 run.
+
+    A repository's README is reused when the previous run saw the same
+    repository with a `pushedAt` at or after the current one - nothing has
+    been pushed since, so the README cannot have changed. Only recorded
+    results are reused: a README, or a confirmed "no README" marker. Repos
+    whose previous fetch failed or was skipped are fetched again.
+
+    Args:
+        user_targets: Per-user lists of (repo, owner, repo_name) targets
+        previous_users: Users from a previous phase3 file
+
+    Returns:
+        Dict of (owner, repo_name) -> previous README text ("" if the
+        previous run confirmed there is no README)
+    """
+    previous = {}
+    for user in previous_users:
+        for repo, owner, repo_name in _readme_targets(user):
+            previous[(owner, repo_name)] = repo
+
+    carried = {}
+    for targets in user_targets:
+        for repo, owner, repo_name in targets:
+            old_repo = previous.get((owner, repo_name))
+            if not old_repo:
+                continue
+            pushed_at = parse_datetime(repo.get("pushedAt"))
+            old_pushed_at = parse_datetime(old_repo.get("pushedAt"))
+            if pushed_at and old_pushed_at and pushed_at <= old_pushed_at:
+                readme = _recorded_readme(old_repo)
+                if readme is not None:
+                    carried[(owner, repo_name)] = readme
+    return carried
+
+
+def is_low_value_repo(repo):
+    """Repos without stars and without a description rarely say much about a candidate."""
+    return not repo.get("stargazerCount") and not repo.get("description")
+
+
+def _chunk_users(user_targets, repos_per_chunk):
+    """Group consecutive user indices into chunks of about `repos_per_chunk` repos."""
+    chunk = []
+    repo_count = 0
+    for i, targets in enumerate(user_targets):
+        chunk.append(i)
+        repo_count += len(targets)
+        if repo_count >= repos_per_chunk:
+            yield chunk
+            chunk = []
+            repo_count = 0
+    if chunk:
+        yield chunk
+
+
+def fetch_readmes_for_users(
+    users,
+    output_folder,
+    workers=None,
+    mode=None,
+    previous_file=None,
+    time_budget=None,
+    request_budget=None,
+    skip_low_value=None,
+):
     """
     Fetch READMEs for a list of users and save to file.
 
+    Users are processed in ranking order, a few at a time (about one GraphQL
+    batch of repositories per chunk). Every finished user is appended to an
+    NDJSON file right away, so an interrupted run still leaves a usable
+    partial result in phase3_partial_with_readmes.ndjson (see
+    user_io.load_users); a finished run renames it to match the JSON file
+    (phase3_top_<processed>_with_readmes.*). Before each chunk the time and
+    request budgets are checked; once one is used up, the run stops cleanly
+    and saves the users processed so far.
+
+    In "graphql" mode, READMEs are first looked up in batches with
+    fetch_readmes_graphql; only unresolved repos go to the REST endpoint.
+    With more than one worker, REST requests are made by a thread pool over
+    the shared pooled session; the rate-limit scheduler in github_client
+    paces all threads from the REST X-RateLimit-* headers. Output file and
+    summary counts are the same in every mode.
+
+    Incremental mode (previous_file): READMEs of repositories that have not
+    been pushed since the previous phase3 file are copied forward instead of
+    downloaded (see carry_forward_readmes).
+
     Args:
         users: List of user dictionaries with repositories
         output_folder: Folder to save the enriched data
+        workers: Concurrent README requests (default: config.README_WORKERS,
+            1 = serial)
+        mode: "graphql" or "rest" (default: config.README_FETCH_MODE)
+        previous_file: Previous phase3 file to copy unchanged READMEs from
+            (default: None = fetch everything)
+        time_budget: Stop after this many seconds (default: config.README_TIME_BUDGET)
+        request_budget: Stop after this many API requests
+            (default: config.README_REQUEST_BUDGET)
+        skip_low_value: Don't fetch READMEs of repos with no stars and no
+            description (default: config.README_SKIP_LOW_VALUE)
 
     Returns:
         Path to the output file
     """
+    if workers is None:
+        workers = config.README_WORKERS
+    if mode is None:
+        mode = config.README_FETCH_MODE
+    if time_budget is None:
+        time_budget = config.README_TIME_BUDGET
+    if request_budget is None:
+        request_budget = config.README_REQUEST_BUDGET
+    if skip_low_value is None:
+        skip_low_value = config.README_SKIP_LOW_VALUE
+
     print(f"\n{'='*60}")
     print(f"📚 Fetching READMEs for {len(users)} top-ranked users")
+    if workers > 1:
+        print(f"   ({workers} concurrent requests)")
+    if time_budget or request_budget:
+        budgets = []
+        if time_budget:
+            budgets.append(f"{time_budget / 60:.1f} min")
+        if request_budget:
+            budgets.append(f"{request_budget} requests")
+        print(f"   (budget: {', '.join(budgets)})")
     print(f"{'='*60}\n")
 
+    # Highest-ranked users first (stable, so equal scores keep their order)
+    users = sorted(users, key=lambda u: u.get("ranking_score", 0), reverse=True)
+
     readme_count = 0
     no_readme_count = 0
-    total_repos = sum(
-        len(user.get("repositories", {}).get("nodes", [])) for user in users
-    )
+    skipped_low_value = [0] * len(users)
 
     # Enable verbose mode if configured
     verbose = getattr(config, "VERBOSE", False)
 
-    for i, user in enumerate(users, 1):
-        login = user.get("login", "Unknown")
-        repos = user.get("repositories", {}).get("nodes", [])
-        print(f"Processing user {i}/{len(users)}: {login} ({len(repos)} repos)")
-
-        for repo in repos:
-            if not repo:
-                continue
+    user_targets = [_readme_targets(user) for user in users]
+    if skip_low_value:
+        for u, targets in enumerate(user_targets):
+            kept = [t for t in targets if not is_low_value_repo(t[0])]
+            skipped_low_value[u] = len(targets) - len(kept)
+            user_targets[u] = kept
+
+    # Incremental: READMEs of repos not pushed since the previous run
+    prefetched = {}
+    if previous_file:
+        prefetched = carry_forward_readmes(
+            user_targets, load_users_from_file(previous_file)
+        )
+        print(
+            f"♻️  Incremental: {len(prefetched)} READMEs unchanged since {os.path.basename(previous_file)}\n"
+        )
 
-            repo_name = repo.get("name")
-            repo_url = repo.get("url", "")
-            if not repo_name:
-                continue
+    # Final name depends on how many users get processed (budgets)
+    ndjson_path = os.path.join(output_folder, "phase3_partial_with_readmes.ndjson")
+    writer = NdjsonWriter(ndjson_path)
+    requests_at_start = github_client.request_stats.count()
+    start_time = time.monotonic()
+    stop_reason = None
+    graphql_resolved = 0
+    processed = 0
 
-            # Extract actual owner from URL (handles forks correctly)
-            # URL format: https://github.com/owner/repo
-            owner = login  # Default to user's login
-            is_fork = repo.get("isFork", False)
-
-            if repo_url and "github.com/" in repo_url:
-                parts = repo_url.split("github.com/")[-1].split("/")
-                if len(parts) >= 2:
-                    owner = parts[0]  # Actual repo owner
-
-            # Warn if fetching README from someone else's repo (fork)
-            if verbose and owner != login:
-                print(f"    ⚠️  {repo_name}: Fork of {owner}'s repo")
-
-            readme_content = get_readme_content(owner, repo_name, verbose)
-            if readme_content:
-                repo["readme"] = readme_content
-                readme_count += 1
-                if verbose:
-                    print(f"    ✅ {repo_name}: {len(readme_content)} bytes")
-            else:
-                no_readme_count += 1
-
-            # Rate limiting
-            time.sleep(config.README_DELAY)
-
-    # Save enhanced users with READMEs
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        pending = {}
+        for chunk in _chunk_users(user_targets, config.README_GRAPHQL_BATCH_SIZE):
+            # Budget check before starting the next chunk
+            if time_budget and time.monotonic() - start_time >= time_budget:
+                stop_reason = "time budget"
+                break
+            used = github_client.request_stats.count() - requests_at_start
+            if request_budget and used >= request_budget:
+                stop_reason = "request budget"
+                break
+
+            chunk_keys = [
+                (owner, repo_name)
+                for u in chunk
+                for _, owner, repo_name in user_targets[u]
+                if (owner, repo_name) not in prefetched
+            ]
+
+            # Batched GraphQL lookup first; whatever it can't resolve goes to REST
+            if mode == "graphql" and chunk_keys:
+                resolved = fetch_readmes_graphql(chunk_keys, verbose=verbose)
+                graphql_resolved += len(resolved)
+                prefetched.update(resolved)
+
+            # Concurrent: queue the chunk's REST requests, consume in user order
+            if executor:
+                for key in chunk_keys:
+                    if key not in prefetched and key not in pending:
+                        pending[key] = executor.submit(
+                            get_readme_content, key[0], key[1], verbose
+                        )
+
+            for u in chunk:
+                user = users[u]
+                login = user.get("login", "Unknown")
+                repos = user.get("repositories", {}).get("nodes", [])
+                print(
+                    f"Processing user {u + 1}/{len(users)}: {login} ({len(repos)} repos)"
+                )
+
+                for repo, owner, repo_name in user_targets[u]:
+                    # Warn if fetching README from someone else's repo (fork)
+                    if verbose and owner != login:
+                        print(f"    ⚠️  {repo_name}: Fork of {owner}'s repo")
+
+                    key = (owner, repo_name)
+                    if key in prefetched:
+                        readme_content = prefetched[key]
+                    elif executor:
+                        readme_content = pending[key].result()
+                    else:
+                        readme_content = get_readme_content(owner, repo_name, verbose)
+
+                    if readme_content:
+                        store_readme(repo, readme_content)
+                        readme_count += 1
+                        if verbose:
+                            print(f"    ✅ {repo_name}: {len(readme_content)} bytes")
+                    else:
+                        if readme_content is not None:
+                            # Confirmed missing, so later runs can carry it forward
+                            repo["readme_status"] = README_STATUS_NONE
+                        no_readme_count += 1
+
+                writer.write(user)
+                processed += 1
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+        writer.close()
+
+    # Keep ETags for the next refresh
+    if config.README_CONDITIONAL_REQUESTS:
+        readme_etags.save()
+
+    # Save enhanced users with READMEs (only the processed ones if stopped early)
+    users = users[:processed]
+    # Repos we looked up (skipped low-value repos are reported separately)
+    total_repos = sum(len(targets) for targets in user_targets[:processed])
+    skipped = sum(skipped_low_value[:processed])
     filename = f"phase3_top_{len(users)}_with_readmes.json"
     output_path = os.path.join(output_folder, filename)
+    final_ndjson_path = os.path.splitext(output_path)[0] + ".ndjson"
+    os.replace(ndjson_path, final_ndjson_path)
+    ndjson_path = final_ndjson_path
 
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(
-            users, f, indent=config.JSON_INDENT, ensure_ascii=config.JSON_ENSURE_ASCII
+            strip_all_features(users),
+            f,
+            indent=config.JSON_INDENT,
+            ensure_ascii=config.JSON_ENSURE_ASCII,
+            default=json_default,
         )
 
     print(f"\n📚 README Fetch Summary:")
+    if stop_reason:
+        print(
+            f"  ⏱️  Stopped at {stop_reason}: {processed}/{len(user_targets)} users processed"
+        )
     print(f"  ✅ Successfully fetched: {readme_count}/{total_repos} READMEs")
     print(f"  ⚠️  No README found: {no_readme_count}/{total_repos} repos")
     success_rate = (readme_count / total_repos * 100) if total_repos > 0 else 0
     print(f"  📊 Success rate: {success_rate:.1f}%")
+    if skipped:
+        print(
+            f"  ⏭️  Skipped low-value repos (no stars, no description): "
+            f"{skipped}/{total_repos + skipped} repos (not counted above)"
+        )
+    if mode == "graphql":
+        print(f"  📦 Resolved by batched GraphQL: {graphql_resolved}")
+    if readme_etags.not_modified:
+        print(f"  ♻️  Unchanged since last fetch (304): {readme_etags.not_modified}")
     print(f"\n✅ Saved to: {output_path}")
+    print(f"   (streamed: {ndjson_path})")
     return output_path
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python fetch_readmes.py <ranked_users_json_file>")
+        print(
+            "Usage: python fetch_readmes.py <ranked_users_json_file> [previous_phase3_file]"
+        )
         print(
             "Example: python fetch_readmes.py data/raw/20251008_162951/phase2_ranked_top_20.json"
         )
@@ -150,5 +608,6 @@ if __name__ == "__main__":
     # Get output folder (same as input)
     output_folder = os.path.dirname(input_file)
 
-    # Fetch READMEs
-    fetch_readmes_for_users(users, output_folder)
+    # Fetch READMEs (optionally reusing unchanged ones from a previous run)
+    previous_file = sys.argv[2] if len(sys.argv) > 2 else None
+    fetch_readmes_for_users(users, output_folder, previous_file=previous_file)
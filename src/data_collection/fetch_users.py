@@ -11,18 +11,28 @@ Improvements based on Oct 2025 testing:
 See docs/TWO_PHASE_WORKFLOW.md for complete documentation.
 """
 
+import asyncio
 import json
 import os
 import sys
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 from src import config
+from src.data_collection import github_client
+from src.data_collection.rate_limiter import scheduler
+from src.data_collection.response_cache import CacheMissError, response_cache
+from src.processing.contribution_calendar import compact_user_calendar, json_default
+from src.data_collection.batch_sizing import (
+    AdaptiveBatchSizer,
+    is_resource_limit_error,
+)
 
 # ============================================================================
 # PHASE 1: Search for user logins (100 per page @ 1 point)
@@ -50,82 +60,179 @@ query SearchUsers($query: String!, $first: Int!, $after: String) {
 }
 """
 
+SEARCH_COUNT_QUERY = """
+query CountUsers($query: String!) {
+    rateLimit {
+        cost
+        remaining
+        resetAt
+    }
+    search(query: $query, type: USER, first: 1) {
+        userCount
+    }
+}
+"""
+
 
 # ============================================================================
 # PHASE 2: Batch fetch full user data (20 users/batch @ 1 point)
 # ============================================================================
 
 
-def build_batch_query(logins: List[str], from_date: str, to_date: str) -> str:
+PROFILE_FIELDS_FRAGMENT = """
+fragment ProfileFields on User {
+    login
+    name
+    bio
+    company
+    location
+    email
+    websiteUrl
+    twitterUsername
+    followers { totalCount }
+    following { totalCount }
+    repositories(
+        first: $repos
+        orderBy: {field: STARGAZERS, direction: DESC}
+        privacy: PUBLIC
+        ownerAffiliations: OWNER
+        isFork: false
+    ) {
+        totalCount
+        nodes {
+            name
+            description
+            stargazerCount
+            forkCount
+            pushedAt
+            primaryLanguage { name }
+            url
+        }
+    }
+}
+"""
+
+CONTRIBUTION_TOTAL_FRAGMENT = """
+fragment ContributionTotal on User {
+    contributionsCollection(from: $from, to: $to) {
+        contributionCalendar {
+            totalContributions
+        }
+    }
+}
+"""
+
+CALENDAR_FIELDS_FRAGMENT = """
+fragment CalendarFields on User {
+    login
+    contributionsCollection(from: $from, to: $to) {
+        contributionCalendar {
+            totalContributions
+            weeks {
+                contributionDays {
+                    contributionCount
+                    date
+                }
+            }
+        }
+    }
+}
+"""
+
+# Batch query kinds -> (fragments spread into each alias, uses $repos)
+#   full:     profile + repositories + 365-day calendar (single-pass)
+#   profile:  profile + repositories + yearly total only (cheap first pass)
+#   calendar: 365-day calendar only (expensive second pass)
+BATCH_QUERY_KINDS = {
+    "full": (
+        [
+            ("ProfileFields", PROFILE_FIELDS_FRAGMENT),
+            ("CalendarFields", CALENDAR_FIELDS_FRAGMENT),
+        ],
+        True,
+    ),
+    "profile": (
+        [
+            ("ProfileFields", PROFILE_FIELDS_FRAGMENT),
+            ("ContributionTotal", CONTRIBUTION_TOTAL_FRAGMENT),
+        ],
+        True,
+    ),
+    "calendar": ([("CalendarFields", CALENDAR_FIELDS_FRAGMENT)], False),
+}
+
+
+@lru_cache(maxsize=None)
+def build_batch_query(batch_size: int, kind: str = "full") -> str:
     """
-    Build batched GraphQL query for multiple users.
+    Build the batched GraphQL query document for `batch_size` users.
+
+    The document only depends on the batch size and kind: logins, the
+    contribution window and the repository count are GraphQL variables
+    ($login0..N, $from, $to, $repos, see build_batch_variables). Each
+    document is built once and cached, so per request only the small
+    variables payload changes and the query text stays byte-identical
+    across batches.
 
     Args:
-        logins: List of GitHub usernames
-        from_date: Start date for contributions (ISO format)
-        to_date: End date for contributions (ISO format)
+        batch_size: Number of users in the batch
+        kind: "full", "profile" or "calendar" (see BATCH_QUERY_KINDS)
 
     Returns:
-        GraphQL query string with aliases for each user
+        GraphQL query string with one `userN` alias per user
 
     Note: Contribution calendar is expensive (52 weeks × 7 days × N users).
     For batch size 20: 7,280 data points can hit GitHub resource limits.
     We fetch full calendar but GitHub may throttle randomly.
     """
-    aliases = []
+    fragments, uses_repos = BATCH_QUERY_KINDS[kind]
+
+    variable_defs = [f"$login{i}: String!" for i in range(batch_size)]
+    variable_defs += ["$from: DateTime!", "$to: DateTime!"]
+    if uses_repos:
+        variable_defs.append("$repos: Int!")
+
+    spreads = " ".join(f"...{name}" for name, _ in fragments)
+    aliases = [
+        f"user{i}: user(login: $login{i}) {{ {spreads} }}" for i in range(batch_size)
+    ]
+
+    return (
+        f"query BatchUsers({', '.join(variable_defs)}) {{\n    "
+        + "\n    ".join(aliases)
+        + "\n    rateLimit { cost remaining resetAt }\n}\n"
+        + "".join(fragment for _, fragment in fragments)
+    )
 
-    for i, login in enumerate(logins):
-        # Escape quotes in login (shouldn't happen, but safety first)
-        safe_login = login.replace('"', '\\"')
 
-        aliases.append(
-            f"""
-        user{i}: user(login: "{safe_login}") {{
-            login
-            name
-            bio
-            company
-            location
-            email
-            websiteUrl
-            twitterUsername
-            followers {{ totalCount }}
-            following {{ totalCount }}
-            repositories(
-                first: 5
-                orderBy: {{field: STARGAZERS, direction: DESC}}
-                privacy: PUBLIC
-                ownerAffiliations: OWNER
-                isFork: false
-            ) {{
-                totalCount
-                nodes {{
-                    name
-                    description
-                    stargazerCount
-                    forkCount
-                    pushedAt
-                    primaryLanguage {{ name }}
-                    url
-                }}
-            }}
-            contributionsCollection(from: "{from_date}", to: "{to_date}") {{
-                contributionCalendar {{
-                    totalContributions
-                    weeks {{
-                        contributionDays {{
-                            contributionCount
-                            date
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
-        )
+def build_batch_variables(
+    logins: List[str],
+    from_date: str,
+    to_date: str,
+    repos: int = None,
+    kind: str = "full",
+) -> Dict:
+    """
+    Build the variables payload for build_batch_query(len(logins), kind).
 
-    query = "{ " + " ".join(aliases) + " rateLimit { cost remaining resetAt } }"
-    return query
+    Args:
+        logins: List of GitHub usernames
+        from_date: Start date for contributions (ISO format)
+        to_date: End date for contributions (ISO format)
+        repos: Top repositories per user (default: config.REPOS_PER_USER)
+        kind: Batch query kind (GraphQL rejects unused variables)
+
+    Returns:
+        Dict of GraphQL variables
+    """
+    if repos is None:
+        repos = config.REPOS_PER_USER
+
+    variables = {f"login{i}": login for i, login in enumerate(logins)}
+    variables.update({"from": from_date, "to": to_date})
+    if BATCH_QUERY_KINDS[kind][1]:
+        variables["repos"] = repos
+    return variables
 
 
 # ============================================================================
@@ -138,6 +245,8 @@ def run_query(
     variables: Optional[Dict] = None,
     max_retries: int = 3,
     timeout: int = 60,
+    cache_endpoint: str = "graphql",
+    allow_partial: bool = False,
 ) -> Dict:
     """
     Execute GraphQL query with retry logic.
@@ -145,24 +254,36 @@ def run_query(
     Handles:
     - Network timeouts (ChunkedEncodingError, ConnectionError)
     - HTTP 502/504 errors (Bad Gateway, Gateway Timeout)
-    - Rate limiting
+    - Rate limiting (403/429; pacing itself is done by rate_limiter.scheduler)
+
+    Successful responses go through response_cache (see RESPONSE_CACHE_MODE);
+    a cached response reports a rateLimit cost of 0.
 
     Args:
         query: GraphQL query string
         variables: Query variables (optional)
         max_retries: Maximum retry attempts
         timeout: Request timeout in seconds
+        cache_endpoint: Endpoint label for cache keys and TTLs
+            ("search", "users", ...); None = the caller caches the response
+        allow_partial: Return responses that carry both data and errors
+            (e.g. NOT_FOUND for single aliases) instead of retrying
 
     Returns:
         JSON response from GitHub API
 
     Raises:
+        CacheMissError: If the response is not cached in replay mode
         Exception: If all retries fail
     """
-    headers = {
-        "Authorization": f"Bearer {config.GITHUB_TOKEN}",
-        "Content-Type": "application/json",
-    }
+    cached = (
+        response_cache.get(cache_endpoint, query, variables) if cache_endpoint else None
+    )
+    if cached is not None:
+        rate_limit = (cached.get("data") or {}).get("rateLimit")
+        if rate_limit:
+            rate_limit["cost"] = 0
+        return cached
 
     payload = {"query": query}
     if variables:
@@ -170,28 +291,29 @@ def run_query(
 
     for attempt in range(max_retries):
         try:
-            response = requests.post(
-                "https://api.github.com/graphql",
-                headers=headers,
-                json=payload,
-                timeout=timeout,
-            )
+            response = github_client.graphql_post(payload, timeout=timeout)
 
             # Success
             if response.status_code == 200:
                 result = response.json()
+                scheduler.update_from_graphql(
+                    (result.get("data") or {}).get("rateLimit")
+                )
 
                 # Check for GraphQL errors
                 if "errors" in result:
                     error_msg = result["errors"][0]["message"]
 
                     # Resource limits - don't retry, this is a query complexity issue
-                    if (
-                        "Resource limits" in error_msg
-                        or "complexity" in error_msg.lower()
-                    ):
+                    if is_resource_limit_error(error_msg):
                         raise Exception(f"Query too complex: {error_msg}")
 
+                    # Partial result - the failed aliases are simply null
+                    if allow_partial and result.get("data"):
+                        if cache_endpoint:
+                            response_cache.put(cache_endpoint, query, variables, result)
+                        return result
+
                     # Other errors - retry
                     if attempt < max_retries - 1:
                         wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
@@ -204,6 +326,8 @@ def run_query(
                     else:
                         raise Exception(f"GraphQL error: {error_msg}")
 
+                if cache_endpoint:
+                    response_cache.put(cache_endpoint, query, variables, result)
                 return result
 
             # HTTP errors - retry
@@ -221,6 +345,20 @@ def run_query(
                         f"HTTP {response.status_code} after {max_retries} attempts"
                     )
 
+            # Rate limited - retry once the scheduler has budget again
+            elif response.status_code in [403, 429] and (
+                "Retry-After" in response.headers
+                or response.headers.get("X-RateLimit-Remaining") == "0"
+            ):
+                if attempt < max_retries - 1:
+                    print(f"  ⚠️  HTTP {response.status_code}: rate limited")
+                    print(f"     Retrying (attempt {attempt + 2}/{max_retries})...")
+                    continue
+                else:
+                    raise Exception(
+                        f"HTTP {response.status_code}: rate limited after {max_retries} attempts"
+                    )
+
             # Other HTTP errors - don't retry
             else:
                 raise Exception(f"HTTP {response.status_code}: {response.text}")
@@ -282,7 +420,7 @@ def search_users(
         variables = {"query": query, "first": users_per_page, "after": cursor}
 
         try:
-            result = run_query(SEARCH_QUERY, variables)
+            result = run_query(SEARCH_QUERY, variables, cache_endpoint="search")
 
             # Extract data
             search_data = result["data"]["search"]
@@ -342,9 +480,8 @@ def search_users(
             cursor = page_info["endCursor"]
             page += 1
 
-            # Rate limiting
-            time.sleep(1)
-
+        except CacheMissError:
+            raise
         except Exception as e:
             print(f"❌ Failed: {e}")
             break
@@ -374,6 +511,9 @@ def search_users(
             print(
                 f"      - Split by followers: followers:10..100, followers:100..1000, etc."
             )
+            print(
+                f"      - Or let search_users_partitioned split the query automatically"
+            )
         elif coverage_pct < 95:
             remaining_users = total_available - len(all_logins)
             pages_needed = (remaining_users + users_per_page - 1) // users_per_page
@@ -396,21 +536,374 @@ def search_users(
     return unique_logins
 
 
+# ============================================================================
+# Phase 1 (Partitioned): Split the query to get past the 1,000-result cap
+# ============================================================================
+
+# Follower brackets tried first when a single creation day is still too big
+FOLLOWER_BRACKETS = [(0, 0), (1, 9), (10, 99), (100, 999), (1000, None)]
+
+
+def count_users(query: str) -> int:
+    """Return the number of users matching a search query (1 point)."""
+    result = run_query(SEARCH_COUNT_QUERY, {"query": query}, cache_endpoint="search")
+    return result["data"]["search"]["userCount"]
+
+
+def _split_or_terms(query: str) -> List[str]:
+    """
+    Split a query like `location:a OR location:b` into its OR terms.
+
+    Qualifiers appended to an OR query would only bind to the last term, so
+    each term is partitioned on its own and the logins are deduplicated.
+    """
+    return [term.strip() for term in query.split(" OR ") if term.strip()]
+
+
+def _followers_qualifier(low: int, high: Optional[int]) -> str:
+    if high is None:
+        return f"followers:>={low}"
+    if low == high:
+        return f"followers:{low}"
+    return f"followers:{low}..{high}"
+
+
+def _partition_by_followers(
+    query: str, low: int, high: Optional[int], limit: int, partitions: List
+):
+    """Recursively split a query by follower ranges until each fits the limit."""
+    partition_query = f"{query} {_followers_qualifier(low, high)}"
+    count = count_users(partition_query)
+
+    if count == 0:
+        return
+    if count <= limit or low == high:
+        if count > limit:
+            print(
+                f"   ⚠️  Cannot split further, only first {limit} of {count:,}: {partition_query}"
+            )
+        partitions.append((partition_query, count))
+        return
+
+    if high is None:
+        # Open-ended bracket: split at double the lower bound
+        mid = max(low * 2, low + 1) - 1
+        _partition_by_followers(query, low, mid, limit, partitions)
+        _partition_by_followers(query, mid + 1, None, limit, partitions)
+        return
+
+    mid = (low + high) // 2
+    _partition_by_followers(query, low, mid, limit, partitions)
+    _partition_by_followers(query, mid + 1, high, limit, partitions)
+
+
+def _partition_by_created(
+    query: str, start: date, end: date, limit: int, partitions: List
+):
+    """Recursively split a query by account creation date until each fits."""
+    partition_query = f"{query} created:{start.isoformat()}..{end.isoformat()}"
+    count = count_users(partition_query)
+
+    if count == 0:
+        return
+    if count <= limit:
+        partitions.append((partition_query, count))
+        return
+
+    if start == end:
+        # A single creation day is still too big - split by followers
+        for low, high in FOLLOWER_BRACKETS:
+            _partition_by_followers(partition_query, low, high, limit, partitions)
+        return
+
+    mid = start + (end - start) // 2
+    _partition_by_created(query, start, mid, limit, partitions)
+    _partition_by_created(query, mid + timedelta(days=1), end, limit, partitions)
+
+
+def partition_search_query(
+    base_query: str, limit: int = None, created_start: str = None
+) -> List[Tuple[str, int]]:
+    """
+    Split a search query into partitions that each return at most `limit` users.
+
+    Every OR term of the base query is split recursively by `created:` date
+    range and, if a single day is still too large, by `followers:` range,
+    using the `userCount` of each candidate partition.
+
+    Args:
+        base_query: GitHub search query (e.g. config.build_czech_location_query())
+        limit: Max results per partition (default: config.SEARCH_RESULT_LIMIT)
+        created_start: Earliest account creation date (default: config.SEARCH_CREATED_START)
+
+    Returns:
+        List of (partition_query, user_count) tuples
+    """
+    if limit is None:
+        limit = config.SEARCH_RESULT_LIMIT
+    if created_start is None:
+        created_start = config.SEARCH_CREATED_START
+
+    start = date.fromisoformat(created_start)
+    end = date.today()
+
+    partitions = []
+    for term in _split_or_terms(base_query):
+        count = count_users(term)
+        if count == 0:
+            continue
+        if count <= limit:
+            partitions.append((term, count))
+        elif "created:" not in term:
+            _partition_by_created(term, start, end, limit, partitions)
+        elif "followers:" not in term:
+            for low, high in FOLLOWER_BRACKETS:
+                _partition_by_followers(term, low, high, limit, partitions)
+        else:
+            print(f"   ⚠️  Cannot partition, only first {limit} of {count:,}: {term}")
+            partitions.append((term, count))
+
+    return partitions
+
+
+def search_users_partitioned(
+    query: str, users_per_page: int = 100, limit: int = None
+) -> List[str]:
+    """
+    Collect ALL logins matching a query, beyond the 1,000-result search cap.
+
+    The query is split with partition_search_query, every partition is
+    paged through completely and the logins are deduplicated (OR terms
+    overlap, e.g. "prague" and "czech republic").
+
+    Args:
+        query: GitHub search query (e.g. config.build_czech_location_query())
+        users_per_page: Users per page (max 100)
+        limit: Max results per partition (default: config.SEARCH_RESULT_LIMIT)
+
+    Returns:
+        List of unique user logins
+    """
+    print(f"\n{'='*70}")
+    print(f"📍 PHASE 1: Searching for users (partitioned)")
+    print(f"{'='*70}\n")
+    print(f"Query: {query}\n")
+
+    print("🧩 Partitioning search space...")
+    partitions = partition_search_query(query, limit=limit)
+    expected = sum(count for _, count in partitions)
+    print(f"   {len(partitions)} partitions, {expected:,} results in total\n")
+
+    all_logins = []
+    total_cost = 0
+
+    for i, (partition_query, count) in enumerate(partitions, 1):
+        print(f"Partition {i}/{len(partitions)} ({count:,} users): {partition_query}")
+        cursor = None
+        partition_logins = 0
+
+        while True:
+            variables = {
+                "query": partition_query,
+                "first": users_per_page,
+                "after": cursor,
+            }
+            try:
+                result = run_query(SEARCH_QUERY, variables, cache_endpoint="search")
+            except CacheMissError:
+                raise
+            except Exception as e:
+                print(f"   ❌ Failed: {e}")
+                break
+
+            search_data = result["data"]["search"]
+            total_cost += result["data"]["rateLimit"]["cost"]
+
+            logins = [
+                node["login"]
+                for node in search_data["nodes"]
+                if node and "login" in node
+            ]
+            all_logins.extend(logins)
+            partition_logins += len(logins)
+
+            if not search_data["pageInfo"]["hasNextPage"]:
+                break
+            cursor = search_data["pageInfo"]["endCursor"]
+
+        print(f"   ✅ Got {partition_logins} logins")
+
+    unique_logins = list(dict.fromkeys(all_logins))  # Preserves order
+
+    print(f"\n{'─'*70}")
+    print(f"📊 Partitioned Search Summary:")
+    print(f"   Partitions: {len(partitions)}")
+    print(f"   Logins collected: {len(all_logins):,}")
+    print(f"   Unique logins: {len(unique_logins):,}")
+    print(f"   Total API cost: {total_cost} points (excluding count queries)")
+    print(f"{'─'*70}\n")
+
+    return unique_logins
+
+
 # ============================================================================
 # Phase 2: Batch Fetch Full User Data
 # ============================================================================
 
 
+def get_contribution_window(from_days_ago: int = 365) -> Tuple[str, str]:
+    """
+    Build the ISO date range used for the contribution calendar.
+
+    Args:
+        from_days_ago: Days of contribution history to fetch
+
+    Returns:
+        Tuple of (from_iso, to_iso) strings
+    """
+    to_date = datetime.now()
+    from_date = to_date - timedelta(days=from_days_ago)
+    from_iso = from_date.strftime("%Y-%m-%dT00:00:00Z")
+    to_iso = to_date.strftime("%Y-%m-%dT23:59:59Z")
+    return from_iso, to_iso
+
+
+def fetch_batch(
+    batch_logins: List[str], from_iso: str, to_iso: str, kind: str = "full"
+) -> Tuple[List[Dict], Dict]:
+    """
+    Fetch a single batch of users with one GraphQL request.
+
+    Args:
+        batch_logins: Logins to fetch in this batch
+        from_iso: Start of contribution window (ISO format)
+        to_iso: End of contribution window (ISO format)
+        kind: Batch query kind ("full", "profile" or "calendar")
+
+    Returns:
+        Tuple of (batch_users, rate_limit) where rate_limit is the
+        {cost, remaining, resetAt} block returned by GitHub
+
+    Raises:
+        Exception: If the request fails (see run_query)
+    """
+    cached = _cached_batch(batch_logins, from_iso, to_iso, kind)
+    if cached is not None:
+        remaining = scheduler.status().get("graphql", {}).get("remaining")
+        return cached, {
+            "cost": 0,
+            "remaining": "n/a" if remaining is None else remaining,
+        }
+
+    query = build_batch_query(len(batch_logins), kind)
+    variables = build_batch_variables(batch_logins, from_iso, to_iso, kind=kind)
+    # Cached per login below, not per batch (see _user_cache_key)
+    result = run_query(query, variables, max_retries=3, timeout=60, cache_endpoint=None)
+
+    data = result["data"]
+    rate_limit = data["rateLimit"]
+
+    batch_users = []
+    for i, login in enumerate(batch_logins):
+        user = data.get(f"user{i}")
+        response_cache.put(
+            "users", *_user_cache_key(login, from_iso, to_iso, kind), {"user": user}
+        )
+        if user:
+            # Pack the 365 contributionDays dicts into a daily count array
+            compact_user_calendar(user)
+            batch_users.append(user)
+
+    return batch_users, rate_limit
+
+
+def _user_cache_key(
+    login: str, from_iso: str, to_iso: str, kind: str
+) -> Tuple[str, Dict]:
+    """
+    Cache key (query, variables) of one user of a batch query.
+
+    Batch responses are cached per login: adaptive sizing changes the batch
+    boundaries between runs, and the contribution dates move every day, so
+    neither is part of the key - only the query kind, the length of the
+    contribution window and the repo count. A replay therefore works with
+    any batch size, on any later day.
+    """
+    window_days = (
+        date.fromisoformat(to_iso[:10]) - date.fromisoformat(from_iso[:10])
+    ).days
+    variables = {"login": login, "window_days": window_days}
+    if BATCH_QUERY_KINDS[kind][1]:
+        variables["repos"] = config.REPOS_PER_USER
+    return build_batch_query(1, kind), variables
+
+
+def _cached_batch(
+    batch_logins: List[str], from_iso: str, to_iso: str, kind: str
+) -> Optional[List[Dict]]:
+    """
+    Users of a batch from the per-login cache (None unless all are cached).
+
+    Raises:
+        CacheMissError: If a user is not cached in replay mode
+    """
+    if not response_cache.enabled:
+        return None
+
+    batch_users = []
+    for login in batch_logins:
+        try:
+            cached = response_cache.get(
+                "users", *_user_cache_key(login, from_iso, to_iso, kind)
+            )
+        except CacheMissError:
+            raise CacheMissError(
+                f"Replay mode: user {login!r} ({kind}) was not recorded"
+            ) from None
+        if cached is None:
+            return None
+        if cached["user"]:
+            compact_user_calendar(cached["user"])
+            batch_users.append(cached["user"])
+    return batch_users
+
+
+# Human-readable description of each batch query kind for progress output
+BATCH_KIND_LABELS = {
+    "full": "full user data",
+    "profile": "user profiles (cheap pass)",
+    "calendar": "contribution calendars",
+}
+
+
+def _make_sizer(batch_size: int, kind: str) -> AdaptiveBatchSizer:
+    """Create the adaptive sizer for a batch query kind."""
+    if kind == "profile":
+        return AdaptiveBatchSizer.from_state(
+            batch_size, kind=kind, max_size=config.ADAPTIVE_PROFILE_BATCH_MAX
+        )
+    return AdaptiveBatchSizer.from_state(batch_size, kind=kind)
+
+
 def fetch_users_batch(
-    logins: List[str], batch_size: int = None, from_days_ago: int = 365
+    logins: List[str],
+    batch_size: int = None,
+    from_days_ago: int = 365,
+    adaptive: bool = None,
+    kind: str = "full",
 ) -> List[Dict]:
     """
     Fetch full user data in batches with retry logic.
 
     Args:
         logins: List of unique user logins
-        batch_size: Users per batch (default: from config.OPTIMAL_BATCH_SIZE)
+        batch_size: Users per batch (default: from config.OPTIMAL_BATCH_SIZE).
+            With adaptive sizing this is only the starting size used when no
+            converged size has been saved yet.
         from_days_ago: Days of contribution history to fetch
+        adaptive: Size batches with AIMD based on resource-limit feedback
+            (default: config.ADAPTIVE_BATCH_SIZE)
+        kind: Batch query kind - "full" (default), "profile" or "calendar"
 
     Returns:
         Tuple of (users_list, failed_batches_list)
@@ -421,50 +914,58 @@ def fetch_users_batch(
     # Use config default if not specified
     if batch_size is None:
         batch_size = config.OPTIMAL_BATCH_SIZE
+    if adaptive is None:
+        adaptive = config.ADAPTIVE_BATCH_SIZE
+    if response_cache.mode == "replay":
+        # Offline: batch sizes don't matter (per-login cache), keep the saved state
+        adaptive = False
+
+    sizer = _make_sizer(batch_size, kind) if adaptive else None
+    if sizer:
+        batch_size = sizer.size
+
     print(f"\n{'='*70}")
-    print(f"📍 PHASE 2: Fetching full user data")
+    print(f"📍 PHASE 2: Fetching {BATCH_KIND_LABELS[kind]}")
     print(f"{'='*70}\n")
     print(f"Unique users to fetch: {len(logins)}")
-    print(f"Batch size: {batch_size} users")
+    if sizer:
+        print(
+            f"Batch size: {batch_size} users (adaptive {sizer.min_size}-{sizer.max_size})"
+        )
+    else:
+        print(f"Batch size: {batch_size} users")
     print(f"Contribution window: {from_days_ago} days")
-    print(f"⚠️  Note: Including 365-day contribution calendar (expensive query)\n")
+    if kind == "profile":
+        print(
+            f"ℹ️  Profiles and yearly totals only (calendar fetched in a second pass)\n"
+        )
+    else:
+        print(f"⚠️  Note: Including 365-day contribution calendar (expensive query)\n")
 
     # Calculate date range
-    to_date = datetime.now()
-    from_date = to_date - timedelta(days=from_days_ago)
-    from_iso = from_date.strftime("%Y-%m-%dT00:00:00Z")
-    to_iso = to_date.strftime("%Y-%m-%dT23:59:59Z")
+    from_iso, to_iso = get_contribution_window(from_days_ago)
 
     all_users = []
-    total_batches = (len(logins) + batch_size - 1) // batch_size
     total_cost = 0
     failed_batches = []
+    batch_num = 0
+    start_idx = 0
 
-    for batch_num in range(total_batches):
-        start_idx = batch_num * batch_size
+    while start_idx < len(logins):
+        if sizer:
+            batch_size = sizer.size
         end_idx = min(start_idx + batch_size, len(logins))
         batch_logins = logins[start_idx:end_idx]
 
-        print(f"Batch {batch_num + 1}/{total_batches}: ", end="", flush=True)
+        print(f"Batch {batch_num + 1}: ", end="", flush=True)
         print(
-            f"Fetching {len(batch_logins)} users [{start_idx + 1}-{end_idx}]...",
+            f"Fetching {len(batch_logins)} users [{start_idx + 1}-{end_idx}/{len(logins)}]...",
             end=" ",
         )
 
         try:
             # Build and execute query
-            query = build_batch_query(batch_logins, from_iso, to_iso)
-            result = run_query(query, max_retries=3, timeout=60)
-
-            # Extract users
-            data = result["data"]
-            rate_limit = data["rateLimit"]
-
-            batch_users = []
-            for key in data:
-                if key.startswith("user") and data[key]:
-                    batch_users.append(data[key])
-
+            batch_users, rate_limit = fetch_batch(batch_logins, from_iso, to_iso, kind)
             all_users.extend(batch_users)
 
             # Log results
@@ -475,24 +976,55 @@ def fetch_users_batch(
             print(f"✅ Got {len(batch_users)}/{len(batch_logins)} users")
             print(f"   Cost: {cost} pt, Remaining: {remaining} pts")
 
-            # Rate limiting
-            time.sleep(0.5)
+            if sizer:
+                sizer.record_success(len(batch_logins))
 
+        except CacheMissError:
+            raise  # Replay mode must not fall back to the API
         except Exception as e:
             print(f"❌ Failed: {e}")
             failed_batches.append(
-                {"batch_num": batch_num + 1, "logins": batch_logins, "error": str(e)}
+                {
+                    "batch_num": batch_num + 1,
+                    "logins": batch_logins,
+                    "error": str(e),
+                    "kind": kind,
+                }
             )
 
             # If resource limits, reduce batch size for next batch
-            if "Resource limits" in str(e) or "complexity" in str(e).lower():
+            if sizer and sizer.record_failure(str(e)):
+                print(f"   ⚠️  Query too complex - batch size reduced to {sizer.size}")
+            elif is_resource_limit_error(str(e)):
                 print(f"   ⚠️  Query too complex - consider reducing batch size")
 
+        batch_num += 1
+        start_idx = end_idx
+
+    if sizer:
+        sizer.save()
+        print(f"\n📐 Adaptive batch size converged on {sizer.converged_size} users")
+
+    print_fetch_summary(
+        batch_num, failed_batches, len(all_users), len(logins), total_cost
+    )
+
+    return all_users, failed_batches
+
+
+def print_fetch_summary(
+    total_batches: int,
+    failed_batches: List[Dict],
+    users_fetched: int,
+    users_requested: int,
+    total_cost: int,
+):
+    """Print the summary block shown at the end of a batch fetch."""
     print(f"\n{'─'*70}")
     print(f"📊 Fetch Summary:")
     print(f"   Batches attempted: {total_batches}")
     print(f"   Batches successful: {total_batches - len(failed_batches)}")
-    print(f"   Users fetched: {len(all_users)}/{len(logins)}")
+    print(f"   Users fetched: {users_fetched}/{users_requested}")
     print(f"   Total API cost: {total_cost} points")
 
     if failed_batches:
@@ -502,9 +1034,176 @@ def fetch_users_batch(
 
     print(f"{'─'*70}\n")
 
+
+# ============================================================================
+# Phase 2 (Concurrent): Keep several batches in flight with asyncio
+# ============================================================================
+
+
+async def fetch_users_batch_async(
+    logins: List[str],
+    batch_size: int = None,
+    from_days_ago: int = 365,
+    concurrency: int = None,
+    adaptive: bool = None,
+    kind: str = "full",
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Fetch user data with several batches in flight at once.
+
+    Same batching and return value as fetch_users_batch, but up to
+    `concurrency` GraphQL requests run concurrently. Pacing against the
+    GitHub budget is handled by rate_limiter.scheduler, which every request
+    thread consults before sending.
+
+    Args:
+        logins: List of unique user logins
+        batch_size: Users per batch (default: from config.OPTIMAL_BATCH_SIZE)
+        from_days_ago: Days of contribution history to fetch
+        concurrency: Max batches in flight (default: config.FETCH_CONCURRENCY)
+        adaptive: Size batches with AIMD (default: config.ADAPTIVE_BATCH_SIZE)
+        kind: Batch query kind - "full" (default), "profile" or "calendar"
+
+    Returns:
+        Tuple of (users_list, failed_batches_list)
+    """
+    if batch_size is None:
+        batch_size = config.OPTIMAL_BATCH_SIZE
+    if concurrency is None:
+        concurrency = config.FETCH_CONCURRENCY
+    if adaptive is None:
+        adaptive = config.ADAPTIVE_BATCH_SIZE
+    if response_cache.mode == "replay":
+        # Offline: batch sizes don't matter (per-login cache), keep the saved state
+        adaptive = False
+    concurrency = max(1, concurrency)
+
+    sizer = _make_sizer(batch_size, kind) if adaptive else None
+
+    print(f"\n{'='*70}")
+    print(f"📍 PHASE 2: Fetching {BATCH_KIND_LABELS[kind]} (concurrent)")
+    print(f"{'='*70}\n")
+    print(f"Unique users to fetch: {len(logins)}")
+    if sizer:
+        print(
+            f"Batch size: {sizer.size} users (adaptive {sizer.min_size}-{sizer.max_size})"
+        )
+    else:
+        print(f"Batch size: {batch_size} users")
+    print(f"Concurrency: {concurrency} batches in flight")
+    print(f"Contribution window: {from_days_ago} days\n")
+
+    from_iso, to_iso = get_contribution_window(from_days_ago)
+
+    # Workers take the next slice of logins from a shared cursor, so the
+    # slice size can follow the adaptive controller while batches are in flight
+    cursor = {"start": 0, "batch_num": 0}
+    results = []
+
+    def next_batch():
+        start_idx = cursor["start"]
+        if start_idx >= len(logins):
+            return None
+        size = sizer.size if sizer else batch_size
+        batch_logins = logins[start_idx : start_idx + size]
+        cursor["start"] += len(batch_logins)
+        cursor["batch_num"] += 1
+        return cursor["batch_num"], start_idx, batch_logins
+
+    async def worker():
+        while True:
+            batch = next_batch()
+            if batch is None:
+                return
+            batch_num, start_idx, batch_logins = batch
+
+            try:
+                batch_users, rate_limit = await asyncio.to_thread(
+                    fetch_batch, batch_logins, from_iso, to_iso, kind
+                )
+            except CacheMissError:
+                raise
+            except Exception as e:
+                print(f"Batch {batch_num}: ❌ Failed: {e}")
+                if sizer and sizer.record_failure(str(e)):
+                    print(
+                        f"   ⚠️  Query too complex - batch size reduced to {sizer.size}"
+                    )
+                results.append((start_idx, batch_num, batch_logins, None, None, str(e)))
+                continue
+
+            if sizer:
+                sizer.record_success(len(batch_logins))
+
+            remaining = rate_limit["remaining"]
+            print(
+                f"Batch {batch_num}: ✅ Got "
+                f"{len(batch_users)}/{len(batch_logins)} users "
+                f"(Cost: {rate_limit['cost']} pt, Remaining: {remaining} pts)"
+            )
+            results.append(
+                (start_idx, batch_num, batch_logins, batch_users, rate_limit, None)
+            )
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    # Reassemble in login order so output matches the serial fetcher
+    all_users = []
+    failed_batches = []
+    total_cost = 0
+    for _, batch_num, batch_logins, batch_users, rate_limit, error in sorted(
+        results, key=lambda r: r[0]
+    ):
+        if error is not None:
+            failed_batches.append(
+                {
+                    "batch_num": batch_num,
+                    "logins": batch_logins,
+                    "error": error,
+                    "kind": kind,
+                }
+            )
+            continue
+        all_users.extend(batch_users)
+        total_cost += rate_limit["cost"]
+
+    if sizer:
+        sizer.save()
+        print(f"\n📐 Adaptive batch size converged on {sizer.converged_size} users")
+
+    print_fetch_summary(
+        len(results), failed_batches, len(all_users), len(logins), total_cost
+    )
+
     return all_users, failed_batches
 
 
+def fetch_users_concurrent(
+    logins: List[str],
+    batch_size: int = None,
+    from_days_ago: int = 365,
+    concurrency: int = None,
+    adaptive: bool = None,
+    kind: str = "full",
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Synchronous entry point for fetch_users_batch_async.
+
+    Drop-in replacement for fetch_users_batch (same arguments and return
+    value) that can be called from regular code such as run_workflow.
+    """
+    return asyncio.run(
+        fetch_users_batch_async(
+            logins,
+            batch_size=batch_size,
+            from_days_ago=from_days_ago,
+            concurrency=concurrency,
+            adaptive=adaptive,
+            kind=kind,
+        )
+    )
+
+
 # ============================================================================
 # Retry Failed Batches (Optional)
 # ============================================================================
@@ -533,21 +1232,266 @@ def retry_failed_batches(
     )
     print(f"{'='*70}\n")
 
-    # Collect all logins from failed batches
-    all_failed_logins = []
+    # Collect all logins from failed batches (per query kind)
+    failed_logins_by_kind = {}
     for fb in failed_batches:
-        all_failed_logins.extend(fb["logins"])
+        failed_logins_by_kind.setdefault(fb.get("kind", "full"), []).extend(
+            fb["logins"]
+        )
 
     # Retry with smaller batch size
-    recovered_users, still_failed = fetch_users_batch(
-        all_failed_logins, batch_size=reduced_batch_size, from_days_ago=from_days_ago
-    )
+    recovered_users = []
+    for kind, failed_logins in failed_logins_by_kind.items():
+        kind_recovered, still_failed = fetch_users_batch(
+            failed_logins,
+            batch_size=reduced_batch_size,
+            from_days_ago=from_days_ago,
+            adaptive=False,
+            kind=kind,
+        )
+        recovered_users.extend(kind_recovered)
 
-    print(f"✅ Recovered {len(recovered_users)}/{len(all_failed_logins)} users\n")
+    total_failed = sum(len(logins) for logins in failed_logins_by_kind.values())
+    print(f"✅ Recovered {len(recovered_users)}/{total_failed} users\n")
 
     return recovered_users
 
 
+def bisect_failed_batches(
+    failed_batches: List[Dict], from_days_ago: int = 365
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Recover failed batches by splitting them in half until the bad logins
+    are isolated.
+
+    A single pathological user (huge calendar, renamed or suspended account)
+    makes every batch containing it fail. Each failed batch is split in two
+    and both halves are retried; halves that fail again are split further.
+    A login that fails on its own is retried once more after
+    RETRY_BASE_DELAY seconds (unless it hit a resource limit, which would
+    fail again), so a transient error does not quarantine a healthy user.
+    A login that still fails is quarantined together with its error
+    message. Isolating k bad logins out of n costs O(k log n) requests.
+
+    Args:
+        failed_batches: List of failed batch info from fetch_users_batch
+        from_days_ago: Days of contribution history
+
+    Returns:
+        Tuple of (recovered_users, quarantine) where quarantine is a list of
+        {"login", "error"} dicts for logins that could not be fetched
+    """
+    if not failed_batches:
+        return [], []
+
+    total_logins = sum(len(fb["logins"]) for fb in failed_batches)
+
+    print(f"\n{'='*70}")
+    print(f"🔄 Bisecting {len(failed_batches)} failed batches ({total_logins} users)")
+    print(f"{'='*70}\n")
+
+    from_iso, to_iso = get_contribution_window(from_days_ago)
+
+    recovered_users = []
+    quarantine = []
+    stats = {"requests": 0}
+
+    def attempt(batch_logins: List[str], kind: str, indent: str):
+        """Fetch a group of logins; returns the error message if it failed."""
+        stats["requests"] += 1
+        try:
+            batch_users, _ = fetch_batch(batch_logins, from_iso, to_iso, kind)
+        except CacheMissError:
+            raise
+        except Exception as e:
+            return str(e)
+
+        print(f"{indent}✅ Recovered {len(batch_users)}/{len(batch_logins)} users")
+        recovered_users.extend(batch_users)
+        return None
+
+    def bisect(batch_logins: List[str], error: str, kind: str, depth: int):
+        indent = "   " * depth
+        if len(batch_logins) == 1:
+            login = batch_logins[0]
+            if not is_resource_limit_error(error):
+                # One more try on its own in case the error was transient
+                print(f"{indent}🔁 Retrying {login} in {config.RETRY_BASE_DELAY}s")
+                time.sleep(config.RETRY_BASE_DELAY)
+                retry_error = attempt(batch_logins, kind, indent)
+                if retry_error is None:
+                    return
+                error = retry_error
+            print(f"{indent}🚫 Quarantined {login}: {error[:60]}")
+            quarantine.append({"login": login, "error": error})
+            return
+
+        mid = len(batch_logins) // 2
+        for half in (batch_logins[:mid], batch_logins[mid:]):
+            half_error = attempt(half, kind, indent)
+            if half_error is not None:
+                print(f"{indent}❌ {len(half)} users failed - splitting")
+                bisect(half, half_error, kind, depth + 1)
+
+    for fb in failed_batches:
+        print(f"Batch {fb['batch_num']} ({len(fb['logins'])} users):")
+        bisect(fb["logins"], fb["error"], fb.get("kind", "full"), 1)
+
+    print(f"\n{'─'*70}")
+    print(f"📊 Bisection Summary:")
+    print(f"   Requests made: {stats['requests']}")
+    print(f"   Users recovered: {len(recovered_users)}/{total_logins}")
+    print(f"   Users quarantined: {len(quarantine)}")
+    print(f"{'─'*70}\n")
+
+    return recovered_users, quarantine
+
+
+def recover_failed_batches(
+    failed_batches: List[Dict], from_days_ago: int = 365
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Retry failed batches with the strategy set in config.RETRY_STRATEGY.
+
+    Args:
+        failed_batches: List of failed batch info from fetch_users_batch
+        from_days_ago: Days of contribution history
+
+    Returns:
+        Tuple of (recovered_users, quarantine). With the "flat" strategy the
+        quarantine lists every login that was not recovered.
+    """
+    if not failed_batches:
+        return [], []
+
+    if config.RETRY_STRATEGY == "bisect":
+        return bisect_failed_batches(failed_batches, from_days_ago=from_days_ago)
+
+    recovered_users = retry_failed_batches(
+        failed_batches, from_days_ago=from_days_ago, reduced_batch_size=10
+    )
+    recovered_logins = {user["login"].lower() for user in recovered_users}
+    quarantine = [
+        {"login": login, "error": fb["error"]}
+        for fb in failed_batches
+        for login in fb["logins"]
+        if login.lower() not in recovered_logins
+    ]
+    return recovered_users, quarantine
+
+
+# ============================================================================
+# Two-Pass Fetch: Cheap profiles first, calendars only for survivors
+# ============================================================================
+
+
+def passes_prefilter(user: Dict) -> bool:
+    """
+    Cheap pre-filter applied to profile-pass users before fetching calendars.
+
+    Uses only fields from the profile pass: followers, public repos and the
+    yearly contribution total. Users failing it could never pass the
+    MIN_CONTRIBUTIONS_REQUIRED filter in rank_users, so their expensive
+    calendar is never requested.
+    """
+    followers = user.get("followers", {}).get("totalCount", 0)
+    repos = user.get("repositories", {}).get("totalCount", 0)
+    contributions = (
+        user.get("contributionsCollection", {})
+        .get("contributionCalendar", {})
+        .get("totalContributions", 0)
+    )
+    return (
+        followers >= config.PREFILTER_MIN_FOLLOWERS
+        and repos >= config.PREFILTER_MIN_REPOS
+        and contributions >= config.MIN_CONTRIBUTIONS_REQUIRED
+    )
+
+
+def fetch_users_two_pass(
+    logins: List[str],
+    from_days_ago: int = 365,
+    async_fetch: bool = False,
+    concurrency: int = None,
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Fetch users in two passes so calendars are only paid for where they matter.
+
+    Pass 1 fetches profiles, repositories and the yearly contribution total
+    in large batches (config.REPOSITORIES_BATCH_SIZE). Users failing
+    passes_prefilter are dropped. Pass 2 fetches the 365-day contribution
+    calendar only for the remaining users (config.CONTRIBUTIONS_BATCH_SIZE)
+    and merges it into their profiles. Failed batches of both passes are
+    recovered with recover_failed_batches.
+
+    Args:
+        logins: List of unique user logins
+        from_days_ago: Days of contribution history to fetch
+        async_fetch: Keep several batches in flight (fetch_users_concurrent)
+        concurrency: Batches in flight when async_fetch is on
+
+    Returns:
+        Tuple of (users_list, quarantine) - users have the same shape as
+        single-pass "full" batches; quarantine lists logins that could not
+        be fetched in either pass
+    """
+
+    def fetch(batch_logins: List[str], batch_size: int, kind: str):
+        if async_fetch:
+            return fetch_users_concurrent(
+                batch_logins,
+                batch_size=batch_size,
+                from_days_ago=from_days_ago,
+                concurrency=concurrency,
+                kind=kind,
+            )
+        return fetch_users_batch(
+            batch_logins, batch_size=batch_size, from_days_ago=from_days_ago, kind=kind
+        )
+
+    # Pass 1: cheap profile data for everyone
+    profiles, failed_batches = fetch(logins, config.REPOSITORIES_BATCH_SIZE, "profile")
+    recovered, quarantine = recover_failed_batches(failed_batches, from_days_ago)
+    profiles.extend(recovered)
+
+    candidates = [user for user in profiles if passes_prefilter(user)]
+    print(f"🔍 Pre-filter (followers/repos/contributions):")
+    print(f"   Profiles fetched: {len(profiles)}")
+    print(f"   Filtered out: {len(profiles) - len(candidates)}")
+    print(f"   Calendars to fetch: {len(candidates)}\n")
+
+    if not candidates:
+        return [], quarantine
+
+    # Pass 2: expensive contribution calendar only for candidates
+    calendars, failed_batches = fetch(
+        [user["login"] for user in candidates],
+        config.CONTRIBUTIONS_BATCH_SIZE,
+        "calendar",
+    )
+    recovered, calendar_quarantine = recover_failed_batches(
+        failed_batches, from_days_ago
+    )
+    calendars.extend(recovered)
+    quarantine.extend(calendar_quarantine)
+
+    # Merge calendars into profiles (users without a calendar are dropped)
+    calendar_by_login = {
+        cal["login"].lower(): cal["contributionsCollection"] for cal in calendars
+    }
+    users = []
+    for user in candidates:
+        collection = calendar_by_login.get(user["login"].lower())
+        if collection is not None:
+            user["contributionsCollection"] = collection
+            users.append(user)
+
+    print(f"✅ Two-pass fetch: {len(users)} users with full data")
+    print(f"   ({len(profiles) - len(candidates)} calendars skipped by pre-filter)\n")
+
+    return users, quarantine
+
+
 # ============================================================================
 # Save Results
 # ============================================================================
@@ -571,7 +1515,7 @@ def save_users(
     output_path = os.path.join(output_folder, filename)
 
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(users, f, indent=2, ensure_ascii=False)
+        json.dump(users, f, indent=2, ensure_ascii=False, default=json_default)
 
     return output_path
 
@@ -611,15 +1555,14 @@ def main():
     # Phase 2: Fetch full data (uses config.OPTIMAL_BATCH_SIZE by default)
     users, failed_batches = fetch_users_batch(logins)
 
-    # Optional: Retry failed batches with smaller size
+    # Optional: Retry failed batches by bisecting them
+    quarantine = []
     if failed_batches:
         print(f"\n💡 Retrying failed batches? (y/n): ", end="", flush=True)
         # For automation, automatically retry
         retry = True
         if retry:
-            recovered_users = retry_failed_batches(
-                failed_batches, reduced_batch_size=10
-            )
+            recovered_users, quarantine = bisect_failed_batches(failed_batches)
             users.extend(recovered_users)
 
     # Save results
@@ -628,6 +1571,8 @@ def main():
         os.path.dirname(__file__), "..", "..", "data", "raw", timestamp
     )
     output_path = save_users(users, output_folder)
+    if quarantine:
+        save_users(quarantine, output_folder, config.OUTPUT_QUARANTINE_FILE)
 
     # Summary
     print(f"\n{'='*70}")
@@ -0,0 +1,208 @@
+"""
+Shared HTTP client for all GitHub API calls.
+
+Every GraphQL batch and every README used to open its own connection via
+`requests.post` / `requests.get`, paying a fresh TCP + TLS handshake each
+time. This module keeps one pooled, keep-alive `requests.Session` with the
+auth headers set once and gzip enabled, and records per-request timings so
+the effect can be measured (see print_request_stats).
+
+Every request first asks the shared rate_limiter.scheduler for budget and
+reports the `X-RateLimit-*` headers of the response back to it.
+
+Usage:
+    from src.data_collection import github_client
+
+    response = github_client.graphql_post({"query": query}, timeout=60)
+    response = github_client.rest_get(url, headers={"Accept": "..."})
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from src import config
+from src.data_collection.rate_limiter import scheduler
+from src.data_collection.response_cache import response_cache
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class RequestStats:
+    """Thread-safe collector of request durations per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = {}
+
+    def record(self, endpoint: str, duration: float):
+        with self._lock:
+            self._timings.setdefault(endpoint, []).append(duration)
+
+    def count(self) -> int:
+        """Total number of requests recorded."""
+        with self._lock:
+            return sum(len(v) for v in self._timings.values())
+
+    def reset(self):
+        with self._lock:
+            self._timings = {}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize recorded timings.
+
+        Returns:
+            Dict of endpoint -> {count, total, mean, p50, p95, max} (seconds)
+        """
+        with self._lock:
+            timings = {k: sorted(v) for k, v in self._timings.items()}
+
+        result = {}
+        for endpoint, durations in timings.items():
+            count = len(durations)
+            result[endpoint] = {
+                "count": count,
+                "total": sum(durations),
+                "mean": sum(durations) / count,
+                "p50": durations[count // 2],
+                "p95": durations[min(count - 1, int(count * 0.95))],
+                "max": durations[-1],
+            }
+        return result
+
+
+request_stats = RequestStats()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared GitHub session, creating it on first use.
+
+    The session keeps up to config.HTTP_POOL_SIZE keep-alive connections
+    per host, so concurrent fetchers can reuse connections instead of
+    reconnecting.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=config.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=config.HTTP_POOL_SIZE,
+                )
+                session.mount("https://", adapter)
+                session.headers.update(
+                    {
+                        "Authorization": f"Bearer {config.GITHUB_TOKEN}",
+                        "Accept-Encoding": "gzip, deflate",
+                        "User-Agent": "github-sourcing",
+                    }
+                )
+                _session = session
+    return _session
+
+
+def close_session():
+    """Close the shared session and its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _timed_request(endpoint: str, resource: str, method: str, url: str, **kwargs):
+    scheduler.acquire(resource)
+
+    start = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    finally:
+        duration = time.perf_counter() - start
+        request_stats.record(endpoint, duration)
+        if config.VERBOSE:
+            print(f"    ⏱️  {endpoint} {method} {url}: {duration * 1000:.0f} ms")
+
+    scheduler.update_from_headers(response.headers, resource)
+    if response.status_code in (403, 429) and "Retry-After" in response.headers:
+        # Secondary rate limit - hold back every request for this resource
+        scheduler.penalize(resource, float(response.headers["Retry-After"]))
+    return response
+
+
+def graphql_post(payload: Dict, timeout: int = None) -> requests.Response:
+    """
+    POST a GraphQL payload ({"query": ..., "variables": ...}) to GitHub.
+
+    Args:
+        payload: GraphQL request body
+        timeout: Request timeout in seconds (default: config.REQUEST_TIMEOUT)
+
+    Returns:
+        requests.Response
+    """
+    if timeout is None:
+        timeout = config.REQUEST_TIMEOUT
+    return _timed_request(
+        "graphql", "graphql", "POST", config.GRAPHQL_URL, json=payload, timeout=timeout
+    )
+
+
+def rest_get(
+    url: str, headers: Optional[Dict] = None, timeout: int = None, **kwargs
+) -> requests.Response:
+    """
+    GET a GitHub REST API URL.
+
+    Args:
+        url: Full URL or path relative to config.REST_API_BASE
+        headers: Extra headers for this request (e.g. Accept media type)
+        timeout: Request timeout in seconds (default: config.REQUEST_TIMEOUT)
+        **kwargs: Passed through to requests (e.g. stream=True)
+
+    Returns:
+        requests.Response
+    """
+    if timeout is None:
+        timeout = config.REQUEST_TIMEOUT
+    if not url.startswith("http"):
+        url = f"{config.REST_API_BASE}/{url.lstrip('/')}"
+    return _timed_request(
+        "rest", "core", "GET", url, headers=headers, timeout=timeout, **kwargs
+    )
+
+
+def print_request_stats():
+    """Print per-endpoint request timings collected so far."""
+    summary = request_stats.summary()
+    cache_stats = response_cache.stats()
+    if response_cache.enabled and (cache_stats["hits"] or cache_stats["misses"]):
+        print(f"\n💾 Response cache ({response_cache.mode}):")
+        print(f"  • {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    if not summary:
+        return
+
+    print(f"\n🌐 HTTP Request Timings (pooled session):")
+    for endpoint, stats in summary.items():
+        print(
+            f"  • {endpoint}: {stats['count']} requests, "
+            f"total {stats['total']:.1f}s, mean {stats['mean'] * 1000:.0f} ms, "
+            f"p50 {stats['p50'] * 1000:.0f} ms, p95 {stats['p95'] * 1000:.0f} ms"
+        )
+    if scheduler.total_wait > 0:
+        print(f"  • Waited for rate-limit budget: {scheduler.total_wait:.1f}s")
+    for resource, budget in scheduler.status().items():
+        if budget["remaining"] is not None:
+            print(
+                f"  • {resource} budget remaining: {budget['remaining']}/{budget['limit']}"
+            )
@@ -0,0 +1,194 @@
+"""
+Rate-limit budget scheduler for GitHub API calls.
+
+Replaces the fixed sleeps between requests with pacing driven by the
+budget GitHub reports on every response:
+
+- GraphQL: the `rateLimit { cost remaining resetAt }` block of each query
+- GraphQL + REST: the `X-RateLimit-*` response headers
+
+While plenty of budget is left, requests go out at full speed. Once the
+remaining points of a resource drop below RATE_LIMIT_PACE_BELOW, requests
+are spread evenly over the time left until the reset, and once only
+RATE_LIMIT_MIN_REMAINING points are left they wait for the reset itself.
+
+All GitHub calls go through github_client, which calls `acquire` before and
+`update_from_headers` after every request, so callers don't sleep manually.
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from src import config
+
+
+class _Budget:
+    """Last known budget of one rate-limit resource ("graphql", "core", ...)."""
+
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None  # Epoch seconds
+        self.avg_cost = 1.0  # Moving average of observed cost per request
+        self.next_slot = 0.0  # Epoch seconds before which nothing is granted
+
+
+class RateLimitScheduler:
+    """Thread-safe token-bucket style scheduler over GitHub rate-limit budgets."""
+
+    def __init__(self, pace_below: int = None, min_remaining: int = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            pace_below: Start pacing below this many remaining points
+                (default: config.RATE_LIMIT_PACE_BELOW)
+            min_remaining: Wait for the reset below this many remaining points
+                (default: config.RATE_LIMIT_MIN_REMAINING)
+        """
+        self.pace_below = (
+            pace_below if pace_below is not None else config.RATE_LIMIT_PACE_BELOW
+        )
+        self.min_remaining = (
+            min_remaining
+            if min_remaining is not None
+            else config.RATE_LIMIT_MIN_REMAINING
+        )
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, _Budget] = {}
+        self.total_wait = 0.0
+
+    def _budget(self, resource: str) -> _Budget:
+        if resource not in self._budgets:
+            self._budgets[resource] = _Budget()
+        return self._budgets[resource]
+
+    def acquire(self, resource: str, cost: float = None) -> float:
+        """
+        Block until a request against `resource` may be sent.
+
+        Args:
+            resource: Rate-limit resource ("graphql" or "core" for REST)
+            cost: Expected cost in points (default: moving average of observed costs)
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            budget = self._budget(resource)
+            now = time.time()
+
+            if budget.reset_at is not None and now >= budget.reset_at:
+                # Window rolled over - the old numbers no longer apply
+                budget.remaining = budget.limit
+                budget.reset_at = None
+
+            if budget.remaining is None:
+                grant = max(now, budget.next_slot)
+            else:
+                if cost is None:
+                    cost = budget.avg_cost
+                usable = budget.remaining - self.min_remaining
+
+                if budget.remaining > self.pace_below:
+                    # Plenty of budget left - full speed
+                    grant = max(now, budget.next_slot)
+                elif usable < cost and budget.reset_at is not None:
+                    # Exhausted - wait for the reset, then start from a full budget
+                    grant = max(now, budget.next_slot, budget.reset_at + 1)
+                    budget.next_slot = grant
+                    budget.remaining = budget.limit
+                    budget.reset_at = None
+                elif budget.reset_at is not None:
+                    # Running low - spread what's left evenly until the reset
+                    interval = (budget.reset_at - now) / max(1.0, usable / cost)
+                    grant = max(now, budget.next_slot)
+                    budget.next_slot = grant + interval
+                else:
+                    grant = max(now, budget.next_slot)
+
+                if budget.remaining is not None:
+                    budget.remaining -= cost
+
+            wait = grant - now
+
+        if wait > 0:
+            if wait >= 5 or config.VERBOSE:
+                print(f"   ⏳ Rate limit ({resource}): waiting {wait:.1f}s for budget")
+            time.sleep(wait)
+            with self._lock:
+                self.total_wait += wait
+        return max(0.0, wait)
+
+    def update_from_headers(self, headers, resource: str = None):
+        """
+        Update the budget from `X-RateLimit-*` response headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            resource: Resource name if the header doesn't say (default: "core")
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        resource = headers.get("X-RateLimit-Resource") or resource or "core"
+
+        with self._lock:
+            budget = self._budget(resource)
+            budget.remaining = int(remaining)
+            if headers.get("X-RateLimit-Limit") is not None:
+                budget.limit = int(headers["X-RateLimit-Limit"])
+            if headers.get("X-RateLimit-Reset") is not None:
+                budget.reset_at = float(headers["X-RateLimit-Reset"])
+
+    def update_from_graphql(self, rate_limit: Optional[Dict]):
+        """
+        Update the GraphQL budget from a `rateLimit { cost remaining resetAt }` block.
+
+        Args:
+            rate_limit: The rateLimit dict from a GraphQL response (may be None)
+        """
+        if not rate_limit or rate_limit.get("remaining") is None:
+            return
+
+        with self._lock:
+            budget = self._budget("graphql")
+            budget.remaining = int(rate_limit["remaining"])
+            if rate_limit.get("limit") is not None:
+                budget.limit = int(rate_limit["limit"])
+            if rate_limit.get("resetAt"):
+                reset_time = datetime.fromisoformat(
+                    rate_limit["resetAt"].replace("Z", "+00:00")
+                )
+                budget.reset_at = reset_time.timestamp()
+            if rate_limit.get("cost") is not None:
+                budget.avg_cost = 0.8 * budget.avg_cost + 0.2 * float(
+                    rate_limit["cost"]
+                )
+
+    def penalize(self, resource: str, seconds: float):
+        """Hold back all requests for `resource` (e.g. after Retry-After)."""
+        with self._lock:
+            budget = self._budget(resource)
+            budget.next_slot = max(budget.next_slot, time.time() + seconds)
+
+    def status(self) -> Dict[str, Dict]:
+        """Return the last known budget per resource."""
+        with self._lock:
+            return {
+                resource: {
+                    "limit": budget.limit,
+                    "remaining": budget.remaining,
+                    "reset_at": budget.reset_at,
+                }
+                for resource, budget in self._budgets.items()
+            }
+
+
+scheduler = RateLimitScheduler()
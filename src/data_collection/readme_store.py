@@ -0,0 +1,275 @@
+"""
+Content-addressed README store shared across users and runs.
+
+Phase 3 files used to embed the full README text in every repository node,
+repeated in every run folder (and once per fork or template copy). READMEs
+are now written once to README_STORE_DIR as gzip blobs named by the SHA-256
+of their text, and repository nodes only carry a reference:
+
+    {"name": "repo", ..., "readme_ref": "sha256:3f2a..."}
+
+The normalized prose version (see processing/readme_normalize.py) is kept
+the same way as `readme_clean_ref`.
+
+Readers call get_readme(repo), which prefers the normalized text, resolves
+references lazily (with a small LRU cache) and still accepts the inline
+`readme` field of older files.
+
+Usage:
+    from src.data_collection.readme_store import get_readme, has_readme
+
+    text = get_readme(repo)
+
+Files with references only work where README_STORE_DIR is available. The
+web app and copied run folders need either the store directory or a
+self-contained file with the READMEs inline again (inline_readmes).
+
+Convert an older phase3 file in place:
+    python -m src.data_collection.readme_store data/raw/<run>/phase3_top_50_with_readmes.json
+
+Write a self-contained copy (READMEs inline) for the web app or another machine:
+    python -m src.data_collection.readme_store --inline data/raw/<run>/phase3_top_50_with_readmes.json [output.json]
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from src import config
+from src.processing.records import Repo
+
+REF_PREFIX = "sha256:"
+
+
+class ReadmeStore:
+    """Blob store of README texts keyed by their SHA-256."""
+
+    def __init__(self, root: str = None):
+        """
+        Initialize the store.
+
+        Args:
+            root: Store directory (default: config.README_STORE_DIR)
+        """
+        self.root = root or config.README_STORE_DIR
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}.txt.gz")
+
+    def put(self, text: str) -> str:
+        """
+        Store a README (once per distinct text) and return its reference.
+
+        Args:
+            text: README text
+
+        Returns:
+            Reference string "sha256:<hex>"
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        path = self._path(digest)
+        if not os.path.isfile(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file first so concurrent writers never clash
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8", newline="") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        return REF_PREFIX + digest
+
+    def contains(self, ref: str) -> bool:
+        """Return True if the blob for a reference exists."""
+        if not ref or not ref.startswith(REF_PREFIX):
+            return False
+        return os.path.isfile(self._path(ref[len(REF_PREFIX) :]))
+
+    def get(self, ref: str) -> Optional[str]:
+        """Return the README text for a reference (None if the blob is missing)."""
+        if not ref or not ref.startswith(REF_PREFIX):
+            return None
+        path = self._path(ref[len(REF_PREFIX) :])
+        if not os.path.isfile(path):
+            return None
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            return f.read()
+
+
+readme_store = ReadmeStore()
+
+
+@lru_cache(maxsize=512)
+def _load_ref(ref: str) -> Optional[str]:
+    return readme_store.get(ref)
+
+
+def _field_text(repo: Union[Repo, Dict], field: str) -> Optional[str]:
+    if isinstance(repo, Repo):
+        if getattr(repo, field) is not None:
+            return getattr(repo, field)
+        ref = getattr(repo, f"{field}_ref")
+        return (_load_ref(ref) or "") if ref else None
+    if field in repo:
+        return repo[field]
+    if repo.get(f"{field}_ref"):
+        return _load_ref(repo[f"{field}_ref"]) or ""
+    return None
+
+
+def get_readme(repo: Union[Repo, Dict], raw: bool = False) -> str:
+    """
+    Return a repository's README text ("" if it has none).
+
+    Accepts both `*_ref` fields (resolved from the store) and the inline
+    `readme` field of phase3 files written before the store existed.
+
+    Args:
+        repo: Repository node (dict or Repo record)
+        raw: Prefer the raw README over the normalized `readme_clean`
+            (either falls back to the other when only one was kept)
+    """
+    if not repo:
+        return ""
+    fields = ("readme", "readme_clean") if raw else ("readme_clean", "readme")
+    for field in fields:
+        text = _field_text(repo, field)
+        if text is not None:
+            return text
+    return ""
+
+
+def has_readme(repo: Union[Repo, Dict]) -> bool:
+    """
+    Return True if a repository has non-blank README content.
+
+    References are only created for non-blank READMEs, so this never has to
+    load a blob.
+    """
+    if not repo:
+        return False
+    if isinstance(repo, Repo):
+        for field in ("readme_clean", "readme"):
+            text = getattr(repo, field)
+            if text is not None:
+                return bool(text.strip())
+            if getattr(repo, f"{field}_ref"):
+                return True
+        return False
+    for field in ("readme_clean", "readme"):
+        if field in repo:
+            return bool(repo[field] and repo[field].strip())
+        if repo.get(f"{field}_ref"):
+            return True
+    return False
+
+
+def attach_readme(repo: Dict, text: str, field: str = "readme"):
+    """
+    Attach a README to a repository node.
+
+    Non-blank READMEs go to the store (config.README_STORE_ENABLED) and the
+    node keeps only `<field>_ref`; blank ones stay inline so has_readme never
+    needs to resolve a reference.
+
+    Args:
+        repo: Repository node
+        text: README text
+        field: "readme" (raw) or "readme_clean" (normalized)
+    """
+    if config.README_STORE_ENABLED and text.strip():
+        repo.pop(field, None)
+        repo[f"{field}_ref"] = readme_store.put(text)
+    else:
+        repo.pop(f"{field}_ref", None)
+        repo[field] = text
+
+
+def externalize_readmes(users: List[Dict]) -> int:
+    """
+    Move inline READMEs (raw and normalized) of a user list into the store.
+
+    Returns:
+        Number of READMEs moved
+    """
+    moved = 0
+    for user in users:
+        for repo in (user.get("repositories") or {}).get("nodes") or []:
+            if not repo:
+                continue
+            for field in ("readme", "readme_clean"):
+                if repo.get(field) and repo[field].strip():
+                    repo[f"{field}_ref"] = readme_store.put(repo.pop(field))
+                    moved += 1
+    return moved
+
+
+def inline_readmes(users: List[Dict]) -> Tuple[int, int]:
+    """
+    Replace README references of a user list with the README text.
+
+    Returns:
+        (inlined, missing): references resolved, and references whose blob
+        is not in the store (kept as they are)
+    """
+    inlined = 0
+    missing = 0
+    for user in users:
+        for repo in (user.get("repositories") or {}).get("nodes") or []:
+            if not repo:
+                continue
+            for field in ("readme", "readme_clean"):
+                ref = repo.get(f"{field}_ref")
+                if not ref:
+                    continue
+                text = readme_store.get(ref)
+                if text is None:
+                    missing += 1
+                    continue
+                del repo[f"{field}_ref"]
+                repo[field] = text
+                inlined += 1
+    return inlined, missing
+
+
+def _save_users(users: List[Dict], path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            users, f, indent=config.JSON_INDENT, ensure_ascii=config.JSON_ENSURE_ASCII
+        )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    inline = "--inline" in args
+    args = [arg for arg in args if arg != "--inline"]
+    if not args:
+        print(
+            "Usage: python -m src.data_collection.readme_store [--inline] <phase3_json_file> [output_file]"
+        )
+        sys.exit(1)
+
+    input_file = args[0]
+    output_file = args[1] if len(args) > 1 else input_file
+    with open(input_file, "r", encoding="utf-8") as f:
+        users = json.load(f)
+
+    size_before = os.path.getsize(input_file)
+    if inline:
+        inlined, missing = inline_readmes(users)
+        _save_users(users, output_file)
+        print(f"✅ Inlined {inlined} READMEs from {readme_store.root}")
+        if missing:
+            print(f"⚠️  {missing} README blobs not found (references kept)")
+    else:
+        moved = externalize_readmes(users)
+        _save_users(users, output_file)
+        print(f"✅ Moved {moved} READMEs to {readme_store.root}")
+    print(
+        f"   {output_file}: {size_before / 1e6:.1f} MB -> {os.path.getsize(output_file) / 1e6:.1f} MB"
+    )
@@ -0,0 +1,168 @@
+"""
+Disk-backed cache for GitHub API responses.
+
+Reruns of the workflow (e.g. after changing ranking weights or top-N) used to
+re-fetch identical search pages, user batches and READMEs. Successful
+responses are now stored under CACHE_DIR, keyed by a SHA-256 of the endpoint,
+the query text and the variables, and reused until their per-endpoint TTL
+(RESPONSE_CACHE_TTL) expires. Batched user queries are stored per login
+(see fetch_users._user_cache_key), so batch boundaries and calendar dates do
+not have to match between the recording and the replay.
+
+Modes (config.RESPONSE_CACHE_MODE, or --cache in workflow.py):
+
+- "off":    no caching (default)
+- "on":     serve fresh entries from disk, fetch and store everything else
+- "replay": strict offline mode - serve every entry regardless of age and
+            raise CacheMissError instead of calling the API
+
+Usage:
+    from src.data_collection.response_cache import response_cache
+
+    cached = response_cache.get("users", query, variables)
+    if cached is None:
+        result = ...  # call the API
+        response_cache.put("users", query, variables, result)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from src import config
+
+CACHE_MODES = ("off", "on", "replay")
+
+
+class CacheMissError(Exception):
+    """Raised in replay mode when a response is not in the cache."""
+
+
+class ResponseCache:
+    """Thread-safe on-disk cache of API responses, one JSON file per entry."""
+
+    def __init__(self, cache_dir: str = None, mode: str = None, ttls: Dict = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: config.CACHE_DIR)
+            mode: "off", "on" or "replay" (default: config.RESPONSE_CACHE_MODE)
+            ttls: Endpoint -> TTL in seconds (default: config.RESPONSE_CACHE_TTL)
+        """
+        self.cache_dir = cache_dir or config.CACHE_DIR
+        self.ttls = ttls if ttls is not None else config.RESPONSE_CACHE_TTL
+        self.mode = "off"
+        self.set_mode(mode or config.RESPONSE_CACHE_MODE)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def set_mode(self, mode: str):
+        """Switch between "off", "on" and "replay"."""
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Cache mode must be one of {CACHE_MODES}, got {mode!r}")
+        self.mode = mode
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @staticmethod
+    def make_key(endpoint: str, query: str, variables: Optional[Dict] = None) -> str:
+        """Hash endpoint, query text and variables into a cache key."""
+        material = json.dumps(
+            [endpoint, query, variables or {}], sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, endpoint: str, key: str) -> str:
+        return os.path.join(self.cache_dir, endpoint, key[:2], f"{key}.json")
+
+    def get(
+        self, endpoint: str, query: str, variables: Optional[Dict] = None
+    ) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            endpoint: Endpoint label ("search", "users", "readme", ...)
+            query: Query text or URL
+            variables: Query variables (optional)
+
+        Returns:
+            The cached response, or None on a miss (or when the cache is off)
+
+        Raises:
+            CacheMissError: On a miss in replay mode
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(endpoint, query, variables)
+        path = self._path(endpoint, key)
+        entry = None
+        if os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+
+        if entry is not None and self.mode != "replay":
+            ttl = self.ttls.get(endpoint, self.ttls.get("default", 0))
+            if time.time() - entry.get("stored_at", 0) > ttl:
+                entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if entry is None:
+            if self.mode == "replay":
+                raise CacheMissError(
+                    f"Replay mode: no cached {endpoint} response for key {key[:12]}"
+                )
+            return None
+        return entry["response"]
+
+    def put(
+        self,
+        endpoint: str,
+        query: str,
+        variables: Optional[Dict],
+        response: Any,
+    ):
+        """Store a response (no-op when the cache is off or in replay mode)."""
+        if self.mode != "on":
+            return
+
+        key = self.make_key(endpoint, query, variables)
+        path = self._path(endpoint, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temp file first so concurrent readers never see half a file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"endpoint": endpoint, "stored_at": time.time(), "response": response},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, path)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counts since start."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,110 @@
+"""
+Compact contribution-calendar representation.
+
+GitHub returns the 365-day contribution calendar as ~52 `weeks` of 7
+`contributionDays` dicts, each with a date string - about 365 small dicts
+per user. On arrival the fetcher converts it to:
+
+    {
+        "totalContributions": 1234,
+        "startDate": "2024-10-13",       # date of dailyCounts[0]
+        "dailyCounts": array("H", [...]) # one count per day, oldest first
+    }
+
+Counts are packed into an unsigned 16-bit array (clamped at 65535). Saved
+phase files store dailyCounts as a plain JSON list (see json_default).
+
+Phase files written before this change still carry `weeks`;
+compact_user_calendar converts them in place, so readers only ever see the
+compact form.
+"""
+
+from array import array
+from datetime import date
+from typing import Dict, Optional, Sequence
+
+MAX_DAILY_COUNT = 65535  # Largest value an array("H") item can hold
+
+
+def compact_calendar(calendar: Dict) -> Dict:
+    """
+    Convert a GitHub `contributionCalendar` dict to the compact form.
+
+    Calendars without `weeks` (e.g. the yearly total from the profile pass)
+    and calendars already in compact form are returned unchanged.
+
+    Args:
+        calendar: contributionCalendar dict as returned by GitHub
+
+    Returns:
+        Compact calendar dict
+    """
+    if "weeks" not in calendar:
+        return calendar
+
+    days = [
+        (day["date"], day.get("contributionCount", 0))
+        for week in calendar.get("weeks") or []
+        for day in week.get("contributionDays") or []
+        if day.get("date")
+    ]
+
+    compact = {"totalContributions": calendar.get("totalContributions", 0)}
+    if not days:
+        compact["startDate"] = None
+        compact["dailyCounts"] = array("H")
+        return compact
+
+    days.sort()
+    start = date.fromisoformat(days[0][0])
+    end = date.fromisoformat(days[-1][0])
+
+    # Index by date offset so a missing day can never shift later counts
+    counts = array("H", bytes(2 * ((end - start).days + 1)))
+    for day_str, count in days:
+        offset = (date.fromisoformat(day_str) - start).days
+        counts[offset] = max(0, min(MAX_DAILY_COUNT, count))
+
+    compact["startDate"] = start.isoformat()
+    compact["dailyCounts"] = counts
+    return compact
+
+
+def compact_user_calendar(user: Dict) -> Optional[Dict]:
+    """
+    Return a user's compact calendar, converting an old `weeks` calendar in place.
+
+    Args:
+        user: User dictionary (phase 1/2/3 record)
+
+    Returns:
+        Compact calendar dict, or None if the user has no calendar
+    """
+    collection = user.get("contributionsCollection") or {}
+    calendar = collection.get("contributionCalendar")
+    if calendar is None:
+        return None
+    if "weeks" in calendar:
+        calendar = compact_calendar(calendar)
+        collection["contributionCalendar"] = calendar
+    return calendar
+
+
+def daily_counts(user: Dict) -> Sequence[int]:
+    """
+    Daily contribution counts of a user, oldest day first.
+
+    Returns an array("H") for freshly fetched users and a list for users
+    loaded from a saved phase file; both support len(), slicing and sum().
+    """
+    calendar = compact_user_calendar(user)
+    if not calendar:
+        return ()
+    return calendar.get("dailyCounts") or ()
+
+
+def json_default(obj):
+    """`default=` hook for json.dump that writes packed arrays as lists."""
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,214 @@
+"""
+Metric matrix: the ranking inputs of every user, for interactive re-ranking.
+
+calculate_user_score is a weighted sum of six components, each normalized to
+0-100 with a threshold from config.SCORING_THRESHOLDS:
+
+    followers      min(100, followers / thresholds["followers"] * 100)
+    contributions  min(100, contributions / thresholds["contributions"] * 100)
+    stars          min(100, total stars / thresholds["stars"] * 100)
+    repos          min(100, repo count / thresholds["repos"] * 100)
+    activity       min(100, last 30 days / thresholds["activity_30_days"] * 100)
+    trend          calculate_trend_score (already 0-100)
+
+A MetricMatrix keeps the raw values (users x 6, before thresholding) and the
+normalized components, so new weights are a single matrix-vector product and
+new thresholds only re-normalize the raw columns - no rerun of rank_users.
+Workflow Phase 2 saves it as phase2_metric_matrix.npz for all ranked users.
+
+Scores are identical to calculate_user_score: the product is summed column by
+column in the same order, and rounding matches Python's round().
+
+Usage:
+    from src.processing.metric_matrix import MetricMatrix
+
+    matrix = MetricMatrix.load("data/raw/<run>/phase2_metric_matrix.npz")
+    top = matrix.rerank({"stars": 0.5, "followers": 0.5}, top_n=100)
+"""
+
+import os
+import sys
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src import config
+from src.processing.rank_users import calculate_trend_score, user_login
+from src.processing.rank_vectorized import last_days_sum, round2
+from src.processing.records import User
+from src.processing.user_features import user_features
+
+COMPONENTS = ("followers", "contributions", "stars", "repos", "activity", "trend")
+
+# Component -> key in config.SCORING_THRESHOLDS (trend is not thresholded)
+THRESHOLD_KEYS = {
+    "followers": "followers",
+    "contributions": "contributions",
+    "stars": "stars",
+    "repos": "repos",
+    "activity": "activity_30_days",
+}
+
+
+def threshold_vector(thresholds: Dict = None) -> np.ndarray:
+    """
+    Per-component thresholds (trend: NaN = used as is).
+
+    Args:
+        thresholds: Overrides, keyed like config.SCORING_THRESHOLDS or by
+            component name (missing keys fall back to config)
+    """
+    merged = dict(config.SCORING_THRESHOLDS)
+    for key, value in (thresholds or {}).items():
+        merged[THRESHOLD_KEYS.get(key, key)] = value
+    return np.array(
+        [
+            merged[THRESHOLD_KEYS[name]] if name in THRESHOLD_KEYS else np.nan
+            for name in COMPONENTS
+        ],
+        dtype=np.float64,
+    )
+
+
+def weight_vector(weights: Dict = None) -> np.ndarray:
+    """Per-component weights (missing keys fall back to config.SCORING_WEIGHTS)."""
+    merged = {**config.SCORING_WEIGHTS, **(weights or {})}
+    return np.array([merged[name] for name in COMPONENTS], dtype=np.float64)
+
+
+def normalize(raw: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Normalize raw values to 0-100 components (same formula as calculate_user_score)."""
+    scaled = np.minimum(100, (raw / thresholds) * 100)
+    return np.where(np.isnan(thresholds), raw, scaled)
+
+
+class MetricMatrix:
+    """Raw ranking inputs and normalized component scores of a user population."""
+
+    def __init__(self, logins: np.ndarray, raw: np.ndarray, thresholds: Dict = None):
+        """
+        Args:
+            logins: User logins, one per row
+            raw: users x 6 raw values in COMPONENTS order
+            thresholds: Thresholds for `components` (default: config)
+        """
+        self.logins = np.asarray(logins, dtype=str)
+        self.raw = np.asarray(raw, dtype=np.float64)
+        self.thresholds = threshold_vector(thresholds)
+        self.components = normalize(self.raw, self.thresholds)
+
+    def __len__(self):
+        return len(self.logins)
+
+    @classmethod
+    def from_users(cls, users: List[Union[User, Dict]]) -> "MetricMatrix":
+        """
+        Build the matrix from ranked users (records or dicts).
+
+        Uses the feature cache left by ranking. The NumPy engine builds the
+        matrix with from_arrays instead (rank_users_vectorized(with_matrix=True)).
+        """
+        logins = []
+        raw = np.zeros((len(users), len(COMPONENTS)), dtype=np.float64)
+        for i, user in enumerate(users):
+            features = user_features(user)
+            logins.append(user_login(user))
+            raw[i] = (
+                features["followers"],
+                features["contributions"],
+                features["total_stars"],
+                features["total_repos"],
+                features["last_30_days"],
+                calculate_trend_score(user),
+            )
+        return cls(np.array(logins, dtype=str), raw)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        logins: List[str],
+        arrays: Dict[str, np.ndarray],
+        trend: np.ndarray,
+        rows: np.ndarray = None,
+    ) -> "MetricMatrix":
+        """
+        Build the matrix from the arrays of the NumPy ranking engine.
+
+        Args:
+            logins: Logins of the selected rows, in order
+            arrays: rank_vectorized.load_ranking_arrays() output
+            trend: rank_vectorized.trend_scores() output
+            rows: Row indices to keep, in order (default: all)
+        """
+        raw = np.column_stack(
+            (
+                arrays["followers"],
+                arrays["contributions"],
+                arrays["total_stars"],
+                arrays["total_repos"],
+                last_days_sum(arrays, 30),
+                trend,
+            )
+        ).astype(np.float64)
+        if rows is not None:
+            raw = raw[rows]
+        return cls(np.array(logins, dtype=str), raw)
+
+    def scores(self, weights: Dict = None, thresholds: Dict = None) -> np.ndarray:
+        """
+        Ranking scores for all users (0-100, rounded to 2 places).
+
+        Args:
+            weights: Component weights (default: config.SCORING_WEIGHTS)
+            thresholds: Normalization thresholds (default: the matrix's own)
+        """
+        components = self.components
+        if thresholds:
+            components = normalize(self.raw, threshold_vector(thresholds))
+        weights = weight_vector(weights)
+        # components @ weights, summed in calculate_user_score's order
+        total = components[:, 0] * weights[0]
+        for column in range(1, len(COMPONENTS)):
+            total = total + components[:, column] * weights[column]
+        return round2(total)
+
+    def rerank(
+        self, weights: Dict = None, thresholds: Dict = None, top_n: int = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Re-rank all users with new weights and/or thresholds.
+
+        Returns:
+            [(login, score)] sorted by score desc (ties keep matrix order)
+        """
+        scores = self.scores(weights, thresholds)
+        order = np.argsort(-scores, kind="stable")
+        if top_n:
+            order = order[:top_n]
+        return list(zip(self.logins[order].tolist(), scores[order].tolist()))
+
+    def save(self, path: str):
+        """Save the matrix as a NumPy .npz file."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez_compressed(
+            path,
+            logins=self.logins,
+            raw=self.raw,
+            thresholds=self.thresholds,
+            columns=np.array(COMPONENTS),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "MetricMatrix":
+        """Load a matrix saved with save()."""
+        with np.load(path) as data:
+            if tuple(data["columns"].tolist()) != COMPONENTS:
+                raise ValueError(f"Unexpected metric matrix columns in {path}")
+            thresholds = {
+                name: float(value)
+                for name, value in zip(COMPONENTS, data["thresholds"])
+                if name in THRESHOLD_KEYS
+            }
+            return cls(data["logins"], data["raw"], thresholds)
@@ -0,0 +1,197 @@
+"""
+Parallel (multi-process) ranking.
+
+JSON decoding and per-user scoring in rank_users run on a single core. For
+large merged phase1 snapshots, rank_users_parallel splits the input into
+shards of RANKING_SHARD_SIZE users and ranks them in a ProcessPoolExecutor:
+
+1. Each shard decodes its users (NDJSON lines are decoded in the worker),
+   drops repeated logins, applies the contribution and trend filters and
+   scores + sorts its active users.
+2. The main process resolves logins that occur in several shards: as in
+   rank_users, only the first occurrence in input order counts (whether it
+   was active or filtered out).
+3. The sorted shard lists are combined with a k-way merge (heapq.merge) on
+   (score desc, input position), which is exactly the order of the stable
+   sorted() in rank_users.
+
+The result - users, scores, order and filter summary - is identical to the
+serial path.
+
+Usage:
+    from src.processing.rank_parallel import rank_users_parallel
+
+    ranked = rank_users_parallel("data/raw/<run>/phase1_all_users.ndjson", top_n=100)
+"""
+
+import heapq
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Union
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src import config
+from src.processing.rank_users import (
+    calculate_trend_score,
+    calculate_user_score,
+    print_filter_summary,
+    ranked_user_dict,
+    set_ranking_score,
+    user_login,
+)
+from src.processing.user_features import user_features
+from src.processing.user_io import NDJSON_EXTENSIONS, load_users
+
+
+def _rank_shard(shard: List[Union[str, Dict]], start: int, last_shard: bool):
+    """
+    Decode, deduplicate, filter and score one shard (runs in a worker process).
+
+    Args:
+        shard: NDJSON lines or user dictionaries
+        start: Input position of the shard's first user
+        last_shard: Tolerate a truncated last NDJSON line
+
+    Returns:
+        (first_seen, users_with_login, active) where first_seen maps each
+        login to (input position, "contributions" | "inactive" | "active")
+        and active is [(score, position, login, user dict)] sorted by
+        score desc, position asc
+    """
+    first_seen = {}
+    users_with_login = 0
+    active = []
+
+    for offset, item in enumerate(shard):
+        if isinstance(item, str):
+            try:
+                item = json.loads(item)
+            except ValueError:
+                if last_shard and offset == len(shard) - 1:
+                    print("⚠️  Skipping truncated last record")
+                    break
+                raise
+
+        login = user_login(item)
+        if not login:
+            continue
+        users_with_login += 1
+        if login in first_seen:
+            continue
+
+        position = start + offset
+        if user_features(item)["contributions"] < config.MIN_CONTRIBUTIONS_REQUIRED:
+            status = "contributions"
+        elif calculate_trend_score(item) < config.MIN_TREND_SCORE_REQUIRED:
+            status = "inactive"
+        else:
+            status = "active"
+            score = calculate_user_score(item)
+            set_ranking_score(item, score)
+            active.append((score, position, login, ranked_user_dict(item)))
+        first_seen[login] = (position, status)
+
+    active.sort(key=lambda entry: (-entry[0], entry[1]))
+    return first_seen, users_with_login, active
+
+
+def _shards(source: Union[str, List[Dict]], shard_size: int) -> Iterable:
+    """Yield (shard, start position) - NDJSON files are read lazily, line by line."""
+    if isinstance(source, str) and source.endswith(NDJSON_EXTENSIONS):
+        with open(source, "r", encoding="utf-8") as f:
+            lines = (line for line in f if line.strip())
+            start = 0
+            while True:
+                shard = list(itertools.islice(lines, shard_size))
+                if not shard:
+                    return
+                yield shard, start
+                start += len(shard)
+    else:
+        users = load_users(source) if isinstance(source, str) else source
+        for start in range(0, len(users), shard_size):
+            yield users[start : start + shard_size], start
+
+
+def rank_users_parallel(
+    source: Union[str, List[Dict]],
+    top_n: int = None,
+    workers: int = None,
+    shard_size: int = None,
+) -> List[Dict]:
+    """
+    Rank users in parallel shards (same result as rank_users).
+
+    Args:
+        source: Path to a JSON/NDJSON phase file, or a list of user dictionaries
+        top_n: Number of top users to return (None = all)
+        workers: Worker processes (default: config.RANKING_WORKERS)
+        shard_size: Users per shard (default: config.RANKING_SHARD_SIZE)
+
+    Returns:
+        Sorted list of user dictionaries with scores
+    """
+    if workers is None:
+        workers = config.RANKING_WORKERS
+    if shard_size is None:
+        shard_size = config.RANKING_SHARD_SIZE
+
+    print(f"\n{'='*60}")
+    print(f"🎯 Ranking users ({workers} processes, {shard_size} users per shard)...")
+    print(f"{'='*60}\n")
+
+    # Keep at most two shards per worker in flight so a large NDJSON file is
+    # never read into memory as a whole
+    results = []
+    pending = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shards = _shards(source, shard_size)
+        shard = next(shards, None)
+        while shard is not None:
+            following = next(shards, None)
+            pending.append(
+                executor.submit(_rank_shard, shard[0], shard[1], following is None)
+            )
+            if len(pending) >= 2 * workers:
+                results.append(pending.pop(0).result())
+            shard = following
+        results.extend(future.result() for future in pending)
+
+    # Cross-shard dedupe: the first shard (in input order) with a login wins
+    winners = {}
+    users_with_login = 0
+    for first_seen, shard_users, _ in results:
+        users_with_login += shard_users
+        for login, seen in first_seen.items():
+            winners.setdefault(login, seen)
+
+    duplicates = users_with_login - len(winners)
+    if duplicates > 0:
+        print(
+            f"🔍 Removed {duplicates} duplicate users (from paginated search results)"
+        )
+        print(f"📊 Unique users: {len(winners)}\n")
+
+    statuses = [status for _, status in winners.values()]
+    active = statuses.count("active")
+    print_filter_summary(
+        len(winners),
+        statuses.count("contributions"),
+        statuses.count("inactive"),
+        active,
+    )
+    print(f"⚙️ Scored {active} active users in {len(results)} shards")
+
+    # K-way merge of the sorted shard lists (score desc, input position asc)
+    shard_lists = [
+        [entry for entry in shard_active if winners[entry[2]][0] == entry[1]]
+        for _, _, shard_active in results
+    ]
+    merged = heapq.merge(*shard_lists, key=lambda entry: (-entry[0], entry[1]))
+    if top_n:
+        merged = itertools.islice(merged, top_n)
+    return [entry[3] for entry in merged]
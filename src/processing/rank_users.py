@@ -3,25 +3,23 @@ Rank GitHub users based on custom scoring formula.
 Identifies top developers for recruitment/sourcing.
 """
 
+import heapq
 import json
 import os
 import sys
-from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, List, Union
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 from src import config
-
-
-def parse_datetime(dt_string):
-    """Parse GitHub datetime string."""
-    if not dt_string:
-        return None
-    try:
-        return datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
-    except:
-        return None
+from src.processing.contribution_calendar import json_default
+from src.processing.records import FEATURES_KEY, User
+from src.processing.user_features import (
+    parse_datetime,
+    strip_all_features,
+    user_features,
+)
+from src.processing.user_io import NDJSON_EXTENSIONS, iter_users, load_users
 
 
 def normalize_metric(value, max_value):
@@ -50,30 +48,19 @@ def calculate_trend_score(user: Dict) -> float:
     Note: GitHub API does NOT provide star timestamps, so we cannot track
     "star growth". We use contribution velocity as the momentum indicator.
     """
-    # ===== PART 1: CONTRIBUTION MOMENTUM (60 points) =====
-    contrib_collection = user.get("contributionsCollection", {})
-    calendar = contrib_collection.get("contributionCalendar", {})
-    weeks = calendar.get("weeks", [])
+    features = user_features(user)
+    if "trend_score" in features:
+        return features["trend_score"]
 
-    if not weeks:
+    # ===== PART 1: CONTRIBUTION MOMENTUM (60 points) =====
+    if not features["calendar_days"]:
         # No contribution data - inactive user
+        features["trend_score"] = 0.0
         return 0.0
 
-    # Extract daily contributions for different time windows
-    all_days = []
-    for week in weeks:
-        for day in week.get("contributionDays", []):
-            all_days.append(
-                {"date": day.get("date"), "count": day.get("contributionCount", 0)}
-            )
-
-    # Sort by date (newest first)
-    all_days.sort(key=lambda d: d["date"], reverse=True)
-
-    # Calculate contribution counts for different periods
-    last_30_days = sum(d["count"] for d in all_days[:30]) if len(all_days) >= 30 else 0
-    last_90_days = sum(d["count"] for d in all_days[:90]) if len(all_days) >= 90 else 0
-    total_365_days = calendar.get("totalContributions", 0)
+    # Contribution counts for different periods (see user_features.py)
+    last_30_days = features["last_30_days"]
+    last_90_days = features["last_90_days"]
 
     # 1a. Recent Momentum (last 30 days) - 25 points max
     # Threshold: 50+ contributions in 30 days = very active
@@ -85,55 +72,35 @@ def calculate_trend_score(user: Dict) -> float:
 
     # 1c. Consistency - 15 points max
     # Active days / total days (higher = more consistent)
-    active_days = sum(1 for d in all_days if d["count"] > 0)
-    consistency_ratio = active_days / len(all_days) if all_days else 0
+    consistency_ratio = features["active_days"] / features["calendar_days"]
     consistency_score = consistency_ratio * 15
 
     contribution_score = recent_momentum + quarterly_momentum + consistency_score
 
     # ===== PART 2: PROJECT MOMENTUM (40 points) =====
-    repos = user.get("repositories", {}).get("nodes", [])
-    if not repos:
+    if not features["has_repos"]:
         # No repos but has contributions? (contributes to others' projects)
         # Still give them credit for contribution momentum
-        return round(contribution_score, 2)
-
-    now = datetime.now()
+        features["trend_score"] = round(contribution_score, 2)
+        return features["trend_score"]
 
     # 2a. Active High-Value Projects - 25 points max
-    # Projects with stars that are still being actively maintained
-    high_value_active = 0
-    for repo in repos:
-        stars = repo.get("stargazerCount", 0)
-        pushed_at = parse_datetime(repo.get("pushedAt"))
-
-        if pushed_at and stars >= 10:  # Has some impact
-            days_since = (now - pushed_at.replace(tzinfo=None)).days
-            if days_since < 180:  # Updated in last 6 months
-                # Weight by stars: more stars = more points
-                high_value_active += min(stars / 100, 1.0)  # Max 1 point per repo
-
+    # Projects with 10+ stars pushed in the last 6 months, max 1 point per
+    # repo weighted by stars (star_count / 100)
     # Normalize: 3+ high-value active projects = max score
-    high_value_score = min(25, (high_value_active / 3) * 25)
+    high_value_score = min(25, (features["high_value_active"] / 3) * 25)
 
     # 2b. Recent Project Work - 15 points max
     # How many projects pushed to in last 90 days?
-    recent_projects = 0
-    for repo in repos:
-        pushed_at = parse_datetime(repo.get("pushedAt"))
-        if pushed_at:
-            days_since = (now - pushed_at.replace(tzinfo=None)).days
-            if days_since < 90:
-                recent_projects += 1
-
     # Normalize: 3+ recent projects = max score
-    recent_work_score = min(15, (recent_projects / 3) * 15)
+    recent_work_score = min(15, (features["recent_projects"] / 3) * 15)
 
     project_score = high_value_score + recent_work_score
 
     # ===== TOTAL TREND SCORE =====
     total_score = contribution_score + project_score
-    return round(total_score, 2)
+    features["trend_score"] = round(total_score, 2)
+    return features["trend_score"]
 
 
 def calculate_user_score(user: Dict, all_users: List[Dict] = None) -> float:
@@ -144,58 +111,31 @@ def calculate_user_score(user: Dict, all_users: List[Dict] = None) -> float:
     Each metric is normalized to 0-100 before applying weights.
     Total possible: 100 points
     """
-    repos = user.get("repositories", {}).get("nodes", [])
+    features = user_features(user)
 
     # Get weights and thresholds from config
     weights = config.SCORING_WEIGHTS
     thresholds = config.SCORING_THRESHOLDS
 
     # ===== 1. FOLLOWERS =====
-    followers = user.get("followers", {}).get("totalCount", 0)
-    followers_score = min(100, (followers / thresholds["followers"]) * 100)
+    followers_score = min(100, (features["followers"] / thresholds["followers"]) * 100)
 
     # ===== 2. CONTRIBUTIONS LAST YEAR =====
-    contributions = 0
-    contrib_data = user.get("contributionsCollection", {})
-    if contrib_data:
-        calendar = contrib_data.get("contributionCalendar", {})
-        contributions = calendar.get("totalContributions", 0)
-    contributions_score = min(100, (contributions / thresholds["contributions"]) * 100)
+    contributions_score = min(
+        100, (features["contributions"] / thresholds["contributions"]) * 100
+    )
 
     # ===== 3. TOTAL STARS =====
-    total_stars = sum(repo.get("stargazerCount", 0) for repo in repos)
-    stars_score = min(100, (total_stars / thresholds["stars"]) * 100)
+    stars_score = min(100, (features["total_stars"] / thresholds["stars"]) * 100)
 
     # ===== 4. PUBLIC REPOS =====
-    total_repos = user.get("repositories", {}).get("totalCount", 0)
-    repos_score = min(100, (total_repos / thresholds["repos"]) * 100)
+    repos_score = min(100, (features["total_repos"] / thresholds["repos"]) * 100)
 
     # ===== 5. ACTIVITY LAST 30 DAYS =====
-    # Use contribution calendar for precise activity measurement
-    contrib_collection = user.get("contributionsCollection", {})
-    calendar = contrib_collection.get("contributionCalendar", {})
-    weeks = calendar.get("weeks", [])
-
-    last_30_days_contributions = 0
-    if weeks:
-        # Get all days and sort by date (newest first)
-        all_days = []
-        for week in weeks:
-            for day in week.get("contributionDays", []):
-                all_days.append(
-                    {"date": day.get("date"), "count": day.get("contributionCount", 0)}
-                )
-        all_days.sort(key=lambda d: d["date"], reverse=True)
-
-        # Sum last 30 days
-        last_30_days_contributions = (
-            sum(d["count"] for d in all_days[:30]) if len(all_days) >= 30 else 0
-        )
-
-    # Score based on contribution intensity in last 30 days
+    # Score based on contribution intensity in last 30 days (calendar)
     # Threshold: 15+ contributions in 30 days = active (from config)
     activity_threshold = 15  # Can be made configurable
-    activity_score = min(100, (last_30_days_contributions / activity_threshold) * 100)
+    activity_score = min(100, (features["last_30_days"] / activity_threshold) * 100)
 
     # ===== 6. TREND/MOMENTUM =====
     trend_score = calculate_trend_score(user)
@@ -213,28 +153,41 @@ def calculate_user_score(user: Dict, all_users: List[Dict] = None) -> float:
     return round(total_score, 2)
 
 
-def rank_users(users: List[Dict], top_n: int = None) -> List[Dict]:
-    """
-    Rank users by score and return top N.
+def user_login(user: Union[User, Dict]):
+    """Login of a user record or dict."""
+    return user.login if isinstance(user, User) else user.get("login")
 
-    Args:
-        users: List of user dictionaries
-        top_n: Number of top users to return (None = all)
 
-    Returns:
-        Sorted list of users with scores
-    """
-    print(f"\n{'='*60}")
-    print(f"🎯 Ranking {len(users)} users...")
-    print(f"{'='*60}\n")
+def set_ranking_score(user: Union[User, Dict], score: float):
+    """Store the ranking score on a user record or dict."""
+    if isinstance(user, User):
+        user.ranking_score = score
+    else:
+        user["ranking_score"] = score
+
+
+def ranking_score(user: Union[User, Dict]) -> float:
+    """Ranking score of a user record or dict."""
+    return user.ranking_score if isinstance(user, User) else user["ranking_score"]
+
 
-    # Deduplicate users by login (can happen with paginated searches)
+def ranked_user_dict(user: Union[User, Dict]) -> Dict:
+    """Stored (dict) form of a ranked user, keeping the feature cache."""
+    if not isinstance(user, User):
+        return user
+    data = user.to_dict()
+    data[FEATURES_KEY] = user.features
+    return data
+
+
+def deduplicate_users(users: List[Union[User, Dict]]) -> List[Union[User, Dict]]:
+    """Drop repeated logins (can happen with paginated searches), keeping the first."""
     seen_logins = set()
     unique_users = []
     duplicates = 0
 
     for user in users:
-        login = user.get("login")
+        login = user_login(user)
         if login and login not in seen_logins:
             seen_logins.add(login)
             unique_users.append(user)
@@ -247,7 +200,50 @@ def rank_users(users: List[Dict], top_n: int = None) -> List[Dict]:
         )
         print(f"📊 Unique users: {len(unique_users)}\n")
 
-    users = unique_users
+    return unique_users
+
+
+def print_filter_summary(
+    total_users: int, filtered_contributions: int, filtered_inactive: int, active: int
+):
+    """Print how many users the contribution and trend filters removed."""
+    total_filtered = filtered_contributions + filtered_inactive
+    if total_filtered > 0:
+        print(f"🔍 Filtering Summary:")
+        if filtered_contributions > 0:
+            print(
+                f"   • {filtered_contributions} users with < {config.MIN_CONTRIBUTIONS_REQUIRED} contributions/year"
+            )
+        if filtered_inactive > 0:
+            print(
+                f"   • {filtered_inactive} users with no recent activity (trend score < {config.MIN_TREND_SCORE_REQUIRED})"
+            )
+            print(f"     (No commits in last 90 days - likely inactive/unavailable)")
+        print(f"   • Total filtered: {total_filtered}/{total_users}")
+        print(f"📊 Active users remaining: {active}\n")
+
+
+def rank_users(
+    users: List[Union[User, Dict]], top_n: int = None
+) -> List[Union[User, Dict]]:
+    """
+    Rank users by score and return top N.
+
+    Users are scored as they are - dicts or User records, nothing is
+    converted - and get their ranking_score (and feature cache) set in place.
+
+    Args:
+        users: List of user dictionaries (or User records)
+        top_n: Number of top users to return (None = all)
+
+    Returns:
+        Sorted list of users with scores, in the same form as the input
+    """
+    print(f"\n{'='*60}")
+    print(f"🎯 Ranking {len(users)} users...")
+    print(f"{'='*60}\n")
+
+    users = deduplicate_users(users)
 
     # Filter BEFORE calculating scores (optimization: skip inactive users)
     active_users = []
@@ -255,14 +251,8 @@ def rank_users(users: List[Dict], top_n: int = None) -> List[Dict]:
     filtered_inactive = 0
 
     for user in users:
-        contributions = (
-            user.get("contributionsCollection", {})
-            .get("contributionCalendar", {})
-            .get("totalContributions", 0)
-        )
-
         # Filter by contributions first (cheap check)
-        if contributions < config.MIN_CONTRIBUTIONS_REQUIRED:
+        if user_features(user)["contributions"] < config.MIN_CONTRIBUTIONS_REQUIRED:
             filtered_contributions += 1
             continue
 
@@ -276,43 +266,107 @@ def rank_users(users: List[Dict], top_n: int = None) -> List[Dict]:
 
         active_users.append(user)
 
-    # Print filtering summary
-    total_filtered = filtered_contributions + filtered_inactive
-    if total_filtered > 0:
-        print(f"🔍 Filtering Summary:")
-        if filtered_contributions > 0:
-            print(
-                f"   • {filtered_contributions} users with < {config.MIN_CONTRIBUTIONS_REQUIRED} contributions/year"
-            )
-        if filtered_inactive > 0:
-            print(
-                f"   • {filtered_inactive} users with no recent activity (trend score < {config.MIN_TREND_SCORE_REQUIRED})"
-            )
-            print(f"     (No commits in last 90 days - likely inactive/unavailable)")
-        print(f"   • Total filtered: {total_filtered}/{len(users)}")
-        print(f"📊 Active users remaining: {len(active_users)}\n")
+    print_filter_summary(
+        len(users), filtered_contributions, filtered_inactive, len(active_users)
+    )
 
     # Calculate scores ONLY for active users (performance optimization)
     print(f"⚙️ Calculating scores for {len(active_users)} active users...")
     for user in active_users:
-        user["ranking_score"] = calculate_user_score(user, active_users)
+        set_ranking_score(user, calculate_user_score(user, active_users))
 
     # Sort by score (descending)
-    ranked = sorted(active_users, key=lambda u: u["ranking_score"], reverse=True)
+    ranked = sorted(active_users, key=ranking_score, reverse=True)
 
     # Note: Table printing moved to workflow.py for better control
     # (workflow.py can print top_n users as specified by user)
 
     if top_n:
-        return ranked[:top_n]
+        ranked = ranked[:top_n]
+
     return ranked
 
 
+def rank_users_streaming(
+    users: Iterable[Union[User, Dict]], top_n: int = None
+) -> List[Dict]:
+    """
+    Rank users read one at a time, keeping only the best `top_n` in a heap.
+
+    Gives the same result and filter counts as rank_users, but never holds
+    more than `top_n` scored users (plus the set of logins seen, for
+    deduplication) - use with user_io.iter_users on an NDJSON file to rank
+    millions of users.
+
+    Args:
+        users: Iterable of user dictionaries (or User records)
+        top_n: Number of top users to return (None = all, no memory bound)
+
+    Returns:
+        Sorted list of user dictionaries with scores
+    """
+    print(f"\n{'='*60}")
+    print(f"🎯 Ranking users (streaming, top {top_n or 'all'})...")
+    print(f"{'='*60}\n")
+
+    seen_logins = set()
+    total = 0
+    duplicates = 0
+    filtered_contributions = 0
+    filtered_inactive = 0
+    active = 0
+
+    # Min-heap of (score, -index, user): the root is the current worst entry.
+    # Among equal scores the later user is worse, as in a stable sorted().
+    heap = []
+    for index, user in enumerate(users):
+        total += 1
+        login = user_login(user)
+        if not login:
+            continue
+        if login in seen_logins:
+            duplicates += 1
+            continue
+        seen_logins.add(login)
+
+        if user_features(user)["contributions"] < config.MIN_CONTRIBUTIONS_REQUIRED:
+            filtered_contributions += 1
+            continue
+        if calculate_trend_score(user) < config.MIN_TREND_SCORE_REQUIRED:
+            filtered_inactive += 1
+            continue
+        active += 1
+
+        score = calculate_user_score(user)
+        set_ranking_score(user, score)
+        entry = (score, -index, user)
+        if not top_n or len(heap) < top_n:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    print(f"📥 Read {total} users")
+    unique = len(seen_logins)
+    if duplicates > 0:
+        print(
+            f"🔍 Removed {duplicates} duplicate users (from paginated search results)"
+        )
+        print(f"📊 Unique users: {unique}\n")
+    print_filter_summary(unique, filtered_contributions, filtered_inactive, active)
+
+    ranked = sorted(heap, key=lambda e: (-e[0], -e[1]))
+    return [ranked_user_dict(user) for _, _, user in ranked]
+
+
 def save_ranked_users(users: List[Dict], output_path: str):
     """Save ranked users to JSON file."""
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(
-            users, f, indent=config.JSON_INDENT, ensure_ascii=config.JSON_ENSURE_ASCII
+            strip_all_features(users),
+            f,
+            indent=config.JSON_INDENT,
+            ensure_ascii=config.JSON_ENSURE_ASCII,
+            default=json_default,
         )
     print(f"✅ Saved {len(users)} ranked users to: {output_path}")
 
@@ -321,22 +375,34 @@ if __name__ == "__main__":
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python rank_users.py <input_json_file> [top_n]")
+        print("Usage: python rank_users.py <input_json_file> [top_n] [workers]")
         print(
             "Example: python rank_users.py data/raw/20251008_162951/phase1_all_users.json 20"
         )
+        print("NDJSON input (.ndjson/.jsonl) is ranked in streaming mode.")
+        print("workers > 1 ranks in parallel processes (see rank_parallel.py).")
         sys.exit(1)
 
     input_file = sys.argv[1]
     top_n = int(sys.argv[2]) if len(sys.argv) > 2 else None
-
-    # Load users
-    print(f"Loading users from: {input_file}")
-    with open(input_file, "r", encoding="utf-8") as f:
-        users = json.load(f)
-
-    # Rank users
-    ranked = rank_users(users, top_n)
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else config.RANKING_WORKERS
+
+    if workers > 1:
+        from src.processing.rank_parallel import rank_users_parallel
+
+        print(f"Ranking users from: {input_file}")
+        ranked = rank_users_parallel(input_file, top_n, workers=workers)
+    elif input_file.endswith(NDJSON_EXTENSIONS):
+        # Stream: one user at a time, only the top N kept in memory
+        print(f"Streaming users from: {input_file}")
+        ranked = rank_users_streaming(iter_users(input_file), top_n)
+    else:
+        # Load users
+        print(f"Loading users from: {input_file}")
+        users = load_users(input_file)
+
+        # Rank users
+        ranked = rank_users(users, top_n)
 
     # Save ranked users
     import os
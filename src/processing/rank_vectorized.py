@@ -0,0 +1,351 @@
+"""
+Columnar ranking engine (NumPy).
+
+rank_users.py scores one user dict at a time. That is fine for a city, but
+ranking a national population (100k+ users) spends most of its time in
+Python-level `.get()` chains and loops. This module loads the ranking inputs
+once into NumPy arrays:
+
+    followers, contributions, total stars, repo count   - one value per user
+    calendar matrix                                      - users x days (uint16,
+                                                           right-aligned, newest last)
+    repo stars / days since push                         - users x repos
+
+and computes all six weighted components with array operations.
+
+Scores are identical to calculate_user_score / calculate_trend_score, which
+stay the reference implementation: every element goes through the same
+floating-point operations in the same order (repo contributions are
+accumulated column by column, in repo order), and the final rounding uses
+Python's round() so ties round the same way.
+
+Usage:
+    from src.processing.rank_vectorized import rank_users_vectorized
+
+    ranked = rank_users_vectorized(users, top_n=100)
+
+Compare with the reference implementation on a phase file:
+    python -m src.processing.rank_vectorized data/raw/<run>/phase1_all_1000_users.json
+"""
+
+import itertools
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src import config
+from src.processing.contribution_calendar import compact_user_calendar
+from src.processing.rank_users import (
+    deduplicate_users,
+    parse_datetime,
+    print_filter_summary,
+)
+
+# Same constants as calculate_user_score / calculate_trend_score
+ACTIVITY_THRESHOLD = 15
+HIGH_VALUE_MIN_STARS = 10
+HIGH_VALUE_MAX_DAYS = 180
+RECENT_PROJECT_MAX_DAYS = 90
+
+
+def _pushed_at_values(repos: List[Dict]) -> List:
+    """pushedAt values as naive datetimes (like parse_datetime(...).replace(tzinfo=None))."""
+    values = []
+    for repo in repos:
+        pushed = repo.get("pushedAt")
+        if pushed and pushed.endswith("Z") and "+" not in pushed:
+            # GitHub's usual format - let NumPy parse it
+            values.append(pushed[:-1])
+        else:
+            parsed = parse_datetime(pushed)
+            values.append(parsed.replace(tzinfo=None) if parsed else None)
+    return values
+
+
+def load_ranking_arrays(
+    users: List[Dict], now: datetime = None
+) -> Dict[str, np.ndarray]:
+    """
+    Load the ranking inputs of a user list into NumPy arrays.
+
+    Args:
+        users: List of user dictionaries
+        now: Reference time for repo push ages (default: datetime.now())
+
+    Returns:
+        Dict with per-user arrays (followers, contributions, total_stars,
+        total_repos, calendar_length), the calendar matrix and the repo
+        matrices (repo_count, repo_stars, repo_days_since_push, repo_pushed)
+    """
+    if now is None:
+        now = datetime.now()
+
+    n = len(users)
+    followers = np.zeros(n, dtype=np.int64)
+    contributions = np.zeros(n, dtype=np.int64)
+    total_repos = np.zeros(n, dtype=np.int64)
+    repo_count = np.zeros(n, dtype=np.int64)
+    calendar_length = np.zeros(n, dtype=np.int64)
+
+    all_counts = []
+    all_stars = []
+    all_pushed = []
+
+    for i, user in enumerate(users):
+        # Same null handling as user_features.extract_features
+        followers[i] = (user.get("followers") or {}).get("totalCount") or 0
+        repositories = user.get("repositories") or {}
+        total_repos[i] = repositories.get("totalCount") or 0
+
+        # Converts old `weeks` calendars in place
+        calendar = compact_user_calendar(user) or {}
+        contributions[i] = calendar.get("totalContributions") or 0
+        counts = calendar.get("dailyCounts") or ()
+        calendar_length[i] = len(counts)
+        all_counts.append(counts)
+
+        repos = [repo for repo in repositories.get("nodes") or () if repo is not None]
+        repo_count[i] = len(repos)
+        all_stars.extend(repo.get("stargazerCount") or 0 for repo in repos)
+        all_pushed.extend(_pushed_at_values(repos))
+
+    # Calendar matrix, right-aligned so the last column is the newest day
+    width = int(calendar_length.max()) if n else 0
+    calendar = np.zeros((n, width), dtype=np.uint16)
+    flat_counts = np.fromiter(
+        itertools.chain.from_iterable(all_counts),
+        dtype=np.uint16,
+        count=int(calendar_length.sum()),
+    )
+    rows = np.repeat(np.arange(n), calendar_length)
+    starts = np.cumsum(calendar_length) - calendar_length
+    cols = np.arange(len(flat_counts)) - np.repeat(starts, calendar_length)
+    calendar[rows, cols + np.repeat(width - calendar_length, calendar_length)] = (
+        flat_counts
+    )
+
+    # Repo matrices (users x repos, in original repo order)
+    max_repos = int(repo_count.max()) if n else 0
+    rows = np.repeat(np.arange(n), repo_count)
+    starts = np.cumsum(repo_count) - repo_count
+    cols = np.arange(len(all_stars)) - np.repeat(starts, repo_count)
+
+    repo_stars = np.zeros((n, max_repos), dtype=np.int64)
+    repo_stars[rows, cols] = np.array(all_stars, dtype=np.int64)
+
+    now = np.datetime64(now, "us")
+    pushed = np.array(all_pushed, dtype="datetime64[us]")
+    missing = np.isnat(pushed)
+    repo_pushed = np.zeros((n, max_repos), dtype=bool)
+    repo_pushed[rows, cols] = ~missing
+    # timedelta.days semantics: floor of the difference in days
+    days = (now - np.where(missing, now, pushed)) // np.timedelta64(1, "D")
+    repo_days = np.zeros((n, max_repos), dtype=np.int64)
+    repo_days[rows, cols] = days
+
+    total_stars = repo_stars.sum(axis=1)
+
+    return {
+        "followers": followers,
+        "contributions": contributions,
+        "total_stars": total_stars,
+        "total_repos": total_repos,
+        "calendar": calendar,
+        "calendar_length": calendar_length,
+        "repo_count": repo_count,
+        "repo_stars": repo_stars,
+        "repo_days_since_push": repo_days,
+        "repo_pushed": repo_pushed,
+    }
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """
+    Round like Python's round(x, 2).
+
+    np.round differs from round() only when x * 100 lands (almost) exactly
+    on .5, so those few values are rounded with round() itself.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(x, 2) for x in values[near_tie].tolist()]
+    return rounded
+
+
+def last_days_sum(arrays: Dict[str, np.ndarray], days: int) -> np.ndarray:
+    """Contributions in the last `days` days (0 for calendars shorter than that)."""
+    totals = arrays["calendar"][:, -days:].sum(axis=1, dtype=np.int64)
+    return np.where(arrays["calendar_length"] >= days, totals, 0)
+
+
+def trend_scores(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """Vectorized calculate_trend_score for all users (0-100, rounded to 2 places)."""
+    length = arrays["calendar_length"]
+    last_30_days = last_days_sum(arrays, 30)
+    last_90_days = last_days_sum(arrays, 90)
+
+    # ===== PART 1: CONTRIBUTION MOMENTUM (60 points) =====
+    recent_momentum = np.minimum(25, (last_30_days / 50) * 25)
+    quarterly_momentum = np.minimum(20, (last_90_days / 150) * 20)
+    active_days = (arrays["calendar"] > 0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        consistency_ratio = active_days / length
+    consistency_score = consistency_ratio * 15
+
+    contribution_score = recent_momentum + quarterly_momentum + consistency_score
+
+    # ===== PART 2: PROJECT MOMENTUM (40 points) =====
+    stars = arrays["repo_stars"]
+    days = arrays["repo_days_since_push"]
+    pushed = arrays["repo_pushed"]
+
+    high_value = pushed & (stars >= HIGH_VALUE_MIN_STARS) & (days < HIGH_VALUE_MAX_DAYS)
+    repo_points = np.where(high_value, np.minimum(stars / 100, 1.0), 0.0)
+    # Column by column = same summation order as the per-repo loop
+    high_value_active = np.zeros(len(stars))
+    for column in repo_points.T:
+        high_value_active += column
+    high_value_score = np.minimum(25, (high_value_active / 3) * 25)
+
+    recent_projects = (pushed & (days < RECENT_PROJECT_MAX_DAYS)).sum(axis=1)
+    recent_work_score = np.minimum(15, (recent_projects / 3) * 15)
+
+    project_score = high_value_score + recent_work_score
+
+    # ===== TOTAL TREND SCORE =====
+    total_score = contribution_score + project_score
+    total_score = np.where(length > 0, total_score, 0.0)
+    return round2(total_score)
+
+
+def user_scores(arrays: Dict[str, np.ndarray], trend: np.ndarray = None) -> np.ndarray:
+    """Vectorized calculate_user_score for all users (0-100, rounded to 2 places)."""
+    weights = config.SCORING_WEIGHTS
+    thresholds = config.SCORING_THRESHOLDS
+    if trend is None:
+        trend = trend_scores(arrays)
+
+    followers_score = np.minimum(
+        100, (arrays["followers"] / thresholds["followers"]) * 100
+    )
+    contributions_score = np.minimum(
+        100, (arrays["contributions"] / thresholds["contributions"]) * 100
+    )
+    stars_score = np.minimum(100, (arrays["total_stars"] / thresholds["stars"]) * 100)
+    repos_score = np.minimum(100, (arrays["total_repos"] / thresholds["repos"]) * 100)
+    activity_score = np.minimum(
+        100, (last_days_sum(arrays, 30) / ACTIVITY_THRESHOLD) * 100
+    )
+
+    total_score = (
+        followers_score * weights["followers"]
+        + contributions_score * weights["contributions"]
+        + stars_score * weights["stars"]
+        + repos_score * weights["repos"]
+        + activity_score * weights["activity"]
+        + trend * weights["trend"]
+    )
+    return round2(total_score)
+
+
+def score_users(
+    users: List[Dict], now: datetime = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score a list of users.
+
+    Returns:
+        (ranking scores, trend scores), one entry per user
+    """
+    arrays = load_ranking_arrays(users, now)
+    trend = trend_scores(arrays)
+    return user_scores(arrays, trend), trend
+
+
+def rank_users_vectorized(
+    users: List[Dict], top_n: int = None, with_matrix: bool = False
+) -> Union[List[Dict], Tuple[List[Dict], "MetricMatrix"]]:
+    """
+    Rank users by score and return top N (same result as rank_users).
+
+    Args:
+        users: List of user dictionaries
+        top_n: Number of top users to return (None = all)
+        with_matrix: Also return the MetricMatrix of all ranked users, built
+            from the arrays already loaded for scoring
+
+    Returns:
+        Sorted list of users with scores (and the matrix with with_matrix)
+    """
+    print(f"\n{'='*60}")
+    print(f"🎯 Ranking {len(users)} users (vectorized)...")
+    print(f"{'='*60}\n")
+
+    users = deduplicate_users(users)
+    arrays = load_ranking_arrays(users)
+    trend = trend_scores(arrays)
+
+    contribution_ok = arrays["contributions"] >= config.MIN_CONTRIBUTIONS_REQUIRED
+    active = contribution_ok & (trend >= config.MIN_TREND_SCORE_REQUIRED)
+    print_filter_summary(
+        len(users),
+        int((~contribution_ok).sum()),
+        int((contribution_ok & ~active).sum()),
+        int(active.sum()),
+    )
+
+    print(f"⚙️ Calculating scores for {int(active.sum())} active users...")
+    scores = user_scores(arrays, trend)
+
+    # Stable sort on the negated score = sorted(..., reverse=True)
+    active_index = np.flatnonzero(active)
+    order = active_index[np.argsort(-scores[active_index], kind="stable")]
+
+    ranked = []
+    for i in (order[:top_n] if top_n else order).tolist():
+        user = users[i]
+        user["ranking_score"] = float(scores[i])
+        ranked.append(user)
+
+    if with_matrix:
+        from src.processing.metric_matrix import MetricMatrix
+
+        logins = [users[i].get("login") for i in order.tolist()]
+        return ranked, MetricMatrix.from_arrays(logins, arrays, trend, order)
+    return ranked
+
+
+if __name__ == "__main__":
+    import copy
+    import time
+
+    from src.processing.rank_users import rank_users
+    from src.processing.user_io import load_users
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m src.processing.rank_vectorized <input_json_file>")
+        sys.exit(1)
+
+    users = load_users(sys.argv[1])
+
+    start = time.perf_counter()
+    reference = rank_users(copy.deepcopy(users))
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = rank_users_vectorized(copy.deepcopy(users))
+    vectorized_time = time.perf_counter() - start
+
+    same = [(u["login"], u["ranking_score"]) for u in reference] == [
+        (u["login"], u["ranking_score"]) for u in vectorized
+    ]
+    print(f"\nReference:  {reference_time:.3f}s")
+    print(f"Vectorized: {vectorized_time:.3f}s")
+    print(f"Identical ranking: {'✅' if same else '❌'}")
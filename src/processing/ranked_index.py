@@ -0,0 +1,200 @@
+"""
+Persistent ranked index (the national leaderboard).
+
+Every workflow run used to rescore and resort the whole population, even when
+only a few hundred users were new or refreshed. RankedIndex keeps the
+leaderboard between runs and merges each new batch into it:
+
+    entries   sorted list of (-ranking_score, seq, login)  - best first
+    by_login  login -> its entry
+
+seq is the order in which a login first entered the index, so ties keep the
+first-seen order, like the stable sort in rank_users. Lookups use bisect:
+rank_of is O(log n), score_of is a dict lookup and top(n) is a slice.
+
+upsert and delete find their position in O(log n), but inserting into or
+deleting from the Python list shifts the entries behind it, so they are O(n)
+in the worst case. That shift is a single memmove of pointers (well under a
+millisecond per upsert even at 1M users), far below the cost of rescoring;
+a merge of m users costs O(m log n) comparisons plus O(m * n) moves.
+
+A batch ranked by rank_users is merged with merge_ranked: ranked users are
+upserted with their new score, and users of the batch that the filters
+dropped (no longer active) are deleted. Users outside the batch keep the
+score from their last refresh.
+
+Usage:
+    from src.processing.ranked_index import RankedIndex
+
+    index = RankedIndex.load("data/ranked_index.json")
+    index.merge_ranked(phase1_users, rank_users(phase1_users))
+    index.save("data/ranked_index.json")
+    print(index.top(20), index.rank_of("torvalds"))
+
+Merge phase files into an index from the command line:
+    python -m src.processing.ranked_index data/ranked_index.json data/raw/<run>/phase1_all_users.json
+"""
+
+import bisect
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Tuple, Union
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src import config
+from src.processing.rank_users import ranking_score, user_login
+from src.processing.records import User
+
+
+class RankedIndex:
+    """Users sorted by ranking score, with a login map."""
+
+    def __init__(self):
+        self._entries = []  # (-score, seq, login), sorted
+        self._by_login = {}  # login -> entry
+        self._next_seq = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, login: str) -> bool:
+        return login in self._by_login
+
+    def upsert(self, login: str, score: float):
+        """Insert a user or update their score (keeps their tie-break position)."""
+        entry = self._by_login.get(login)
+        if entry is not None:
+            if entry[0] == -score:
+                return
+            seq = entry[1]
+            self._remove(entry)
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        entry = (-score, seq, login)
+        bisect.insort(self._entries, entry)
+        self._by_login[login] = entry
+
+    def delete(self, login: str) -> bool:
+        """Remove a user; returns False if they were not in the index."""
+        entry = self._by_login.pop(login, None)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def _remove(self, entry: Tuple):
+        del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def score_of(self, login: str) -> Optional[float]:
+        """Ranking score of a user (None if not indexed)."""
+        entry = self._by_login.get(login)
+        return -entry[0] if entry is not None else None
+
+    def rank_of(self, login: str) -> Optional[int]:
+        """1-based leaderboard position of a user (None if not indexed)."""
+        entry = self._by_login.get(login)
+        if entry is None:
+            return None
+        return bisect.bisect_left(self._entries, entry) + 1
+
+    def top(self, n: int = None) -> List[Tuple[str, float]]:
+        """Best `n` users (None = all) as [(login, score)]."""
+        entries = self._entries if n is None else self._entries[:n]
+        return [(login, -neg_score) for neg_score, _, login in entries]
+
+    def merge_ranked(
+        self, users: List[Union[User, Dict]], ranked: List[Union[User, Dict]]
+    ) -> Tuple[int, int]:
+        """
+        Merge a freshly ranked batch into the index.
+
+        Args:
+            users: All users of the batch (records or dicts)
+            ranked: rank_users(users) - the active users, with scores
+
+        Returns:
+            (upserted, removed): ranked users written, filtered users deleted
+        """
+        ranked_logins = set()
+        for user in ranked:
+            login = user_login(user)
+            ranked_logins.add(login)
+            self.upsert(login, ranking_score(user))
+
+        removed = 0
+        for user in users:
+            login = user_login(user)
+            if login and login not in ranked_logins and self.delete(login):
+                removed += 1
+        return len(ranked_logins), removed
+
+    def save(self, path: str):
+        """Save the index as JSON (entries in rank order)."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "next_seq": self._next_seq,
+                    "entries": [
+                        [login, -neg_score, seq]
+                        for neg_score, seq, login in self._entries
+                    ],
+                },
+                f,
+                ensure_ascii=config.JSON_ENSURE_ASCII,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "RankedIndex":
+        """Load an index saved with save() (a missing file gives an empty index)."""
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # Saved in rank order, so the list is already sorted
+        index._entries = [(-score, seq, login) for login, score, seq in data["entries"]]
+        index._by_login = {entry[2]: entry for entry in index._entries}
+        index._next_seq = data["next_seq"]
+        return index
+
+
+def merge_into_index(
+    index_path: str, users: List[Union[User, Dict]], ranked: List[Union[User, Dict]]
+) -> RankedIndex:
+    """Load the index at `index_path`, merge a ranked batch and save it."""
+    index = RankedIndex.load(index_path)
+    before = len(index)
+    upserted, removed = index.merge_ranked(users, ranked)
+    index.save(index_path)
+    print(
+        f"🏆 Leaderboard: {len(index)} users ({len(index) - before:+d}), "
+        f"{upserted} upserted, {removed} removed as inactive"
+    )
+    print(f"💾 Saved to: {index_path}")
+    return index
+
+
+if __name__ == "__main__":
+    from src.processing.rank_users import rank_users
+    from src.processing.user_io import load_users
+
+    if len(sys.argv) < 2:
+        print(
+            "Usage: python -m src.processing.ranked_index <index.json> [phase1_file ...]"
+        )
+        sys.exit(1)
+
+    index_path = sys.argv[1]
+    index = RankedIndex.load(index_path)
+    for input_file in sys.argv[2:]:
+        print(f"Loading users from: {input_file}")
+        users = load_users(input_file)
+        index = merge_into_index(index_path, users, rank_users(users))
+
+    print(f"\n🏆 Top 20 of {len(index)} users:")
+    for rank, (login, score) in enumerate(index.top(20), 1):
+        print(f"{rank:<6} {score:<8.1f} {login}")
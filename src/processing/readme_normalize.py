@@ -0,0 +1,100 @@
+"""
+README normalization: strip markup, keep prose.
+
+Raw READMEs are full of badges, HTML, images, tables and code blocks. All of
+it used to flow into ProfileEmbedder.create_profile_text and the README
+slices sent to the LLM. normalize_readme turns a README into plain prose
+so embedding and prompt tokens go to meaningful text.
+
+Phase 3 stores the result as the `readme_clean` text of each repository
+(see fetch_readmes.py, NORMALIZE_READMES / KEEP_RAW_README in config.py).
+"""
+
+import html
+import re
+
+# Block-level constructs removed entirely
+_FENCED_CODE = re.compile(r"^[ \t]*(```|~~~).*?^[ \t]*\1[^\n]*$", re.M | re.S)
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_HTML_BLOCK = re.compile(r"<(pre|script|style)\b[^>]*>.*?</\1\s*>", re.I | re.S)
+
+# Inline constructs
+_LINKED_IMAGE = re.compile(r"\[!\[[^\]]*\]\([^)]*\)\]\([^)]*\)")  # Badges
+_IMAGE = re.compile(r"!\[[^\]]*\](\([^)]*\)|\[[^\]]*\])")
+_LINK = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+_REF_LINK = re.compile(r"\[([^\]]+)\]\[[^\]]*\]")
+_REF_DEFINITION = re.compile(r"^[ \t]*\[[^\]]+\]:[ \t]*\S+.*$", re.M)
+_HTML_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_URL = re.compile(r"https?://\S+")
+_INLINE_CODE = re.compile(r"`+([^`]*)`+")
+_EMPHASIS = re.compile(r"(\*\*|__|\*|~~)(\S(?:.*?\S)?)\1")
+
+# Line-level markers
+_TABLE_SEPARATOR = re.compile(
+    r"^[ \t]*\|?[ \t]*:?-{2,}:?[ \t]*(\|[ \t]*:?-*:?[ \t]*)*\|?[ \t]*$"
+)
+_RULE = re.compile(r"^[ \t]*([-*_=][ \t]*){3,}$")
+_HEADING = re.compile(r"^[ \t]*#{1,6}[ \t]+")
+_LIST_MARKER = re.compile(r"^[ \t]*([-*+]|\d+[.)])[ \t]+")
+_BLOCKQUOTE = re.compile(r"^[ \t]*(>[ \t]?)+")
+
+
+def _clean_line(line: str) -> str:
+    if _TABLE_SEPARATOR.match(line) or _RULE.match(line):
+        return ""
+    line = _BLOCKQUOTE.sub("", line)
+    line = _HEADING.sub("", line)
+    line = _LIST_MARKER.sub("", line)
+    if line.strip().startswith("|"):
+        # Table row - keep the cell text
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        line = " - ".join(cell for cell in cells if cell)
+    return re.sub(r"[ \t]+", " ", line).strip()
+
+
+def normalize_readme(text: str) -> str:
+    """
+    Convert a README (Markdown/HTML/plain text) to plain prose.
+
+    Removes code blocks, HTML, badges, images, bare URLs, table separators and
+    Markdown markers while keeping link texts, headings, list items and table
+    cell text. Paragraphs are separated by a single blank line.
+
+    Args:
+        text: Raw README text
+
+    Returns:
+        Cleaned text ("" if nothing but markup was left)
+    """
+    if not text:
+        return ""
+
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _FENCED_CODE.sub("", text)
+    text = _HTML_COMMENT.sub("", text)
+    text = _HTML_BLOCK.sub("", text)
+
+    text = _LINKED_IMAGE.sub("", text)
+    text = _IMAGE.sub("", text)
+    text = _LINK.sub(r"\1", text)
+    text = _REF_LINK.sub(r"\1", text)
+    text = _REF_DEFINITION.sub("", text)
+    text = _HTML_TAG.sub("", text)
+    text = _URL.sub("", text)
+    text = _INLINE_CODE.sub(r"\1", text)
+    text = _EMPHASIS.sub(r"\2", text)
+    text = html.unescape(text)
+
+    paragraphs = []
+    current = []
+    for line in text.split("\n"):
+        line = _clean_line(line)
+        if line:
+            current.append(line)
+        elif current:
+            paragraphs.append(" ".join(current))
+            current = []
+    if current:
+        paragraphs.append(" ".join(current))
+
+    return "\n\n".join(paragraphs)
@@ -0,0 +1,399 @@
+"""
+Compact typed records for users, repositories and contribution calendars.
+
+Phase files store raw GraphQL dicts nested several levels deep
+(`repositories.nodes`, `contributionsCollection.contributionCalendar`), and
+every metric access used to be a chain of `.get()` calls with `{}` defaults.
+User, Repo and Calendar are `__slots__` classes with flat attributes:
+
+    user.followers          <- user["followers"]["totalCount"]
+    user.total_repos        <- user["repositories"]["totalCount"]
+    user.repos              <- user["repositories"]["nodes"] (list of Repo)
+    user.calendar           <- user["contributionsCollection"]["contributionCalendar"]
+    repo.stars              <- repo["stargazerCount"]
+    repo.language           <- repo["primaryLanguage"]["name"]
+
+Conversion is lossless: to_dict() returns the stored JSON structure with the
+same keys in the same order. Keys a record has no attribute for are kept in
+`extra`, and wrappers with an unexpected shape are kept there unchanged.
+Calendars in the old `weeks` form are compacted on load, as everywhere else
+(see contribution_calendar.py).
+
+Usage:
+    from src.processing.records import User
+
+    user = User.from_dict(data)
+    stars = sum(repo.stars or 0 for repo in user.repos)
+    data = user.to_dict()
+"""
+
+from array import array
+from typing import Dict, List, Optional, Union
+
+from src.processing.contribution_calendar import compact_calendar
+
+# Ranking feature cache on user dicts (see user_features.py) - never stored
+FEATURES_KEY = "_features"
+
+
+def _unwrap(value, inner: str):
+    """{"totalCount": 5} -> (5, True); None -> (None, True); other shapes -> (None, False)."""
+    if value is None:
+        return None, True
+    if type(value) is dict and len(value) == 1 and value.get(inner) is not None:
+        return value[inner], True
+    return None, False
+
+
+class _Record:
+    """
+    Base for records built from a JSON object.
+
+    Subclasses list their fields in FIELDS as (json key, attribute, inner key)
+    - inner key is set for single-key wrappers like {"totalCount": 5} and
+    attribute is None for fields converted by _dump_special. `_keys` is the
+    original key order (shared between records with the same layout).
+    """
+
+    __slots__ = ("_keys", "extra")
+
+    FIELDS = ()
+    _LAYOUTS = {}  # per subclass: key order -> layout / plan
+
+    def _load_layout(self, data: Dict):
+        # Key order + keys without an attribute (kept unchanged in `extra`)
+        layouts = self._LAYOUTS
+        keys = tuple(data)
+        layout = layouts.get(keys)
+        if layout is None:
+            known = {field[0] for field in self.FIELDS}
+            stored = tuple(key for key in keys if key != FEATURES_KEY)
+            unknown = tuple(key for key in stored if key not in known)
+            layout = layouts[keys] = (stored, unknown)
+        self._keys = layout[0]
+        self.extra = {key: data[key] for key in layout[1]} if layout[1] else None
+
+    def _keep(self, key: str, value):
+        """Keep a value with an unexpected shape unchanged."""
+        if self.extra is None:
+            self.extra = {}
+        self.extra[key] = value
+
+    def _plan(self):
+        # (stored fields in order, fields set after loading), cached per layout
+        plans = self._LAYOUTS
+        plan = plans.get(("plan", self._keys))
+        if plan is None:
+            fields = {field[0]: field for field in self.FIELDS}
+            in_order = tuple(fields.get(key, (key, None, None)) for key in self._keys)
+            added = tuple(field for field in self.FIELDS if field[0] not in self._keys)
+            plan = plans[("plan", self._keys)] = (in_order, added)
+        return plan
+
+    def _dump_special(self, key: str):
+        return None
+
+    def to_dict(self) -> Dict:
+        """Return the stored JSON form of the record."""
+        in_order, added = self._plan()
+        extra = self.extra
+        data = {}
+        for key, attr, inner in in_order:
+            if extra is not None and key in extra:
+                data[key] = extra[key]
+                continue
+            value = getattr(self, attr) if attr else self._dump_special(key)
+            if inner is not None and value is not None:
+                value = {inner: value}
+            data[key] = value
+        for key, attr, inner in added:
+            if extra is not None and key in extra:
+                data[key] = extra[key]
+                continue
+            value = getattr(self, attr) if attr else self._dump_special(key)
+            if value is not None:
+                data[key] = {inner: value} if inner is not None else value
+        return data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Repo(_Record):
+    """A repository node."""
+
+    __slots__ = (
+        "name",
+        "description",
+        "url",
+        "stars",
+        "forks",
+        "pushed_at",
+        "language",
+        "readme",
+        "readme_ref",
+        "readme_clean",
+        "readme_clean_ref",
+    )
+
+    _LAYOUTS = {}
+
+    FIELDS = (
+        ("name", "name", None),
+        ("description", "description", None),
+        ("stargazerCount", "stars", None),
+        ("forkCount", "forks", None),
+        ("pushedAt", "pushed_at", None),
+        ("primaryLanguage", "language", "name"),
+        ("url", "url", None),
+        ("readme", "readme", None),
+        ("readme_ref", "readme_ref", None),
+        ("readme_clean", "readme_clean", None),
+        ("readme_clean_ref", "readme_clean_ref", None),
+    )
+
+    def __init__(
+        self,
+        name=None,
+        description=None,
+        url=None,
+        stars=None,
+        forks=None,
+        pushed_at=None,
+        language=None,
+        readme=None,
+        readme_ref=None,
+        readme_clean=None,
+        readme_clean_ref=None,
+    ):
+        self._keys = ()
+        self.extra = None
+        self.name = name
+        self.description = description
+        self.url = url
+        self.stars = stars
+        self.forks = forks
+        self.pushed_at = pushed_at
+        self.language = language
+        self.readme = readme
+        self.readme_ref = readme_ref
+        self.readme_clean = readme_clean
+        self.readme_clean_ref = readme_clean_ref
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional["Repo"]:
+        """Build a repository record from its stored JSON form (None stays None)."""
+        if data is None:
+            return None
+        # Hot path (one call per repository): set the slots directly
+        get = data.get
+        repo = cls.__new__(cls)
+        repo.name = get("name")
+        repo.description = get("description")
+        repo.url = get("url")
+        repo.stars = get("stargazerCount")
+        repo.forks = get("forkCount")
+        repo.pushed_at = get("pushedAt")
+        repo.readme = get("readme")
+        repo.readme_ref = get("readme_ref")
+        repo.readme_clean = get("readme_clean")
+        repo.readme_clean_ref = get("readme_clean_ref")
+        repo._load_layout(data)
+        repo.language, ok = _unwrap(get("primaryLanguage"), "name")
+        if not ok:
+            repo._keep("primaryLanguage", data["primaryLanguage"])
+        return repo
+
+
+class Calendar(_Record):
+    """A contribution calendar in compact form (see contribution_calendar.py)."""
+
+    __slots__ = ("total_contributions", "start_date", "daily_counts")
+
+    _LAYOUTS = {}
+
+    FIELDS = (
+        ("totalContributions", "total_contributions", None),
+        ("startDate", "start_date", None),
+        ("dailyCounts", "daily_counts", None),
+    )
+
+    def __init__(self, total_contributions=None, start_date=None, daily_counts=None):
+        self._keys = ()
+        self.extra = None
+        self.total_contributions = total_contributions
+        self.start_date = start_date
+        self.daily_counts = daily_counts
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional["Calendar"]:
+        """Build a calendar record (old `weeks` calendars are compacted)."""
+        if data is None:
+            return None
+        if "weeks" in data:
+            data = compact_calendar(data)
+        counts = data.get("dailyCounts")
+        if isinstance(counts, list):
+            counts = array("H", counts)
+        calendar = cls(data.get("totalContributions"), data.get("startDate"), counts)
+        calendar._load_layout(data)
+        return calendar
+
+
+class User(_Record):
+    """A GitHub user with repositories and contribution calendar."""
+
+    __slots__ = (
+        "login",
+        "name",
+        "bio",
+        "company",
+        "location",
+        "email",
+        "website_url",
+        "twitter_username",
+        "followers",
+        "following",
+        "total_repos",
+        "repos",
+        "calendar",
+        "ranking_score",
+        "features",
+    )
+
+    _LAYOUTS = {}
+
+    FIELDS = (
+        ("login", "login", None),
+        ("name", "name", None),
+        ("bio", "bio", None),
+        ("company", "company", None),
+        ("location", "location", None),
+        ("email", "email", None),
+        ("websiteUrl", "website_url", None),
+        ("twitterUsername", "twitter_username", None),
+        ("followers", "followers", "totalCount"),
+        ("following", "following", "totalCount"),
+        ("repositories", None, None),
+        ("contributionsCollection", None, None),
+        ("ranking_score", "ranking_score", None),
+    )
+
+    def __init__(
+        self,
+        login=None,
+        name=None,
+        bio=None,
+        company=None,
+        location=None,
+        email=None,
+        website_url=None,
+        twitter_username=None,
+        followers=None,
+        following=None,
+        total_repos=None,
+        repos=None,
+        calendar=None,
+        ranking_score=None,
+    ):
+        self._keys = ()
+        self.extra = None
+        self.login = login
+        self.name = name
+        self.bio = bio
+        self.company = company
+        self.location = location
+        self.email = email
+        self.website_url = website_url
+        self.twitter_username = twitter_username
+        self.followers = followers
+        self.following = following
+        self.total_repos = total_repos
+        self.repos = repos
+        self.calendar = calendar
+        self.ranking_score = ranking_score
+        self.features = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional["User"]:
+        """Build a user record from its stored JSON form (None stays None)."""
+        if data is None:
+            return None
+        get = data.get
+        followers, followers_ok = _unwrap(get("followers"), "totalCount")
+        following, following_ok = _unwrap(get("following"), "totalCount")
+        user = cls(
+            get("login"),
+            get("name"),
+            get("bio"),
+            get("company"),
+            get("location"),
+            get("email"),
+            get("websiteUrl"),
+            get("twitterUsername"),
+            followers,
+            following,
+            ranking_score=get("ranking_score"),
+        )
+        user._load_layout(data)
+        if not followers_ok:
+            user._keep("followers", data["followers"])
+        if not following_ok:
+            user._keep("following", data["following"])
+
+        repositories = get("repositories")
+        if repositories is not None:
+            if (
+                type(repositories) is dict
+                and len(repositories) == 2
+                and list(repositories) == ["totalCount", "nodes"]
+                and type(repositories["nodes"]) is list
+            ):
+                user.total_repos = repositories["totalCount"]
+                user.repos = [Repo.from_dict(node) for node in repositories["nodes"]]
+            else:
+                user._keep("repositories", repositories)
+        elif "repositories" in data:
+            user._keep("repositories", None)
+
+        collection = get("contributionsCollection")
+        if (
+            type(collection) is dict
+            and len(collection) == 1
+            and type(collection.get("contributionCalendar")) is dict
+        ):
+            user.calendar = Calendar.from_dict(collection["contributionCalendar"])
+        elif "contributionsCollection" in data:
+            user._keep("contributionsCollection", collection)
+        return user
+
+    def _dump_special(self, key: str):
+        if key == "repositories":
+            if self.repos is None:
+                return None
+            return {
+                "totalCount": self.total_repos,
+                "nodes": [
+                    repo.to_dict() if repo is not None else None for repo in self.repos
+                ],
+            }
+        if self.calendar is None:
+            return None
+        return {"contributionCalendar": self.calendar.to_dict()}
+
+
+def as_user(user: Union[User, Dict]) -> User:
+    """Return a User record for a user dict (records are returned unchanged)."""
+    if isinstance(user, User):
+        return user
+    return User.from_dict(user)
+
+
+def users_from_dicts(users: List[Union[User, Dict]]) -> List[User]:
+    """Convert a list of user dicts to User records."""
+    return [as_user(user) for user in users]
+
+
+def users_to_dicts(users: List[User]) -> List[Dict]:
+    """Convert a list of User records back to their stored JSON form."""
+    return [user.to_dict() for user in users]
@@ -0,0 +1,136 @@
+"""
+Per-user ranking features, extracted once and cached on the record.
+
+Ranking used to walk the calendar and the repository list several times per
+user: the rank_users filter loop (calculate_trend_score), calculate_user_score
+(plus calculate_trend_score again) and the Phase 2 table in workflow.py.
+user_features computes everything the scorers and the table need in one pass
+and keeps it on the record (User.features, or FEATURES_KEY on user dicts):
+
+    {
+        "followers": 120, "contributions": 950, "total_repos": 34,
+        "total_stars": 410, "calendar_days": 365,
+        "last_30_days": 42, "last_90_days": 130, "active_days": 180,
+        "high_value_active": 1.57, "recent_projects": 2, "has_repos": True,
+    }
+
+calculate_trend_score adds "trend_score" the first time it runs. The cache
+is never written to phase files (see strip_features).
+"""
+
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Union
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.processing.contribution_calendar import compact_user_calendar
+from src.processing.records import FEATURES_KEY, User
+
+
+def parse_datetime(dt_string):
+    """Parse GitHub datetime string."""
+    if not dt_string:
+        return None
+    try:
+        return datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+    except:
+        return None
+
+
+def extract_features(user: Union[User, Dict], now: datetime = None) -> Dict:
+    """
+    Compute the derived ranking features of a user in a single pass.
+
+    Args:
+        user: User record (or user dictionary)
+        now: Reference time for repository push ages (default: datetime.now())
+
+    Returns:
+        Feature dictionary (see module docstring)
+    """
+    if now is None:
+        now = datetime.now()
+
+    # Records and dicts are read directly (no conversion in the hot loop)
+    if isinstance(user, User):
+        calendar = user.calendar
+        followers = user.followers
+        total_repos = user.total_repos
+        contributions = calendar.total_contributions if calendar else None
+        counts = (calendar.daily_counts if calendar else None) or ()
+        repos = [
+            (repo.stars, repo.pushed_at)
+            for repo in user.repos or ()
+            if repo is not None
+        ]
+    else:
+        calendar = compact_user_calendar(user) or {}
+        followers = (user.get("followers") or {}).get("totalCount")
+        repositories = user.get("repositories") or {}
+        total_repos = repositories.get("totalCount")
+        contributions = calendar.get("totalContributions")
+        counts = calendar.get("dailyCounts") or ()
+        repos = [
+            (repo.get("stargazerCount"), repo.get("pushedAt"))
+            for repo in repositories.get("nodes") or ()
+            if repo is not None
+        ]
+
+    # Repos: stars, high-value projects pushed in the last 180 days (max 1
+    # point each, weighted by stars) and projects pushed in the last 90 days
+    total_stars = 0
+    high_value_active = 0
+    recent_projects = 0
+    for stars, pushed_at in repos:
+        stars = stars or 0
+        total_stars += stars
+        pushed_at = parse_datetime(pushed_at)
+        if not pushed_at:
+            continue
+        days_since = (now - pushed_at.replace(tzinfo=None)).days
+        if stars >= 10 and days_since < 180:
+            high_value_active += min(stars / 100, 1.0)
+        if days_since < 90:
+            recent_projects += 1
+
+    return {
+        "followers": followers or 0,
+        "contributions": contributions or 0,
+        "total_repos": total_repos or 0,
+        "total_stars": total_stars,
+        "calendar_days": len(counts),
+        "last_30_days": sum(counts[-30:]) if len(counts) >= 30 else 0,
+        "last_90_days": sum(counts[-90:]) if len(counts) >= 90 else 0,
+        "active_days": sum(1 for count in counts if count > 0),
+        "high_value_active": high_value_active,
+        "recent_projects": recent_projects,
+        "has_repos": bool(repos),
+    }
+
+
+def user_features(user: Union[User, Dict]) -> Dict:
+    """Return the cached features of a user, extracting them on first use."""
+    if isinstance(user, User):
+        if user.features is None:
+            user.features = extract_features(user)
+        return user.features
+
+    features = user.get(FEATURES_KEY)
+    if features is None:
+        features = extract_features(user)
+        user[FEATURES_KEY] = features
+    return features
+
+
+def strip_features(user: Dict) -> Dict:
+    """Return the user without the feature cache (shallow copy if it had one)."""
+    if FEATURES_KEY not in user:
+        return user
+    return {key: value for key, value in user.items() if key != FEATURES_KEY}
+
+
+def strip_all_features(users: List[Dict]) -> List[Dict]:
+    """strip_features for a list of users (for json.dump)."""
+    return [strip_features(user) for user in users]
@@ -0,0 +1,111 @@
+"""
+Reading and writing user record files.
+
+Phase files are JSON arrays of user records. Phase 3 additionally streams
+each finished user to an NDJSON file (one JSON record per line), so an
+interrupted run still leaves a usable partial result. load_users reads both
+formats and is used by the ranking CLI, the vector search CLI and the web app;
+iter_users streams NDJSON one record at a time (streaming ranking).
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Iterator, List
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src import config
+from src.processing.contribution_calendar import json_default
+from src.processing.user_features import strip_features
+
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+
+def load_users(path: str) -> List[Dict]:
+    """
+    Load user records from a JSON array or NDJSON file.
+
+    A truncated last NDJSON line (run killed mid-write) is skipped.
+
+    Args:
+        path: Path to a .json, .ndjson or .jsonl file
+
+    Returns:
+        List of user dictionaries
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if not str(path).endswith(NDJSON_EXTENSIONS):
+            return json.load(f)
+        lines = [line for line in f if line.strip()]
+
+    users = []
+    for i, line in enumerate(lines):
+        try:
+            users.append(json.loads(line))
+        except ValueError:
+            if i == len(lines) - 1:
+                print(f"⚠️  Skipping truncated last record in {path}")
+                break
+            raise
+    return users
+
+
+def iter_users(path: str) -> Iterator[Dict]:
+    """
+    Yield user records one at a time.
+
+    NDJSON files are read line by line (constant memory, a truncated last
+    line is skipped); JSON arrays have to be loaded as a whole first.
+
+    Args:
+        path: Path to a .json, .ndjson or .jsonl file
+    """
+    if not str(path).endswith(NDJSON_EXTENSIONS):
+        yield from load_users(path)
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        pending = None
+        for line in f:
+            if not line.strip():
+                continue
+            if pending is not None:
+                yield json.loads(pending)
+            pending = line
+        if pending is not None:
+            try:
+                yield json.loads(pending)
+            except ValueError:
+                print(f"⚠️  Skipping truncated last record in {path}")
+
+
+class NdjsonWriter:
+    """Append user records to an NDJSON file, flushing after every record."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, user: Dict):
+        self._file.write(
+            json.dumps(
+                strip_features(user),
+                ensure_ascii=config.JSON_ENSURE_ASCII,
+                default=json_default,
+            )
+            + "\n"
+        )
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,10 +1,11 @@
 """Command-line interface for vector search."""
 
-import json
 import sys
 from pathlib import Path
 from typing import Optional
 
+from src.processing.user_io import load_users
+
 from .embeddings import ProfileEmbedder
 from .search import VectorSearch
 
@@ -14,10 +15,10 @@ class VectorSearchCLI:
 
     def __init__(self, data_path: str):
         """
-        Initialize the CLI with data from a Phase 3 JSON file.
+        Initialize the CLI with data from a Phase 3 JSON (or NDJSON) file.
 
         Args:
-            data_path: Path to the Phase 3 JSON file with README data
+            data_path: Path to the Phase 3 JSON/NDJSON file with README data
         """
         self.data_path = Path(data_path)
         self.embedder = None
@@ -34,8 +35,7 @@ class VectorSearchCLI:
         if not self.data_path.exists():
             raise FileNotFoundError(f"Data file not found: {self.data_path}")
 
-        with open(self.data_path, "r", encoding="utf-8") as f:
-            self.users_data = json.load(f)
+        self.users_data = load_users(str(self.data_path))
 
         print(f"Loaded {len(self.users_data)} user profiles")
 
@@ -156,6 +156,10 @@ def main():
             # Fallback to old location
             phase3_files = list(data_dir.glob("phase3_top_*_with_readmes.json"))
 
+        if not phase3_files:
+            # Interrupted Phase 3 run - use the streamed partial result
+            phase3_files = list(data_dir.glob("*/phase3_top_*_with_readmes.ndjson"))
+
         if not phase3_files:
             print("Error: No Phase 3 data file found.")
             print("Please specify the data file with --data option.")
@@ -4,13 +4,15 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from src.config import EMBEDDING_MODEL
+from src.data_collection.readme_store import get_readme, has_readme
+from src.processing.records import User, as_user, users_from_dicts
 
 
 class ProfileEmbedder:
@@ -30,7 +32,7 @@ class ProfileEmbedder:
         self.model = SentenceTransformer(model_name)
         print("Model loaded successfully!")
 
-    def create_profile_text(self, user_data: Dict[str, Any]) -> str:
+    def create_profile_text(self, user_data: Union[User, Dict[str, Any]]) -> str:
         """
         Create a comprehensive text representation of a user's profile.
 
@@ -40,32 +42,32 @@ class ProfileEmbedder:
         - Repository descriptions, names, and languages
 
         Args:
-            user_data: Dictionary containing user profile and README data
+            user_data: User record (or dictionary) with profile and README data
 
         Returns:
             Combined text string for embedding
         """
+        user = as_user(user_data)
         text_parts = []
 
         # Add username
-        if user_data.get("login"):
-            text_parts.append(f"GitHub username: {user_data['login']}")
+        if user.login:
+            text_parts.append(f"GitHub username: {user.login}")
 
         # Add bio
-        if user_data.get("bio"):
-            text_parts.append(f"Bio: {user_data['bio']}")
+        if user.bio:
+            text_parts.append(f"Bio: {user.bio}")
 
         # Add location (can be relevant for HR)
-        if user_data.get("location"):
-            text_parts.append(f"Location: {user_data['location']}")
+        if user.location:
+            text_parts.append(f"Location: {user.location}")
 
         # Add company
-        if user_data.get("company"):
-            text_parts.append(f"Company: {user_data['company']}")
+        if user.company:
+            text_parts.append(f"Company: {user.company}")
 
         # Add repository information with READMEs
-        repositories = user_data.get("repositories", {})
-        nodes = repositories.get("nodes", [])
+        nodes = user.repos or []
 
         if nodes:
             repo_texts = []
@@ -73,22 +75,20 @@ class ProfileEmbedder:
 
             for repo in nodes:
                 repo_info = []
-                if repo.get("name"):
-                    repo_info.append(f"Repository: {repo['name']}")
-                if repo.get("description"):
-                    repo_info.append(f"Description: {repo['description']}")
-                if repo.get("primaryLanguage") and repo.get("primaryLanguage", {}).get(
-                    "name"
-                ):
-                    repo_info.append(f"Language: {repo['primaryLanguage']['name']}")
+                if repo.name:
+                    repo_info.append(f"Repository: {repo.name}")
+                if repo.description:
+                    repo_info.append(f"Description: {repo.description}")
+                if repo.language:
+                    repo_info.append(f"Language: {repo.language}")
                 if repo_info:
                     repo_texts.append(" | ".join(repo_info))
 
                 # Collect README content
-                readme = repo.get("readme", "")
+                readme = get_readme(repo)
                 if readme and readme.strip():
                     readme_texts.append(
-                        f"README for {repo.get('name', 'repository')}: {readme}"
+                        f"README for {repo.name or 'repository'}: {readme}"
                     )
 
             if repo_texts:
@@ -101,28 +101,23 @@ class ProfileEmbedder:
         return " ".join(text_parts)
 
     def embed_profiles(
-        self, users_data: List[Dict[str, Any]]
-    ) -> tuple[np.ndarray, List[Dict[str, Any]]]:
+        self, users_data: List[Union[User, Dict[str, Any]]]
+    ) -> tuple[np.ndarray, List[User]]:
         """
         Generate embeddings for all user profiles that have README content.
 
         Args:
-            users_data: List of user profile dictionaries
+            users_data: List of user profile dictionaries (or User records)
 
         Returns:
-            Tuple of (embeddings matrix, filtered users list)
+            Tuple of (embeddings matrix, filtered list of User records)
             Only includes users with README content
         """
         # Filter users who have README content in their repositories
         users_with_readmes = []
-        for user in users_data:
-            repositories = user.get("repositories", {})
-            nodes = repositories.get("nodes", [])
+        for user in users_from_dicts(users_data):
             # Check if any repository has a readme
-            has_readme = any(
-                repo.get("readme") and repo.get("readme").strip() for repo in nodes
-            )
-            if has_readme:
+            if any(has_readme(repo) for repo in user.repos or []):
                 users_with_readmes.append(user)
 
         print(
@@ -3,13 +3,16 @@
 import os
 import re
 import time
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
 from dotenv import load_dotenv
 from groq import Groq
 from sklearn.metrics.pairwise import cosine_similarity
 
+from src.data_collection.readme_store import get_readme
+from src.processing.records import User, users_from_dicts
+
 # Load environment variables
 load_dotenv()
 
@@ -20,7 +23,7 @@ class VectorSearch:
     def __init__(
         self,
         embeddings: np.ndarray,
-        users_data: List[Dict[str, Any]],
+        users_data: List[Union[User, Dict[str, Any]]],
         use_llm_reasoning: bool = True,
     ):
         """
@@ -28,11 +31,11 @@ class VectorSearch:
 
         Args:
             embeddings: Matrix of user profile embeddings (n_users, embedding_dim)
-            users_data: List of user profile dictionaries corresponding to embeddings
+            users_data: List of user records (or dictionaries) corresponding to embeddings
             use_llm_reasoning: Whether to use Groq LLM for generating reasons (default: True)
         """
         self.embeddings = embeddings
-        self.users_data = users_data
+        self.users_data = users_from_dicts(users_data)
         self.use_llm_reasoning = use_llm_reasoning
 
         # Initialize Groq client if LLM reasoning is enabled
@@ -65,7 +68,7 @@ class VectorSearch:
 
             sys.stdout.flush()
 
-    def _generate_llm_reasons(self, user: Dict[str, Any], query: str) -> List[str]:
+    def _generate_llm_reasons(self, user: User, query: str) -> List[str]:
         """
         Generate reasons using Groq LLM (qwen/qwen3-32b).
 
@@ -76,7 +79,7 @@ class VectorSearch:
         Returns:
             List of 3 HR-focused reasons
         """
-        login = user.get("login", "Unknown")
+        login = user.login or "Unknown"
         print(f"🤖 [LLM] Generating AI reasons for @{login}...")
         import sys
 
@@ -87,36 +90,33 @@ class VectorSearch:
 
         profile_parts.append(f"GitHub Username: @{login}")
 
-        if user.get("bio"):
-            profile_parts.append(f"Bio: {user['bio']}")
+        if user.bio:
+            profile_parts.append(f"Bio: {user.bio}")
 
-        if user.get("location"):
-            profile_parts.append(f"Location: {user['location']}")
+        if user.location:
+            profile_parts.append(f"Location: {user.location}")
 
-        if user.get("company"):
-            profile_parts.append(f"Company: {user['company']}")
+        if user.company:
+            profile_parts.append(f"Company: {user.company}")
 
         # Add repository information with READMEs
-        repositories = user.get("repositories", {})
-        nodes = repositories.get("nodes", [])
+        nodes = user.repos or []
 
         if nodes:
             profile_parts.append(f"\nRepositories ({len(nodes)} total):")
             for i, repo in enumerate(
                 nodes[:5], 1
             ):  # Include all top 5 repos (Llama has higher capacity)
-                repo_info = [f"\n{i}. {repo.get('name', 'Unknown')}"]
-                if repo.get("description"):
-                    repo_info.append(f"   Description: {repo['description']}")
-                if repo.get("primaryLanguage"):
-                    lang = repo.get("primaryLanguage", {}).get("name", "")
-                    if lang:
-                        repo_info.append(f"   Language: {lang}")
-                if repo.get("stargazerCount"):
-                    repo_info.append(f"   Stars: {repo['stargazerCount']}")
-                if repo.get("readme"):
+                repo_info = [f"\n{i}. {repo.name or 'Unknown'}"]
+                if repo.description:
+                    repo_info.append(f"   Description: {repo.description}")
+                if repo.language:
+                    repo_info.append(f"   Language: {repo.language}")
+                if repo.stars:
+                    repo_info.append(f"   Stars: {repo.stars}")
+                readme = get_readme(repo)
+                if readme:
                     # Include full README (Llama has 30K token capacity)
-                    readme = repo["readme"]
                     if len(readme) > 2000:  # Increased from 400
                         readme = readme[:2000] + "..."
                     repo_info.append(f"   README: {readme}")
@@ -193,9 +193,7 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
             )
             return self._extract_relevant_info_keyword(user, query)
 
-    def _extract_relevant_info_keyword(
-        self, user: Dict[str, Any], query: str
-    ) -> List[str]:
+    def _extract_relevant_info_keyword(self, user: User, query: str) -> List[str]:
         """
         Extract top 3 reasons using keyword matching (fallback method).
 
@@ -211,20 +209,19 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
         query_terms = set(query_lower.split())
 
         # Extract relevant repositories
-        repositories = user.get("repositories", {})
-        nodes = repositories.get("nodes", [])
+        nodes = user.repos or []
 
         # Check bio for relevance
-        bio = user.get("bio", "")
+        bio = user.bio or ""
         if bio and any(term in bio.lower() for term in query_terms):
             reasons.append(f'Bio mentions relevant expertise: "{bio}"')
 
         # Find relevant repositories
         relevant_repos = []
         for repo in nodes[:10]:  # Check top 10 repos
-            repo_name = repo.get("name", "")
-            repo_desc = repo.get("description", "")
-            readme = repo.get("readme", "")
+            repo_name = repo.name or ""
+            repo_desc = repo.description or ""
+            readme = get_readme(repo)
 
             # Create searchable text
             searchable_text = f"{repo_name} {repo_desc} {readme}".lower()
@@ -253,11 +250,7 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
                         "description": repo_desc,
                         "snippet": snippet,
                         "relevance": relevance_score,
-                        "language": (
-                            repo.get("primaryLanguage", {}).get("name", "N/A")
-                            if repo.get("primaryLanguage")
-                            else "N/A"
-                        ),
+                        "language": repo.language or "N/A",
                     }
                 )
 
@@ -279,14 +272,14 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
 
         # If we don't have enough reasons, add company or location if relevant
         if len(reasons) < 3:
-            company = user.get("company", "")
+            company = user.company or ""
             if company and any(term in company.lower() for term in query_terms):
                 reasons.append(f"Works at {company} - relevant to field")
 
         # Return top 3 reasons
         return reasons[:3]
 
-    def _extract_relevant_info(self, user: Dict[str, Any], query: str) -> List[str]:
+    def _extract_relevant_info(self, user: User, query: str) -> List[str]:
         """
         Extract top 3 reasons why this profile matches the search query.
         Uses LLM if enabled, otherwise falls back to keyword matching.
@@ -305,7 +298,7 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
 
     def search(
         self, query_embedding: np.ndarray, top_k: int = 10
-    ) -> List[Tuple[Dict[str, Any], float]]:
+    ) -> List[Tuple[User, float]]:
         """
         Search for most similar profiles to the query.
 
@@ -314,7 +307,7 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
             top_k: Number of top results to return
 
         Returns:
-            List of (user_data, similarity_score) tuples, sorted by similarity (highest first)
+            List of (user record, similarity_score) tuples, sorted by similarity (highest first)
         """
         if len(self.embeddings) == 0:
             print("Warning: No embeddings available for search!")
@@ -337,12 +330,12 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
 
         return results
 
-    def print_results(self, results: List[Tuple[Dict[str, Any], float]], query: str):
+    def print_results(self, results: List[Tuple[User, float]], query: str):
         """
         Pretty print search results in HR-friendly format.
 
         Args:
-            results: List of (user_data, similarity_score) tuples
+            results: List of (user record, similarity_score) tuples
             query: Original search query
         """
         print(f"\n{'='*80}")
@@ -354,7 +347,7 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
             return
 
         for rank, (user, score) in enumerate(results, 1):
-            login = user.get("login", "Unknown")
+            login = user.login or "Unknown"
             print(f"{rank}. @{login}")
             print(f"   🔗 Profile: https://github.com/{login}")
             print(f"   📊 Match Score: {score:.1%}")
@@ -371,15 +364,10 @@ Write 3 specific reasons. Each reason should mention a specific repository or te
                 # Fallback if we couldn't extract specific reasons
                 print(f"\n   ✨ Why this candidate is a good fit:")
                 print(f"      1. Profile content matches search criteria")
-                if user.get("bio"):
-                    bio = (
-                        user["bio"][:100] + "..."
-                        if len(user["bio"]) > 100
-                        else user["bio"]
-                    )
+                if user.bio:
+                    bio = user.bio[:100] + "..." if len(user.bio) > 100 else user.bio
                     print(f"      2. Bio: {bio}")
-                repositories = user.get("repositories", {})
-                total_repos = repositories.get("totalCount", 0)
+                total_repos = user.total_repos or 0
                 if total_repos:
                     print(
                         f"      3. Has {total_repos} repositories showing relevant experience"
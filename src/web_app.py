@@ -7,10 +7,10 @@ A beautiful web interface for searching GitHub talent using vector embeddings.
 uv run streamlit run src/web_app.py
 """
 
-import json
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import List, Tuple
 
 import numpy as np
 import streamlit as st
@@ -20,6 +20,10 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from src import config
+from src.processing.metric_matrix import COMPONENTS, MetricMatrix
+from src.processing.records import User
+from src.processing.user_io import load_users
 from src.vector_search.embeddings import ProfileEmbedder
 from src.vector_search.search import VectorSearch
 
@@ -147,7 +151,7 @@ def load_search_engine(data_path: str):
     Also pre-computes results for predefined tabs.
 
     Args:
-        data_path: Path to the Phase 3 JSON file
+        data_path: Path to the Phase 3 JSON (or NDJSON) file
 
     Returns:
         Tuple of (embedder, search_engine, users_data, predefined_results_dict)
@@ -158,8 +162,7 @@ def load_search_engine(data_path: str):
         raise FileNotFoundError(f"Data file not found: {data_path}")
 
     # Load user data
-    with open(data_path, "r", encoding="utf-8") as f:
-        users_data = json.load(f)
+    users_data = load_users(str(data_path))
 
     # Initialize embedder
     embedder = ProfileEmbedder()
@@ -196,15 +199,10 @@ def load_search_engine(data_path: str):
             if not reasons:
                 # Fallback reasons
                 reasons = ["Profile content matches search criteria"]
-                if user.get("bio"):
-                    bio = (
-                        user["bio"][:80] + "..."
-                        if len(user["bio"]) > 80
-                        else user["bio"]
-                    )
+                if user.bio:
+                    bio = user.bio[:80] + "..." if len(user.bio) > 80 else user.bio
                     reasons.append(f"Bio: {bio}")
-                repositories = user.get("repositories", {})
-                total_repos = repositories.get("totalCount", 0)
+                total_repos = user.total_repos or 0
                 if total_repos:
                     reasons.append(
                         f"Has {total_repos} repositories showing relevant experience"
@@ -224,6 +222,20 @@ def load_search_engine(data_path: str):
     return embedder, search_engine, filtered_users, predefined_results
 
 
+@st.cache_resource
+def load_metric_matrix(data_path: str, _users: List[User]) -> MetricMatrix:
+    """
+    Load the Phase 2 metric matrix saved next to the data file (cached).
+
+    Falls back to building it from the loaded profiles when the run has no
+    phase2_metric_matrix.npz (older runs).
+    """
+    matrix_path = Path(data_path).parent / "phase2_metric_matrix.npz"
+    if matrix_path.exists():
+        return MetricMatrix.load(str(matrix_path))
+    return MetricMatrix.from_users(_users)
+
+
 # This function is no longer needed - results are pre-computed in load_search_engine
 # Keeping it commented for reference
 # @st.cache_data
@@ -244,7 +256,7 @@ def format_match_score(score: float) -> str:
 
 def display_candidate_with_reasons(
     rank: int,
-    user: Dict[str, Any],
+    user: User,
     score: float,
     reasons: List[str],
 ):
@@ -253,11 +265,11 @@ def display_candidate_with_reasons(
 
     Args:
         rank: Candidate ranking
-        user: User data dictionary
+        user: User record
         score: Similarity score
         reasons: Pre-computed list of reasons
     """
-    login = user.get("login", "Unknown")
+    login = user.login or "Unknown"
     profile_url = f"https://github.com/{login}"
 
     # Create 2-column layout: Left for name/rank/score, Right for reasons
@@ -292,7 +304,7 @@ def display_candidate_with_reasons(
 
 def display_candidate(
     rank: int,
-    user: Dict[str, Any],
+    user: User,
     score: float,
     query: str,
     search_engine: VectorSearch,
@@ -302,12 +314,12 @@ def display_candidate(
 
     Args:
         rank: Candidate ranking
-        user: User data dictionary
+        user: User record
         score: Similarity score
         query: Search query
         search_engine: VectorSearch instance for extracting reasons
     """
-    login = user.get("login", "Unknown")
+    login = user.login or "Unknown"
     profile_url = f"https://github.com/{login}"
 
     # Get reasons
@@ -316,11 +328,10 @@ def display_candidate(
     if not reasons:
         # Fallback reasons
         reasons = ["Profile content matches search criteria"]
-        if user.get("bio"):
-            bio = user["bio"][:80] + "..." if len(user["bio"]) > 80 else user["bio"]
+        if user.bio:
+            bio = user.bio[:80] + "..." if len(user.bio) > 80 else user.bio
             reasons.append(f"Bio: {bio}")
-        repositories = user.get("repositories", {})
-        total_repos = repositories.get("totalCount", 0)
+        total_repos = user.total_repos or 0
         if total_repos:
             reasons.append(
                 f"Has {total_repos} repositories showing relevant experience"
@@ -446,13 +457,14 @@ def main():
     # Tabs for predefined topics and custom search
     st.markdown("---")
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
         [
             "🔍 Custom Search",
             "💻 Frontend & Web Dev",
             "🔧 Backend & DevOps",
             "📊 Data & Analytics",
             "🤖 AI & ML",
+            "🎚️ Re-rank",
         ]
     )
 
@@ -617,6 +629,54 @@ def main():
         for rank, (user, score, reasons) in enumerate(results, 1):
             display_candidate_with_reasons(rank, user, score, reasons)
 
+    # Tab 6: Re-rank with custom scoring weights
+    with tab6:
+        st.markdown("### 🎚️ Re-rank by Custom Weights")
+        st.markdown(
+            "Adjust how much each metric counts. Weights are normalized to sum "
+            "to 1, and all ranked users are re-scored instantly."
+        )
+
+        matrix = load_metric_matrix(data_path, users_data)
+
+        weights = {}
+        slider_cols = st.columns(3)
+        for i, name in enumerate(COMPONENTS):
+            with slider_cols[i % 3]:
+                weights[name] = st.slider(
+                    name.capitalize(),
+                    min_value=0.0,
+                    max_value=1.0,
+                    value=float(config.SCORING_WEIGHTS[name]),
+                    step=0.05,
+                    key=f"weight_{name}",
+                )
+
+        weights_sum = sum(weights.values())
+        if weights_sum <= 0:
+            st.warning("⚠️ Set at least one weight above zero.")
+        else:
+            weights = {name: value / weights_sum for name, value in weights.items()}
+
+            start = time.perf_counter()
+            ranked = matrix.rerank(weights, top_n=PREDEFINED_TABS_TOP_K)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            st.caption(f"Re-ranked {len(matrix)} users in {elapsed_ms:.1f} ms")
+            st.dataframe(
+                [
+                    {
+                        "Rank": rank,
+                        "Login": login,
+                        "Score": score,
+                        "Profile": f"https://github.com/{login}",
+                    }
+                    for rank, (login, score) in enumerate(ranked, 1)
+                ],
+                hide_index=True,
+                use_container_width=True,
+            )
+
 
 if __name__ == "__main__":
     main()
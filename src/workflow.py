@@ -22,15 +22,27 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 # Import config first
 from src import config
 from src.data_collection.fetch_readmes import fetch_readmes_for_users
+from src.data_collection.github_client import print_request_stats
+from src.data_collection.response_cache import CACHE_MODES, response_cache
 
 # Use optimized fetch implementatsion (Oct 2025)
 from src.data_collection.fetch_users import (
     fetch_users_batch,
-    retry_failed_batches,
+    fetch_users_concurrent,
+    fetch_users_two_pass,
+    recover_failed_batches,
     save_users,
     search_users,
+    search_users_partitioned,
 )
-from src.processing.rank_users import rank_users, save_ranked_users
+from src.processing.metric_matrix import MetricMatrix
+from src.processing.rank_users import (
+    calculate_trend_score,
+    rank_users,
+    save_ranked_users,
+)
+from src.processing.ranked_index import merge_into_index
+from src.processing.user_features import user_features
 
 
 def print_header(title):
@@ -41,7 +53,20 @@ def print_header(title):
 
 
 def run_workflow(
-    max_pages=None, top_n=None, readme_n=None, location=None, fetch_readmes=None
+    max_pages=None,
+    top_n=None,
+    readme_n=None,
+    location=None,
+    fetch_readmes=None,
+    async_fetch=None,
+    concurrency=None,
+    partition_search=None,
+    cache_mode=None,
+    readme_workers=None,
+    previous_readmes=None,
+    readme_minutes=None,
+    readme_max_requests=None,
+    skip_low_value_repos=None,
 ):
     """
     Run the complete three-phase workflow.
@@ -52,6 +77,19 @@ def run_workflow(
         readme_n: Number of top users to fetch READMEs for (default: same as top_n)
         location: GitHub search query for location (default: from config)
         fetch_readmes: Whether to fetch READMEs in phase 3 (default: from config)
+        async_fetch: Whether to fetch user batches concurrently (default: from config)
+        concurrency: Batches in flight when async_fetch is on (default: from config)
+        partition_search: Split the search to get past the 1,000-result cap
+            (ignores max_pages, default: from config)
+        cache_mode: Response cache mode "off", "on" or "replay"
+            (default: from config)
+        readme_workers: Concurrent README requests in phase 3 (default: from config)
+        previous_readmes: Previous phase3 file; READMEs of repos not pushed
+            since then are copied forward instead of re-downloaded
+        readme_minutes: Phase 3 time budget in minutes (default: from config)
+        readme_max_requests: Phase 3 API request budget (default: from config)
+        skip_low_value_repos: Skip READMEs of repos with no stars and no
+            description (default: from config)
 
     Returns:
         Dictionary with paths to all output files
@@ -67,6 +105,17 @@ def run_workflow(
         location = config.DEFAULT_LOCATION
     if fetch_readmes is None:
         fetch_readmes = config.FETCH_READMES
+    if async_fetch is None:
+        async_fetch = config.ASYNC_FETCH
+    if concurrency is None:
+        concurrency = config.FETCH_CONCURRENCY
+    if partition_search is None:
+        partition_search = config.SEARCH_PARTITION
+    if readme_workers is None:
+        readme_workers = config.README_WORKERS
+    if cache_mode is None:
+        cache_mode = config.RESPONSE_CACHE_MODE
+    response_cache.set_mode(cache_mode)
 
     start_time = datetime.now()
 
@@ -80,7 +129,19 @@ def run_workflow(
     if fetch_readmes:
         print(f"  • Top N users (README): {readme_n}")
     print(f"  • Location query: {location}")
+    if partition_search:
+        print(f"  • Partitioned search: Yes (all matching users, max pages ignored)")
     print(f"  • Fetch READMEs: {'Yes' if fetch_readmes else 'No'}")
+    if fetch_readmes and previous_readmes:
+        print(f"  • Incremental READMEs from: {previous_readmes}")
+    if fetch_readmes and (readme_minutes or readme_max_requests):
+        print(
+            f"  • README budget: {readme_minutes or 'no'} min, {readme_max_requests or 'no'} requests"
+        )
+    if async_fetch:
+        print(f"  • Concurrent fetch: {concurrency} batches in flight")
+    if cache_mode != "off":
+        print(f"  • Response cache: {cache_mode} ({config.CACHE_DIR})")
     print(f"  • Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
     results = {}
@@ -92,24 +153,46 @@ def run_workflow(
     phase1_start = datetime.now()
     try:
         # Phase 1a: Search for user logins
-        logins = search_users(location, max_pages=max_pages, users_per_page=100)
+        if partition_search:
+            logins = search_users_partitioned(location, users_per_page=100)
+        else:
+            logins = search_users(location, max_pages=max_pages, users_per_page=100)
 
         if not logins:
             print("❌ No users found. Exiting workflow.")
             return None
 
-        # Phase 1b: Batch fetch full user data
-        users_data, failed_batches = fetch_users_batch(
-            logins, batch_size=config.OPTIMAL_BATCH_SIZE, from_days_ago=365
-        )
-
-        # Phase 1c: Retry failed batches (if any)
-        if failed_batches:
-            print(f"\n🔄 Retrying {len(failed_batches)} failed batches...")
-            recovered_users = retry_failed_batches(
-                failed_batches, reduced_batch_size=10
+        # Phase 1b: Batch fetch user data
+        if not config.FETCH_CONTRIBUTIONS_IN_SEARCH:
+            # Two-pass: cheap profiles first, calendars only for pre-filtered users
+            # (failed batches of both passes are recovered inside)
+            users_data, quarantine = fetch_users_two_pass(
+                logins,
+                from_days_ago=365,
+                async_fetch=async_fetch,
+                concurrency=concurrency,
             )
-            users_data.extend(recovered_users)
+        else:
+            if async_fetch:
+                users_data, failed_batches = fetch_users_concurrent(
+                    logins,
+                    batch_size=config.OPTIMAL_BATCH_SIZE,
+                    from_days_ago=365,
+                    concurrency=concurrency,
+                )
+            else:
+                users_data, failed_batches = fetch_users_batch(
+                    logins, batch_size=config.OPTIMAL_BATCH_SIZE, from_days_ago=365
+                )
+
+            # Phase 1c: Retry failed batches (if any)
+            quarantine = []
+            if failed_batches:
+                print(f"\n🔄 Retrying {len(failed_batches)} failed batches...")
+                recovered_users, quarantine = recover_failed_batches(
+                    failed_batches, from_days_ago=365
+                )
+                users_data.extend(recovered_users)
 
         if not users_data:
             print("❌ No users fetched. Exiting workflow.")
@@ -128,6 +211,14 @@ def run_workflow(
         results["phase1_file"] = output_path
         results["output_folder"] = output_folder
 
+        if quarantine:
+            results["quarantine_file"] = save_users(
+                quarantine, output_folder, config.OUTPUT_QUARANTINE_FILE
+            )
+            print(
+                f"🚫 Quarantined {len(quarantine)} logins (see {config.OUTPUT_QUARANTINE_FILE})"
+            )
+
         print(f"💾 Saved to: {output_path}")
 
         phase1_end = datetime.now()
@@ -151,7 +242,19 @@ def run_workflow(
     phase2_start = datetime.now()
     try:
         # Rank all users first (filtering happens inside rank_users)
-        all_ranked = rank_users(users_data, top_n=None)  # Get all ranked users
+        metric_matrix = None
+        if config.RANKING_ENGINE == "numpy":
+            from src.processing.rank_vectorized import rank_users_vectorized
+
+            all_ranked, metric_matrix = rank_users_vectorized(
+                users_data, top_n=None, with_matrix=True
+            )
+        elif config.RANKING_WORKERS > 1:
+            from src.processing.rank_parallel import rank_users_parallel
+
+            all_ranked = rank_users_parallel(users_data, top_n=None)
+        else:
+            all_ranked = rank_users(users_data, top_n=None)  # Get all ranked users
 
         # Select top N for display and saving
         top_ranked_users = all_ranked[:top_n]
@@ -166,22 +269,12 @@ def run_workflow(
         for i, user in enumerate(top_ranked_users, 1):
             login = user.get("login", "N/A")
             score = user.get("ranking_score", 0)
-            contributions = (
-                user.get("contributionsCollection", {})
-                .get("contributionCalendar", {})
-                .get("totalContributions", 0)
-            )
-            total_stars = sum(
-                r.get("stargazerCount", 0)
-                for r in user.get("repositories", {}).get("nodes", [])
-            )
-            # Calculate trend score
-            from src.processing.rank_users import calculate_trend_score
-
+            # Features cached during ranking (see user_features.py)
+            features = user_features(user)
             trend_score = calculate_trend_score(user)
 
             print(
-                f"{i:<6} {score:<8.1f} {login:<20} {contributions:<9} {total_stars:<8} {trend_score:<8.1f}"
+                f"{i:<6} {score:<8.1f} {login:<20} {features['contributions']:<9} {features['total_stars']:<8} {trend_score:<8.1f}"
             )
 
         print(f"\n{'='*70}\n")
@@ -196,6 +289,19 @@ def run_workflow(
 
         print(f"\n💾 Saved to: {ranked_file}")
 
+        # Metric matrix of ALL ranked users for interactive re-ranking
+        matrix_file = os.path.join(output_folder, "phase2_metric_matrix.npz")
+        if metric_matrix is None:
+            metric_matrix = MetricMatrix.from_users(all_ranked)
+        metric_matrix.save(matrix_file)
+        results["metric_matrix_file"] = matrix_file
+        print(f"💾 Metric matrix ({len(all_ranked)} users): {matrix_file}")
+
+        # Merge this batch into the persistent leaderboard
+        if config.RANKED_INDEX_FILE:
+            merge_into_index(config.RANKED_INDEX_FILE, users_data, all_ranked)
+            results["ranked_index_file"] = config.RANKED_INDEX_FILE
+
         phase2_end = datetime.now()
         phase2_duration = (phase2_end - phase2_start).total_seconds()
         timings["phase2"] = phase2_duration
@@ -218,7 +324,15 @@ def run_workflow(
             readme_users = results.get("ranked_users", [])[:readme_n]
             print(f"Fetching READMEs for top {len(readme_users)} users...\n")
 
-            readme_file = fetch_readmes_for_users(readme_users, output_folder)
+            readme_file = fetch_readmes_for_users(
+                readme_users,
+                output_folder,
+                workers=readme_workers,
+                previous_file=previous_readmes,
+                time_budget=readme_minutes * 60 if readme_minutes else None,
+                request_budget=readme_max_requests,
+                skip_low_value=skip_low_value_repos,
+            )
             results["phase3_file"] = readme_file
 
             phase3_end = datetime.now()
@@ -263,6 +377,8 @@ def run_workflow(
             f"  • Phase 3 (README): {timings.get('phase3', 0):.1f}s ({timings.get('phase3', 0)/60:.1f} min) - {timings.get('phase3', 0)/duration*100:.1f}%"
         )
 
+    print_request_stats()
+
     print(f"\n📄 Output Files:")
     for key, path in results.items():
         if path and isinstance(path, str) and os.path.isfile(path):
@@ -295,6 +411,21 @@ Examples:
   
     # Different location
     python src/workflow.py --location "location:brno" --top-n 20
+
+    # All matching users, beyond the 1,000-result search cap
+    python src/workflow.py --location "location:czechia OR location:prague" --partition-search
+
+    # Concurrent Phase 1 fetch (4 batches in flight)
+    python src/workflow.py --max-pages 10 --async-fetch --concurrency 4
+
+    # Weekly refresh: reuse READMEs of repos not pushed since the last run
+    python src/workflow.py --max-pages 10 --top-n 50 --previous-readmes data/raw/<run>/phase3_top_50_with_readmes.json
+
+    # README enrichment capped at 15 minutes / 2,000 requests (best users first)
+    python src/workflow.py --top-n 800 --readme-minutes 15 --readme-max-requests 2000
+
+    # Rerun with new ranking settings from cached API responses (offline)
+    python src/workflow.py --max-pages 10 --top-n 50 --cache replay
         """,
     )
 
@@ -332,6 +463,66 @@ Examples:
         help="Skip README fetching in Phase 3 (faster)",
     )
 
+    parser.add_argument(
+        "--partition-search",
+        action="store_true",
+        help="Split the search by creation date/followers to get past GitHub's 1,000-result cap",
+    )
+
+    parser.add_argument(
+        "--async-fetch",
+        action="store_true",
+        help="Fetch user batches concurrently with asyncio (faster Phase 1)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Batches in flight with --async-fetch. Default: {config.FETCH_CONCURRENCY}",
+    )
+
+    parser.add_argument(
+        "--readme-workers",
+        type=int,
+        default=None,
+        help=f"Concurrent README requests in Phase 3 (1 = serial). Default: {config.README_WORKERS}",
+    )
+
+    parser.add_argument(
+        "--previous-readmes",
+        type=str,
+        default=None,
+        help="Previous phase3 file: only re-download READMEs of repos pushed since then",
+    )
+
+    parser.add_argument(
+        "--readme-minutes",
+        type=float,
+        default=None,
+        help="Stop Phase 3 after this many minutes, keeping the users done so far",
+    )
+
+    parser.add_argument(
+        "--readme-max-requests",
+        type=int,
+        default=None,
+        help="Stop Phase 3 after this many API requests, keeping the users done so far",
+    )
+
+    parser.add_argument(
+        "--skip-low-value-repos",
+        action="store_true",
+        help="Don't fetch READMEs of repos with no stars and no description",
+    )
+
+    parser.add_argument(
+        "--cache",
+        choices=CACHE_MODES,
+        default=None,
+        help=f"Response cache mode (on = reuse fresh responses, replay = offline only). Default: {config.RESPONSE_CACHE_MODE}",
+    )
+
     args = parser.parse_args()
 
     # Run workflow
@@ -341,6 +532,15 @@ Examples:
         readme_n=args.readme_n,
         location=args.location,
         fetch_readmes=not args.no_readmes,
+        async_fetch=args.async_fetch or None,
+        concurrency=args.concurrency,
+        partition_search=args.partition_search or None,
+        cache_mode=args.cache,
+        readme_workers=args.readme_workers,
+        previous_readmes=args.previous_readmes,
+        readme_minutes=args.readme_minutes,
+        readme_max_requests=args.readme_max_requests,
+        skip_low_value_repos=args.skip_low_value_repos or None,
     )
 
     if results: